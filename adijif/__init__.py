@@ -38,6 +38,7 @@ from adijif.jif_dt import (
     JesdLink,
     JesdParameters,
     JifDtContract,
+    JifDtWriter,
     Producer,
 )
 from adijif.plls.adf4030 import adf4030
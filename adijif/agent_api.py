@@ -1,17 +1,67 @@
 """Transport-neutral operations for MCP and local agent clients."""
 
+import contextlib
 import inspect
 import json
-from typing import Any, Callable, Dict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
 
 import adijif.types
 from adijif.registry import COMPONENT_REGISTRY, get_component_class
+from adijif.sys.pool import SystemPool
 from adijif.system import system as _system
 from adijif.utils import get_jesd_mode_from_params
 
 AgentResult = Dict[str, Any]
 AgentOperation = Callable[..., AgentResult]
 _COMPONENT_KINDS = ("converter", "clock", "fpga", "pll")
+_SYSTEM_POOL: Optional[SystemPool] = None
+
+
+def json_default(value: Any) -> Any:
+    """Convert common numeric and path objects at the JSON boundary."""
+    if hasattr(value, "item"):
+        return value.item()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def configure_system_pool(
+    max_size: int = 8, max_idle: float = 300.0
+) -> Optional[SystemPool]:
+    """Reuse systems across ``solve_system`` calls in long-running servers.
+
+    Args:
+        max_size: Maximum number of idle systems kept. ``0`` disables
+            pooling so every request builds a new system.
+        max_idle: Seconds an idle system is kept before eviction.
+
+    Returns:
+        The active pool, or None when pooling is disabled.
+    """
+    global _SYSTEM_POOL
+    _SYSTEM_POOL = SystemPool(max_size, max_idle) if max_size > 0 else None
+    return _SYSTEM_POOL
+
+
+def system_pool_stats() -> AgentResult:
+    """Report usage and memory metrics of the system pool."""
+    if _SYSTEM_POOL is None:
+        return {"enabled": False}
+    return {"enabled": True, **_SYSTEM_POOL.stats()}
+
+
+@contextlib.contextmanager
+def _checkout_system(
+    conv: str, clk: str, fpga: str, vcxo: Any, solver: str
+) -> Iterator[_system]:
+    """Provide a system for one request, pooled when pooling is enabled."""
+    if _SYSTEM_POOL is None:
+        yield _system(conv=conv, clk=clk, fpga=fpga, vcxo=vcxo, solver=solver)
+    else:
+        with _SYSTEM_POOL.checkout(conv, clk, fpga, vcxo, solver) as sys_obj:
+            yield sys_obj
 
 
 def _parse_vcxo(vcxo_config: Dict[str, Any]) -> Any:
@@ -173,6 +223,92 @@ def get_component_info(component_type: str, component_name: str) -> AgentResult:
     return info
 
 
+def _configure_and_solve(
+    sys_instance: _system, system_config: Dict[str, Any]
+) -> AgentResult:
+    """Apply a JSON system configuration to a new system and solve it."""
+    _apply_config_recursively(
+        sys_instance.converter, system_config.get("converter_properties", {})
+    )
+    _apply_config_recursively(
+        sys_instance.clock, system_config.get("clock_properties", {})
+    )
+    _apply_config_recursively(
+        sys_instance.fpga, system_config.get("fpga_properties", {})
+    )
+
+    for pll_config in system_config.get("pll_configurations", []):
+        if not isinstance(pll_config, dict):
+            raise ValueError("Each PLL configuration must be an object")
+        pll_type = pll_config.get("type")
+        pll_name = pll_config.get("name")
+        pll_properties = pll_config.get("pll_properties", {})
+        if not isinstance(pll_name, str):
+            raise ValueError("PLL configuration requires a string 'name'")
+        if not isinstance(pll_properties, dict):
+            raise ValueError("PLL 'pll_properties' must be an object")
+
+        if pll_type == "inline":
+            target = pll_config.get("target_component", "converter")
+            if target != "converter":
+                raise ValueError(
+                    f"Invalid target_component for inline PLL: {target}"
+                )
+            try:
+                get_component_class("pll", pll_name)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    f"PLL '{pll_name}' not found in clock registry."
+                ) from exc
+            if "vcxo" in pll_config:
+                raise ValueError(
+                    "Per-PLL 'vcxo' is not supported; PLL references are "
+                    "wired from the system clock"
+                )
+            sys_instance.add_pll_inline(
+                pll_name, sys_instance.clock, sys_instance.converter
+            )
+            _apply_config_recursively(sys_instance.plls[-1], pll_properties)
+        elif pll_type == "sysref":
+            try:
+                get_component_class("pll", pll_name)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    f"PLL '{pll_name}' not found in clock registry for sysref."
+                ) from exc
+            if "vcxo" in pll_config:
+                raise ValueError(
+                    "Per-PLL 'vcxo' is not supported; PLL references are "
+                    "wired from the system clock"
+                )
+            sys_instance.add_pll_sysref(
+                pll_name,
+                sys_instance.clock,
+                sys_instance.converter,
+                sys_instance.fpga,
+            )
+            _apply_config_recursively(
+                sys_instance._plls_sysref[-1], pll_properties
+            )
+        else:
+            raise ValueError(f"Unsupported PLL configuration type: {pll_type}")
+
+    solution = sys_instance.solve(
+        out_clock_constraints=system_config.get("constraints", {})
+    )
+    result: AgentResult = {
+        "config": system_config,
+        "solution": solution,
+        "status": "solved",
+    }
+    contract_format = system_config.get("export_format")
+    if contract_format:
+        result["contract"] = sys_instance.export_config(
+            format=contract_format, solution=solution
+        ).to_dict()
+    return result
+
+
 def solve_system(system_config_json: str) -> AgentResult:
     """Solve a system from the MCP-compatible JSON configuration."""
     if not isinstance(system_config_json, str):
@@ -218,96 +354,10 @@ def solve_system(system_config_json: str) -> AgentResult:
             "vcxo", {"type": "fixed", "value": 100_000_000}
         )
         solver = system_config.get("solver", "CPLEX")
-        sys_instance = _system(
-            conv=conv_name,
-            clk=clk_name,
-            fpga=fpga_name,
-            vcxo=_parse_vcxo(vcxo_config),
-            solver=solver,
-        )
-
-        _apply_config_recursively(
-            sys_instance.converter, system_config.get("converter_properties", {})
-        )
-        _apply_config_recursively(
-            sys_instance.clock, system_config.get("clock_properties", {})
-        )
-        _apply_config_recursively(
-            sys_instance.fpga, system_config.get("fpga_properties", {})
-        )
-
-        for pll_config in system_config.get("pll_configurations", []):
-            if not isinstance(pll_config, dict):
-                raise ValueError("Each PLL configuration must be an object")
-            pll_type = pll_config.get("type")
-            pll_name = pll_config.get("name")
-            pll_properties = pll_config.get("pll_properties", {})
-            if not isinstance(pll_name, str):
-                raise ValueError("PLL configuration requires a string 'name'")
-            if not isinstance(pll_properties, dict):
-                raise ValueError("PLL 'pll_properties' must be an object")
-
-            if pll_type == "inline":
-                target = pll_config.get("target_component", "converter")
-                if target != "converter":
-                    raise ValueError(
-                        f"Invalid target_component for inline PLL: {target}"
-                    )
-                try:
-                    get_component_class("pll", pll_name)
-                except (TypeError, ValueError) as exc:
-                    raise ValueError(
-                        f"PLL '{pll_name}' not found in clock registry."
-                    ) from exc
-                if "vcxo" in pll_config:
-                    raise ValueError(
-                        "Per-PLL 'vcxo' is not supported; PLL references are "
-                        "wired from the system clock"
-                    )
-                sys_instance.add_pll_inline(
-                    pll_name, sys_instance.clock, sys_instance.converter
-                )
-                _apply_config_recursively(sys_instance.plls[-1], pll_properties)
-            elif pll_type == "sysref":
-                try:
-                    get_component_class("pll", pll_name)
-                except (TypeError, ValueError) as exc:
-                    raise ValueError(
-                        f"PLL '{pll_name}' not found in clock registry for sysref."
-                    ) from exc
-                if "vcxo" in pll_config:
-                    raise ValueError(
-                        "Per-PLL 'vcxo' is not supported; PLL references are "
-                        "wired from the system clock"
-                    )
-                sys_instance.add_pll_sysref(
-                    pll_name,
-                    sys_instance.clock,
-                    sys_instance.converter,
-                    sys_instance.fpga,
-                )
-                _apply_config_recursively(
-                    sys_instance._plls_sysref[-1], pll_properties
-                )
-            else:
-                raise ValueError(
-                    f"Unsupported PLL configuration type: {pll_type}"
-                )
-
-        solution = sys_instance.solve(
-            out_clock_constraints=system_config.get("constraints", {})
-        )
-        result: AgentResult = {
-            "config": system_config,
-            "solution": solution,
-            "status": "solved",
-        }
-        contract_format = system_config.get("export_format")
-        if contract_format:
-            result["contract"] = sys_instance.export_config(
-                format=contract_format, solution=solution
-            ).to_dict()
-        return result
+        with _checkout_system(
+            conv_name, clk_name, fpga_name, _parse_vcxo(vcxo_config), solver
+        ) as sys_instance:
+            return _configure_and_solve(sys_instance, system_config)
     except (TypeError, ValueError) as exc:
         return {
             "error": f"Configuration error: {exc}",
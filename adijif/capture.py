@@ -0,0 +1,280 @@
+"""Capture wired system models and replay them offline.
+
+A capture is a pair of files sharing one prefix: ``<prefix>.cpo`` holds the
+CP Optimizer model exactly as the system would solve it (constraints and
+objectives applied) and ``<prefix>.json`` holds a manifest of the parts and
+component settings that produced it. Replaying only needs docplex and the
+captured files, so slow solves can be shared and benchmarked without the
+original script.
+"""
+
+import datetime
+import json
+import os
+import statistics
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from adijif.solvers import CpoModel
+
+if TYPE_CHECKING:
+    from adijif.system import system
+
+CAPTURE_FORMAT = "adi.jif-capture"
+CAPTURE_VERSION = 1
+# Longer list settings (e.g. full divider ranges) are summarized
+_MAX_LIST_SETTING = 256
+
+
+def _capture_paths(path: str) -> Dict[str, str]:
+    """Resolve the model and manifest file names of a capture.
+
+    Args:
+        path (str): Capture prefix, or either of its ``.cpo``/``.json`` files
+
+    Returns:
+        Dict[str, str]: ``model`` and ``manifest`` file paths
+    """
+    prefix, ext = os.path.splitext(path)
+    if ext not in (".cpo", ".json"):
+        prefix = path
+    return {"model": prefix + ".cpo", "manifest": prefix + ".json"}
+
+
+def _json_value(value: Any) -> bool:
+    """Check if a setting can be recorded in the manifest as is."""
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _component_settings(component: Any) -> Dict[str, Any]:
+    """Collect the JSON-representable public settings of a component.
+
+    Only instance attributes are recorded, which covers everything set on
+    the component after construction (dividers, modes, rates, options).
+    Lists longer than ``_MAX_LIST_SETTING`` are recorded as their count,
+    minimum and maximum.
+
+    Args:
+        component (Any): Clock, converter, FPGA or PLL model
+
+    Returns:
+        Dict[str, Any]: Setting values keyed by attribute name
+    """
+    settings = {}
+    for name, value in sorted(vars(component).items()):
+        if name.startswith("_") or not _json_value(value):
+            continue
+        if isinstance(value, list) and len(value) > _MAX_LIST_SETTING:
+            try:
+                value = {
+                    "count": len(value),
+                    "min": min(value),
+                    "max": max(value),
+                }
+            except TypeError:
+                value = {"count": len(value)}
+        settings[name] = value
+    return settings
+
+
+def _describe_component(component: Any) -> Dict[str, Any]:
+    """Describe one component for the manifest.
+
+    Args:
+        component (Any): Clock, converter, FPGA or PLL model
+
+    Returns:
+        Dict[str, Any]: Name, class and settings of the component
+    """
+    entry = {
+        "name": component.name,
+        "class": type(component).__name__,
+        "settings": _component_settings(component),
+    }
+    if hasattr(component, "get_current_jesd_mode_settings"):
+        entry["jesd_class"] = component.jesd_class
+        entry["jesd_mode"] = component.get_current_jesd_mode_settings()
+        entry["sample_clock"] = component.sample_clock
+    nested = getattr(component, "_nested", None) or []
+    if nested:
+        entry["nested"] = {
+            name: _describe_component(getattr(component, name))
+            for name in nested
+        }
+    return entry
+
+
+def capture_system(sys_obj: "system", path: str) -> Dict[str, Any]:
+    """Write the wired model of a system and its manifest to disk.
+
+    The system is initialized first when needed, so the captured model
+    includes all constraints and objectives the next solve would use.
+
+    Args:
+        sys_obj (system): CPLEX system to capture
+        path (str): Capture prefix. ``.cpo`` and ``.json`` are appended.
+
+    Returns:
+        Dict[str, Any]: Manifest that was written
+
+    Raises:
+        Exception: System does not use the CPLEX solver
+    """
+    if sys_obj.solver != "CPLEX":
+        raise Exception("Model capture requires the CPLEX solver")
+    if not sys_obj._initialized:
+        sys_obj.initialize()
+
+    from adijif import __version__
+
+    paths = _capture_paths(path)
+    directory = os.path.dirname(os.path.abspath(paths["model"]))
+    os.makedirs(directory, exist_ok=True)
+    sys_obj.model.export_model(out=paths["model"], add_source_location=False)
+
+    converters = (
+        sys_obj.converter
+        if isinstance(sys_obj.converter, list)
+        else [sys_obj.converter]
+    )
+    stats = sys_obj.model.get_statistics()
+    manifest = {
+        "format": CAPTURE_FORMAT,
+        "version": CAPTURE_VERSION,
+        "pyadi_jif_version": __version__,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "model_file": os.path.basename(paths["model"]),
+        "vcxo": sys_obj.vcxo
+        if _json_value(sys_obj.vcxo)
+        else repr(sys_obj.vcxo),
+        "settings": _component_settings(sys_obj),
+        "clock": _describe_component(sys_obj.clock),
+        "fpga": _describe_component(sys_obj.fpga),
+        "converters": [_describe_component(conv) for conv in converters],
+        "plls": [_describe_component(pll) for pll in sys_obj._plls],
+        "plls_sysref": [
+            _describe_component(pll) for pll in sys_obj._plls_sysref
+        ],
+        "objectives": [
+            {
+                "name": obj.name,
+                "component": obj.component,
+                "sense": obj.sense,
+                "tier": obj.tier,
+                "weight": obj.weight,
+            }
+            for obj in sys_obj.list_objectives()
+        ],
+        "model": {
+            "variables": stats.get_number_of_variables(),
+            "constraints": stats.get_number_of_constraints(),
+            "expressions": stats.get_number_of_expressions(),
+        },
+    }
+    with open(paths["manifest"], "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+    return manifest
+
+
+def load_capture(path: str) -> Dict[str, Any]:
+    """Load a captured model and its manifest.
+
+    Args:
+        path (str): Capture prefix, or either of its ``.cpo``/``.json`` files
+
+    Returns:
+        Dict[str, Any]: ``model`` (CpoModel), ``model_file`` (str) and
+        ``manifest`` (dict). The manifest is empty when only the model file
+        exists.
+
+    Raises:
+        Exception: Capture is missing or has an unsupported format
+    """
+    paths = _capture_paths(path)
+    manifest: Dict[str, Any] = {}
+    if os.path.isfile(paths["manifest"]):
+        with open(paths["manifest"], encoding="utf-8") as fh:
+            manifest = json.load(fh)
+        if manifest.get("format") != CAPTURE_FORMAT:
+            raise Exception(f"{paths['manifest']} is not a model capture")
+        if manifest.get("version", 0) > CAPTURE_VERSION:
+            raise Exception(
+                f"Capture version {manifest['version']} is newer than "
+                f"supported version {CAPTURE_VERSION}"
+            )
+        paths["model"] = os.path.join(
+            os.path.dirname(paths["manifest"]), manifest["model_file"]
+        )
+    if not os.path.isfile(paths["model"]):
+        raise Exception(f"Captured model {paths['model']} not found")
+
+    model = CpoModel()
+    model.import_model(paths["model"])
+    return {"model": model, "model_file": paths["model"], "manifest": manifest}
+
+
+def replay_capture(
+    path: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    repeat: int = 1,
+) -> Dict[str, Any]:
+    """Re-solve a captured model and report timing.
+
+    Args:
+        path (str): Capture prefix, or either of its ``.cpo``/``.json`` files
+        parameters (Dict[str, Any]): CP Optimizer parameters for the solve,
+            e.g. ``{"Workers": 1, "SearchType": "DepthFirst"}``
+        repeat (int): Number of solves to time
+
+    Returns:
+        Dict[str, Any]: Per-run status, objective values, solver and wall
+        times, plus wall-time summary statistics
+
+    Raises:
+        Exception: repeat is less than one
+    """
+    if repeat < 1:
+        raise Exception("repeat must be at least 1")
+    parameters = dict(parameters or {})
+    capture = load_capture(path)
+    model = capture["model"]
+    solve_args = {"LogVerbosity": "Quiet", "WarningLevel": 0}
+    solve_args.update(parameters)
+
+    runs: List[Dict[str, Any]] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = model.solve(**solve_args)
+        wall = time.perf_counter() - start
+        infos = result.get_solver_infos()
+        runs.append(
+            {
+                "status": result.get_solve_status(),
+                "objective_values": list(result.get_objective_values() or []),
+                "solve_time": result.get_solve_time(),
+                "wall_time": wall,
+                "branches": infos.get("NumberOfBranches"),
+            }
+        )
+
+    walls = [run["wall_time"] for run in runs]
+    manifest = capture["manifest"]
+    return {
+        "capture": capture["model_file"],
+        "parts": {
+            "clock": manifest.get("clock", {}).get("name"),
+            "fpga": manifest.get("fpga", {}).get("name"),
+            "converters": [c["name"] for c in manifest.get("converters", [])],
+        },
+        "parameters": parameters,
+        "runs": runs,
+        "wall_time": {
+            "min": min(walls),
+            "mean": statistics.mean(walls),
+            "max": max(walls),
+        },
+    }
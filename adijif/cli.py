@@ -5,20 +5,11 @@ import io
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import click
 
-from adijif.agent_api import call_operation, describe_operations
-
-
-def _json_default(value: Any) -> Any:
-    """Convert common numeric and path objects at the JSON boundary."""
-    if hasattr(value, "item"):
-        return value.item()
-    if isinstance(value, Path):
-        return str(value)
-    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+from adijif.agent_api import call_operation, describe_operations, json_default
 
 
 def _emit(result: Dict[str, Any], pretty: bool) -> None:
@@ -28,7 +19,7 @@ def _emit(result: Dict[str, Any], pretty: bool) -> None:
             result,
             indent=2 if pretty else None,
             sort_keys=True,
-            default=_json_default,
+            default=json_default,
         )
     )
     if "error" in result:
@@ -174,5 +165,124 @@ def solve_command(ctx: click.Context, config_file: str) -> None:
     _emit(result, ctx.obj["pretty"])
 
 
+def _parse_param(text: str) -> Tuple[str, Any]:
+    """Split a NAME=VALUE solver parameter, decoding JSON values."""
+    name, sep, value = text.partition("=")
+    if not sep or not name:
+        raise ValueError(f"Solver parameter must be NAME=VALUE, got {text!r}")
+    try:
+        return name, json.loads(value)
+    except json.JSONDecodeError:
+        return name, value
+
+
+@main.command("replay")
+@click.argument("capture", type=click.Path(dir_okay=False))
+@click.option(
+    "--param",
+    "params",
+    multiple=True,
+    help="CP Optimizer parameter as NAME=VALUE, e.g. Workers=1. Repeatable.",
+)
+@click.option(
+    "--repeat",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of timed solves.",
+)
+@click.pass_context
+def replay_command(
+    ctx: click.Context, capture: str, params: Tuple[str, ...], repeat: int
+) -> None:
+    """Re-solve a captured model (prefix, .cpo or .json) and report timing."""
+    from adijif.capture import replay_capture
+
+    try:
+        parameters = dict(_parse_param(p) for p in params)
+    except ValueError as exc:
+        _emit({"error": str(exc)}, ctx.obj["pretty"])
+        return
+    diagnostics = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(diagnostics):
+            result = replay_capture(capture, parameters, repeat)
+    except Exception as exc:
+        result = {"error": f"Replay failed: {exc}"}
+    output = diagnostics.getvalue()
+    if output:
+        click.echo(output, err=True, nl=False)
+    _emit(result, ctx.obj["pretty"])
+
+
+@main.command("sweep")
+@click.argument("grid_file", type=click.Path(dir_okay=False))
+@click.option(
+    "--shard",
+    default="1/1",
+    show_default=True,
+    help="Run shard i of n (i/n, from 1) of the grid points.",
+)
+@click.option(
+    "--jobs",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Local worker processes.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False),
+    help="JSON-lines results file. Defaults to sweep-<i>-of-<n>.jsonl.",
+)
+@click.pass_context
+def sweep_command(
+    ctx: click.Context,
+    grid_file: str,
+    shard: str,
+    jobs: int,
+    output: Optional[str],
+) -> None:
+    """Solve one shard of the sweep described by GRID_FILE (JSON or YAML)."""
+    from adijif.sweep import load_grid, parse_shard, run_shard
+
+    try:
+        selected = parse_shard(shard)
+        grid = load_grid(grid_file)
+    except (OSError, UnicodeError, ValueError) as exc:
+        _emit({"error": f"Unable to read sweep: {exc}"}, ctx.obj["pretty"])
+        return
+    if output is None:
+        output = f"sweep-{selected[0]}-of-{selected[1]}.jsonl"
+    try:
+        result = run_shard(grid, output, selected, jobs)
+    except Exception as exc:
+        result = {"error": f"Sweep failed: {exc}"}
+    _emit(result, ctx.obj["pretty"])
+
+
+@main.command("sweep-merge")
+@click.argument(
+    "shards", nargs=-1, required=True, type=click.Path(dir_okay=False)
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False),
+    help="Merged JSON-lines file. Shards are only verified when omitted.",
+)
+@click.pass_context
+def sweep_merge_command(
+    ctx: click.Context, shards: Tuple[str, ...], output: Optional[str]
+) -> None:
+    """Verify sweep SHARDS and merge them in grid order."""
+    from adijif.sweep import merge_shards
+
+    try:
+        result = merge_shards(list(shards), output)
+    except (OSError, UnicodeError, ValueError, KeyError) as exc:
+        result = {"error": f"Merge failed: {exc}"}
+    _emit(result, ctx.obj["pretty"])
+
+
 if __name__ == "__main__":
     main()
@@ -1,8 +1,11 @@
 """AD9523-1 clock chip model."""
 
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
 
 from adijif.clocks.ad9523_1_bf import ad9523_1_bf
+from adijif.clocks.reachability import integer_pll_outputs, merge_sources
 from adijif.solvers import CpoExpr, CpoIntVar, CpoSolveResult, GK_Intermediate
 
 
@@ -151,6 +154,76 @@ class ad9523_1(ad9523_1_bf):
         self._check_in_range(value, self.r2_available, "r2")
         self._r2 = self._own_selection(value)
 
+    def _reachability_spec(self) -> Dict:
+        """Divider sets and limits that determine reachable output rates.
+
+        Returns:
+            Dict: Current divider selections and PLL limits
+        """
+        return {
+            "d": self._d,
+            "r2": self._r2,
+            "n2": self._n2,
+            "m1": self._m1,
+            "use_vcxo_double": self.use_vcxo_double,
+            "vco_min": self.vco_min,
+            "vco_max": self.vco_max,
+            "pfd_max": self.pfd_max,
+        }
+
+    def _reference_paths(self) -> List[Dict]:
+        """Divider paths from the VCXO to the output dividers.
+
+        Returns:
+            List[Dict]: One path per M1 divider after the VCO
+        """
+        m1s = self._m1 if isinstance(self._m1, list) else [self._m1]
+        return [
+            {
+                "mult": 2 if self.use_vcxo_double else 1,
+                "post": m1,
+                "r": self._r2,
+                "n": self._n2,
+                "f_min": self.vco_min,
+                "f_max": self.vco_max,
+                "pfd_max": self.pfd_max,
+            }
+            for m1 in sorted(m1s)
+        ]
+
+    def _output_sources(
+        self, vcxo: int
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Enumerate integer M1 divider outputs for a fixed VCXO.
+
+        Args:
+            vcxo (int): VCXO frequency in hertz
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: Sorted frequencies into
+            the output dividers and the r2, n2 and m1 values producing each
+        """
+        if self.use_vcxo_double:
+            vcxo *= 2
+        vco, r2, n2 = integer_pll_outputs(
+            vcxo, self._r2, self._n2, self.vco_min, self.vco_max, self.pfd_max
+        )
+        m1s = self._m1 if isinstance(self._m1, list) else [self._m1]
+        parts = []
+        for m1 in sorted(m1s):
+            keep = vco % m1 == 0
+            parts.append(
+                (
+                    vco[keep] // m1,
+                    {
+                        "r2": r2[keep],
+                        "n2": n2[keep],
+                        "m1": np.full(int(keep.sum()), m1, dtype=np.int64),
+                    },
+                )
+            )
+        return merge_sources(parts)
+
     def get_config(self, solution: CpoSolveResult = None) -> Dict:
         """Extract configurations from solver results.
 
@@ -1,8 +1,11 @@
 """AD9528 clock chip model."""
 
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
 
 from adijif.clocks.ad9528_bf import ad9528_bf
+from adijif.clocks.reachability import integer_pll_outputs, merge_sources
 from adijif.solvers import CpoExpr, CpoSolveResult, GK_Intermediate
 
 
@@ -263,6 +266,98 @@ class ad9528(ad9528_bf):
         """
         self._sysref = int(value)
 
+    def _reachability_spec(self) -> Dict:
+        """Divider sets and limits that determine reachable output rates.
+
+        Returns:
+            Dict: Current divider selections and PLL limits
+        """
+        return {
+            "d": self._d,
+            "r1": self._r1,
+            "n2": self._n2,
+            "m1": self._m1,
+            "a": self._a,
+            "b": self._b,
+            "use_vcxo_double": self.use_vcxo_double,
+            "vco_min": self.vco_min,
+            "vco_max": self.vco_max,
+            "pfd_max": self.pfd_max,
+        }
+
+    def _reference_paths(self) -> List[Dict]:
+        """Divider paths from the VCXO to the output dividers.
+
+        Feedback dividers that the VCO calibration dividers cannot express
+        are dropped, as in :meth:`_output_sources`.
+
+        Returns:
+            List[Dict]: One path per M1 divider, limited to VCO / M1
+        """
+        a = np.atleast_1d(self._a)
+        b = np.atleast_1d(self._b)
+        feedback = np.unique(4 * b[:, None] + a[None, :])
+        feedback = feedback[feedback >= 16]
+        n2s = np.atleast_1d(self._n2)
+        m1s = self._m1 if isinstance(self._m1, list) else [self._m1]
+        paths = []
+        for m1 in sorted(m1s):
+            n2_ok = n2s[np.isin(m1 * n2s, feedback)]
+            if not n2_ok.size:
+                continue
+            paths.append(
+                {
+                    "mult": 2 if self.use_vcxo_double else 1,
+                    "post": 1,
+                    "r": self._r1,
+                    "n": n2_ok,
+                    "f_min": self.vco_min / m1,
+                    "f_max": self.vco_max / m1,
+                    "pfd_max": self.pfd_max,
+                }
+            )
+        return paths
+
+    def _output_sources(
+        self, vcxo: int
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Enumerate integer VCO/M1 frequencies for a fixed VCXO.
+
+        The VCO calibration dividers require ``m1 * n2 == 4 * b + a >= 16``,
+        so feedback dividers that cannot be expressed that way are dropped.
+
+        Args:
+            vcxo (int): VCXO frequency in hertz
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: Sorted frequencies into
+            the output dividers and the r1, n2 and m1 values producing each
+        """
+        if self.use_vcxo_double:
+            vcxo *= 2
+        a = np.atleast_1d(self._a)
+        b = np.atleast_1d(self._b)
+        feedback = np.unique(4 * b[:, None] + a[None, :])
+        feedback = feedback[feedback >= 16]
+        n2s = np.atleast_1d(self._n2)
+        m1s = self._m1 if isinstance(self._m1, list) else [self._m1]
+        parts = []
+        for m1 in sorted(m1s):
+            n2_ok = n2s[np.isin(m1 * n2s, feedback)]
+            if not n2_ok.size:
+                continue
+            out, r1, n2 = integer_pll_outputs(
+                vcxo,
+                self._r1,
+                n2_ok,
+                self.vco_min / m1,
+                self.vco_max / m1,
+                self.pfd_max,
+            )
+            m1_arr = np.full(out.size, m1, dtype=np.int64)
+            parts.append((out, {"r1": r1, "n2": n2, "m1": m1_arr}))
+        return merge_sources(parts)
+
     def get_config(self, solution: CpoSolveResult = None) -> Dict:
         """Extract configurations from solver results.
 
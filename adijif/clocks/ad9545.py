@@ -6,6 +6,7 @@ import docplex.cp.catalog as ctg
 import docplex.cp.expression as exp
 import docplex.cp.modeler as mod
 
+from adijif import gekko_rundir
 from adijif.clocks.clock import clock
 from adijif.draw import Layout, Node
 from adijif.solvers import CpoSolveResult
@@ -686,6 +687,6 @@ class ad9545(clock):
             "minlp_integer_tol 0.0001",
         ]
 
-        self.model.solve(disp=False)
+        gekko_rundir.solve(self.model, disp=False)
 
         return False
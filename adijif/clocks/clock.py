@@ -2,10 +2,12 @@
 
 import copy
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
+import numpy as np
 from docplex.cp.solution import CpoSolveResult  # type: ignore
 
+from adijif import gekko_rundir
 from adijif.common import core
 from adijif.draw import Layout, Node
 from adijif.gekko_trans import gekko_translation
@@ -113,6 +115,49 @@ class clock(core, gekko_translation, metaclass=ABCMeta):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def _reachability_spec(self) -> Dict:
+        """Divider sets and limits that determine reachable output rates.
+
+        Must contain the output divider selection under ``"d"``. Used to
+        key :class:`adijif.clocks.reachability.ReachableIndex` caches.
+
+        Raises:
+            NotImplementedError: Chip does not support reachability indexes
+        """
+        raise NotImplementedError(
+            f"Reachability index not supported for {self.name}"
+        )
+
+    def _output_sources(
+        self, vcxo: int
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Enumerate integer frequencies that feed the output dividers.
+
+        Args:
+            vcxo (int): Reference frequency in hertz
+
+        Raises:
+            NotImplementedError: Chip does not support reachability indexes
+        """
+        raise NotImplementedError(
+            f"Reachability index not supported for {self.name}"
+        )
+
+    def _reference_paths(self) -> List[Dict]:
+        """Divider paths from the reference to the output dividers.
+
+        Each path describes ``pll = ref * mult * n / r`` with the PLL output
+        inside ``[f_min, f_max]``, the phase detector ``pll / n`` at most
+        ``pfd_max`` (None when unlimited) and ``pll / post`` feeding the
+        output dividers. Used to enumerate rational reference candidates.
+
+        Raises:
+            NotImplementedError: Chip does not support reference enumeration
+        """
+        raise NotImplementedError(
+            f"Reference enumeration not supported for {self.name}"
+        )
+
     def _solve_gekko(self) -> bool:
         """Local solve method for clock model.
 
@@ -133,8 +178,7 @@ class clock(core, gekko_translation, metaclass=ABCMeta):
             "minlp_gap_tol 0.1",
         ]
 
-        self.model.solve(disp=False)
-        self.model.cleanup()
+        gekko_rundir.solve(self.model, disp=False)
         return False
 
     # def _add_objective(self, sysrefs: List) -> None:
@@ -1,8 +1,11 @@
 """HMC7044 clock chip model."""
 
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
 
 from adijif.clocks.hmc7044_bf import hmc7044_bf
+from adijif.clocks.reachability import integer_pll_outputs, merge_sources
 
 from adijif.solvers import CpoExpr, CpoModel  # type: ignore # isort: skip  # noqa: I202
 from adijif.solvers import CpoSolveResult  # type: ignore # isort: skip  # noqa: I202
@@ -334,6 +337,73 @@ class hmc7044(hmc7044_bf):
 
         return lo.draw()
 
+    def _reachability_spec(self) -> Dict:
+        """Divider sets and limits that determine reachable output rates.
+
+        Returns:
+            Dict: Current divider selections and PLL limits
+        """
+        return {
+            "d": self._d,
+            "r2": self._r2,
+            "n2": self._n2,
+            "vcxo_doubler": self._vcxo_doubler,
+            "vco_min": self.vco_min,
+            "vco_max": self.vco_max,
+            "pfd_max": self.pfd_max,
+        }
+
+    def _reference_paths(self) -> List[Dict]:
+        """Divider paths from the VCXO to the output dividers.
+
+        Returns:
+            List[Dict]: One path per VCXO doubler setting
+        """
+        doublers = self._vcxo_doubler
+        if not isinstance(doublers, list):
+            doublers = [doublers]
+        return [
+            {
+                "mult": vd,
+                "post": 1,
+                "r": self._r2,
+                "n": self._n2,
+                "f_min": self.vco_min,
+                "f_max": self.vco_max,
+                "pfd_max": self.pfd_max,
+            }
+            for vd in sorted(doublers)
+        ]
+
+    def _output_sources(
+        self, vcxo: int
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Enumerate integer VCO frequencies for a fixed VCXO.
+
+        Args:
+            vcxo (int): VCXO frequency in hertz
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: Sorted VCO frequencies
+            and the r2, n2 and vcxo_doubler values producing each
+        """
+        parts = []
+        doublers = self._vcxo_doubler
+        if not isinstance(doublers, list):
+            doublers = [doublers]
+        for vd in sorted(doublers):
+            vco, r2, n2 = integer_pll_outputs(
+                vcxo * vd,
+                self._r2,
+                self._n2,
+                self.vco_min,
+                self.vco_max,
+                self.pfd_max,
+            )
+            vds = np.full(vco.size, vd, dtype=np.int64)
+            parts.append((vco, {"r2": r2, "n2": n2, "vcxo_doubler": vds}))
+        return merge_sources(parts)
+
     def get_config(self, solution: CpoSolveResult = None) -> Dict:
         """Extract configurations from solver results.
 
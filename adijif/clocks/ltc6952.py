@@ -1,10 +1,12 @@
 """LTC6952 clock chip model."""
 
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
+import numpy as np
 from docplex.cp.solution import CpoSolveResult  # type: ignore
 
 from adijif.clocks.ltc6952_bf import ltc6952_bf
+from adijif.clocks.reachability import integer_pll_outputs
 from adijif.solvers import CpoExpr, GK_Intermediate
 
 
@@ -453,6 +455,56 @@ class ltc6952(ltc6952_bf):
         self._check_in_range(value, self.r2_available, "r2")
         self._r2 = self._own_selection(value)
 
+    def _reachability_spec(self) -> Dict:
+        """Divider sets and limits that determine reachable output rates.
+
+        Returns:
+            Dict: Current divider selections and PLL limits
+        """
+        return {
+            "d": self._d,
+            "r2": self._r2,
+            "n2": self._n2,
+            "vco_min": self.vco_min,
+            "vco_max": self.vco_max,
+            "pfd_max": self.pfd_max,
+        }
+
+    def _reference_paths(self) -> List[Dict]:
+        """Divider paths from the VCXO to the output dividers.
+
+        Returns:
+            List[Dict]: Single path through the R and N dividers
+        """
+        return [
+            {
+                "mult": 1,
+                "post": 1,
+                "r": self._r2,
+                "n": self._n2,
+                "f_min": self.vco_min,
+                "f_max": self.vco_max,
+                "pfd_max": self.pfd_max,
+            }
+        ]
+
+    def _output_sources(
+        self, vcxo: int
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Enumerate integer VCO frequencies for a fixed VCXO.
+
+        Args:
+            vcxo (int): VCXO frequency in hertz
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: Sorted VCO frequencies
+            and the r2 and n2 values producing each
+        """
+        vco, r2, n2 = integer_pll_outputs(
+            vcxo, self._r2, self._n2, self.vco_min, self.vco_max, self.pfd_max
+        )
+        return vco, {"r2": r2, "n2": n2}
+
     def get_config(self, solution: CpoSolveResult = None) -> Dict:
         """Extract configurations from solver results.
 
@@ -1,7 +1,8 @@
 """LTC6953 clock chip model."""
 
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
+import numpy as np
 from docplex.cp.solution import CpoSolveResult  # type: ignore
 
 from adijif.clocks.clock import clock
@@ -373,6 +374,48 @@ class ltc6953(clock):
         """
         raise NotImplementedError("list_available_references not implemented")
 
+    def _reachability_spec(self) -> Dict:
+        """Divider sets and limits that determine reachable output rates.
+
+        Returns:
+            Dict: Current divider selections and input limit
+        """
+        return {"d": self._m, "input_freq_max": self.input_freq_max}
+
+    def _reference_paths(self) -> List[Dict]:
+        """Input reference feeds the output dividers directly.
+
+        Returns:
+            List[Dict]: Single pass-through path limited by the input range
+        """
+        return [
+            {
+                "mult": 1,
+                "post": 1,
+                "r": [1],
+                "n": [1],
+                "f_min": 0,
+                "f_max": self.input_freq_max,
+                "pfd_max": None,
+            }
+        ]
+
+    def _output_sources(
+        self, vcxo: int
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Input reference is the only frequency into the output dividers.
+
+        Args:
+            vcxo (int): Input reference frequency in hertz
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: Input reference (empty
+            when above the input limit) and no internal dividers
+        """
+        if vcxo > self.input_freq_max:
+            return np.array([], dtype=np.int64), {}
+        return np.array([vcxo], dtype=np.int64), {}
+
     def get_config(self, solution: CpoSolveResult = None) -> Dict:
         """Extract configurations from solver results.
 
@@ -0,0 +1,581 @@
+"""Precomputed reachable-frequency index for clock chips.
+
+Every PLL based clock chip produces its outputs by dividing a single
+internal frequency (the VCO, or a fixed post-divider of it) by an output
+divider. For a fixed VCXO the set of those internal frequencies is finite
+and small once restricted to integer hertz, which is all that is needed to
+hit integer output rates exactly: ``F = rate * d`` is an integer whenever
+``rate`` is.
+
+:class:`ReachableIndex` stores that set as a sorted NumPy array together
+with the divider tuple that produces each entry, plus a bitset of the
+output dividers. Asking whether a chip can produce several rates at the
+same time is then a handful of vectorized lookups instead of a solver run,
+which lets ``adijif.system`` reject obviously infeasible requests before
+any constraint is handed to the solver.
+"""
+
+import hashlib
+import json
+import math
+import os
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+_RATIO_TOL = 1e-9
+
+# Largest denominator kept when reading rates given as floats
+_MAX_RATE_DENOMINATOR = 1_000_000
+
+# Candidates collected per requested candidate before ranking them
+_CANDIDATE_OVERSAMPLE = 8
+
+# Bound keeping vectorized numerator/denominator products inside int64
+_INT64_SAFE = 2**62
+
+# In-process cache of built indexes keyed by ReachableIndex.key
+_INDEX_CACHE: Dict[str, "ReachableIndex"] = {}
+
+
+def _as_int_array(values: Union[int, List[int], np.ndarray]) -> np.ndarray:
+    """Normalize a divider selection (scalar or list) to a sorted array."""
+    return np.unique(np.atleast_1d(np.asarray(values, dtype=np.int64)))
+
+
+def _integer_reference(value: Union[int, float]) -> int:
+    """Convert a reference frequency to integer hertz.
+
+    Args:
+        value (int, float): Reference frequency in hertz
+
+    Returns:
+        int: Reference frequency as an integer
+
+    Raises:
+        ValueError: Reference is not a whole number of hertz
+    """
+    if not isinstance(value, (int, float, np.integer, np.floating)):
+        raise ValueError("Reachable index requires a fixed numeric reference")
+    if float(value) != int(value):
+        raise ValueError(
+            f"Reachable index requires an integer reference, got {value}"
+        )
+    return int(value)
+
+
+def integer_pll_outputs(
+    ref: int,
+    r_values: Union[List[int], np.ndarray],
+    n_values: Union[List[int], np.ndarray],
+    f_min: float,
+    f_max: float,
+    pfd_max: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Enumerate integer frequencies ``ref * n / r`` inside ``[f_min, f_max]``.
+
+    ``ref * n / r`` is an integer exactly when ``n`` is a multiple of
+    ``r / gcd(r, ref)``, so only those feedback dividers are visited.
+    When several ``(r, n)`` pairs produce the same frequency the pair with
+    the smallest ``r`` is kept.
+
+    Args:
+        ref (int): Reference frequency into the R divider in hertz
+        r_values (List[int]): Allowed reference dividers
+        n_values (List[int]): Allowed feedback dividers
+        f_min (float): Minimum output frequency of the PLL
+        f_max (float): Maximum output frequency of the PLL
+        pfd_max (float, optional): Maximum phase detector frequency
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Sorted unique
+        frequencies and the ``r`` and ``n`` dividers producing each
+    """
+    r_values = _as_int_array(r_values)
+    n_values = _as_int_array(n_values)
+    n_set = np.zeros(int(n_values[-1]) + 1, dtype=bool)
+    n_set[n_values] = True
+
+    freqs, rs, ns = [], [], []
+    for r in r_values:
+        r = int(r)
+        if pfd_max is not None and ref > pfd_max * r:
+            continue
+        g = math.gcd(r, ref)
+        step = ref // g
+        t = np.arange(
+            -(-math.ceil(f_min) // step),
+            math.floor(f_max) // step + 1,
+            dtype=np.int64,
+        )
+        n = (r // g) * t
+        keep = n < n_set.size
+        t, n = t[keep], n[keep]
+        keep = n_set[n]
+        if not keep.any():
+            continue
+        freqs.append(t[keep] * step)
+        ns.append(n[keep])
+        rs.append(np.full(int(keep.sum()), r, dtype=np.int64))
+
+    if not freqs:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty
+    f_all = np.concatenate(freqs)
+    unique, first = np.unique(f_all, return_index=True)
+    return unique, np.concatenate(rs)[first], np.concatenate(ns)[first]
+
+
+def merge_sources(
+    parts: List[Tuple[np.ndarray, Dict[str, np.ndarray]]],
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Merge per-branch source arrays, keeping the first producer of each.
+
+    Args:
+        parts (List[Tuple]): ``(sources, dividers)`` pairs in preference order
+
+    Returns:
+        Tuple[np.ndarray, Dict[str, np.ndarray]]: Sorted unique sources and
+        the aligned divider arrays
+    """
+    parts = [p for p in parts if p[0].size]
+    if not parts:
+        return np.array([], dtype=np.int64), {}
+    sources = np.concatenate([p[0] for p in parts])
+    unique, first = np.unique(sources, return_index=True)
+    dividers = {
+        k: np.concatenate([p[1][k] for p in parts])[first] for k in parts[0][1]
+    }
+    return unique, dividers
+
+
+class ReachableIndex:
+    """Reachable output frequencies of one clock chip for one reference.
+
+    Attributes:
+        part (str): Clock chip name
+        vcxo (int): Reference frequency the index was built for
+        sources (np.ndarray): Sorted integer frequencies feeding the output
+            dividers
+        dividers (Dict[str, np.ndarray]): Divider values (aligned with
+            ``sources``) producing each source frequency
+        output_dividers (np.ndarray): Sorted allowed output dividers
+        key (str): Hash of the chip settings the index was built from
+    """
+
+    def __init__(
+        self,
+        part: str,
+        vcxo: int,
+        sources: np.ndarray,
+        dividers: Dict[str, np.ndarray],
+        output_dividers: np.ndarray,
+        key: str,
+    ) -> None:
+        """Wrap precomputed reachable-frequency arrays.
+
+        Use :meth:`from_clock` or :meth:`load` rather than calling this
+        directly.
+
+        Args:
+            part (str): Clock chip name
+            vcxo (int): Reference frequency in hertz
+            sources (np.ndarray): Sorted frequencies feeding output dividers
+            dividers (Dict[str, np.ndarray]): Divider arrays aligned to sources
+            output_dividers (np.ndarray): Allowed output divider values
+            key (str): Settings hash
+        """
+        self.part = part
+        self.vcxo = vcxo
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.dividers = {
+            k: np.asarray(v, dtype=np.int64) for k, v in dividers.items()
+        }
+        self.output_dividers = _as_int_array(output_dividers)
+        self.key = key
+        self._d_set = np.zeros(int(self.output_dividers[-1]) + 1, dtype=bool)
+        self._d_set[self.output_dividers] = True
+
+    @staticmethod
+    def signature(clk: Any, vcxo: Union[int, float]) -> str:
+        """Hash the chip settings that determine its reachable frequencies.
+
+        Args:
+            clk (clock): Clock chip model
+            vcxo (int, float): Reference frequency in hertz
+
+        Returns:
+            str: Hex digest identifying the chip configuration
+        """
+        spec = clk._reachability_spec()
+        payload = {
+            "part": clk.name,
+            "vcxo": _integer_reference(vcxo),
+            "spec": {
+                k: (
+                    _as_int_array(v).tolist()
+                    if isinstance(v, (list, np.ndarray))
+                    else v
+                )
+                for k, v in spec.items()
+            },
+        }
+        blob = json.dumps(payload, sort_keys=True).encode()
+        return hashlib.sha256(blob).hexdigest()
+
+    @classmethod
+    def from_clock(cls, clk: Any, vcxo: Union[int, float]) -> "ReachableIndex":
+        """Build the index for a clock chip using its current divider sets.
+
+        Args:
+            clk (clock): Clock chip model. Divider restrictions set through
+                its properties (e.g. ``n2``, ``r2``, ``d``) are honored.
+            vcxo (int, float): Reference frequency in hertz
+
+        Returns:
+            ReachableIndex: Built index
+        """
+        ref = _integer_reference(vcxo)
+        sources, dividers = clk._output_sources(ref)
+        return cls(
+            clk.name,
+            ref,
+            sources,
+            dividers,
+            clk._reachability_spec()["d"],
+            cls.signature(clk, ref),
+        )
+
+    def save(self, path: str) -> None:
+        """Persist the index as a compressed NumPy archive.
+
+        Args:
+            path (str): Output file path (``.npz``)
+        """
+        arrays = {f"div_{k}": v for k, v in self.dividers.items()}
+        np.savez_compressed(
+            path,
+            sources=self.sources,
+            output_dividers=self.output_dividers,
+            meta=np.array(
+                json.dumps(
+                    {"part": self.part, "vcxo": self.vcxo, "key": self.key}
+                )
+            ),
+            **arrays,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ReachableIndex":
+        """Load an index written by :meth:`save`.
+
+        Args:
+            path (str): Path of ``.npz`` file
+
+        Returns:
+            ReachableIndex: Loaded index
+        """
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            dividers = {
+                k[len("div_") :]: data[k]
+                for k in data.files
+                if k.startswith("div_")
+            }
+            return cls(
+                meta["part"],
+                meta["vcxo"],
+                data["sources"],
+                dividers,
+                data["output_dividers"],
+                meta["key"],
+            )
+
+    def __len__(self) -> int:
+        """Number of reachable source frequencies."""
+        return int(self.sources.size)
+
+    def _matching_sources(self, rates: np.ndarray) -> np.ndarray:
+        """Return indexes of sources that can generate every rate."""
+        rates = np.asarray(rates, dtype=float).ravel()
+        if rates.size == 0:
+            return np.arange(self.sources.size)
+        if np.any(rates <= 0):
+            return np.array([], dtype=np.int64)
+
+        # Candidate sources are first rate times every output divider
+        cand = np.rint(rates[0] * self.output_dividers).astype(np.int64)
+        pos = np.searchsorted(self.sources, cand)
+        valid = pos < self.sources.size
+        pos = pos[valid]
+        pos = pos[self.sources[pos] == cand[valid]]
+        if pos.size == 0:
+            return pos
+
+        ratio = self.sources[pos][:, None] / rates[None, :]
+        d = np.rint(ratio)
+        ok = np.abs(ratio - d) <= _RATIO_TOL * ratio
+        d = d.astype(np.int64)
+        in_set = (d >= 1) & (d < self._d_set.size)
+        ok &= in_set
+        ok[in_set] &= self._d_set[d[in_set]]
+        return pos[ok.all(axis=1)]
+
+    def can_produce(self, rates: Union[float, List[float]]) -> bool:
+        """Check if all rates can be generated at the same time.
+
+        Args:
+            rates (float, List[float]): Required output rates in hertz
+
+        Returns:
+            bool: True if one internal frequency divides down to every rate
+        """
+        return bool(self._matching_sources(np.atleast_1d(rates)).size)
+
+    def find(
+        self, rates: Union[float, List[float]], find: int = 1
+    ) -> List[Dict]:
+        """List divider configurations generating all rates simultaneously.
+
+        Args:
+            rates (float, List[float]): Required output rates in hertz
+            find (int): Maximum number of configurations to return
+
+        Returns:
+            List[Dict]: Configurations with the source frequency, the
+            dividers producing it and the required output dividers
+        """
+        rates = np.atleast_1d(np.asarray(rates, dtype=float))
+        configs = []
+        for i in self._matching_sources(rates)[:find]:
+            config = {k: int(v[i]) for k, v in self.dividers.items()}
+            config["source"] = int(self.sources[i])
+            config["required_output_divs"] = np.rint(
+                self.sources[i] / rates
+            ).astype(int)
+            configs.append(config)
+        return configs
+
+    def output_rates(self, i: int) -> np.ndarray:
+        """Rates available from one source through all output dividers.
+
+        Args:
+            i (int): Index into ``sources``
+
+        Returns:
+            np.ndarray: Output rates in hertz, highest first
+        """
+        return self.sources[i] / self.output_dividers
+
+
+def get_reachable_index(
+    clk: Any, vcxo: Union[int, float], cache_dir: Optional[str] = None
+) -> ReachableIndex:
+    """Return a (cached) reachable-frequency index for a clock chip.
+
+    Indexes are memoized in-process by their settings hash and, when
+    ``cache_dir`` is given, persisted to ``<cache_dir>/<part>_<hash>.npz``
+    so later sessions load them instead of rebuilding.
+
+    Args:
+        clk (clock): Clock chip model
+        vcxo (int, float): Reference frequency in hertz
+        cache_dir (str, optional): Directory for persisted indexes
+
+    Returns:
+        ReachableIndex: Index for the chip's current divider settings
+    """
+    key = ReachableIndex.signature(clk, vcxo)
+    if key in _INDEX_CACHE:
+        return _INDEX_CACHE[key]
+
+    path = None
+    if cache_dir:
+        fname = f"{clk.name.lower()}_{key[:16]}.npz"
+        path = os.path.join(cache_dir, fname)
+        if os.path.isfile(path):
+            index = ReachableIndex.load(path)
+            if index.key == key:
+                _INDEX_CACHE[key] = index
+                return index
+
+    index = ReachableIndex.from_clock(clk, vcxo)
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        index.save(path)
+    _INDEX_CACHE[key] = index
+    return index
+
+
+def clear_reachable_index_cache() -> None:
+    """Drop all in-process reachable-frequency indexes."""
+    _INDEX_CACHE.clear()
+
+
+def _rational(value: Union[int, float, Fraction]) -> Fraction:
+    """Convert a frequency to an exact fraction, undoing float round-off."""
+    return Fraction(value).limit_denominator(_MAX_RATE_DENOMINATOR)
+
+
+def rational_lcm(values: List[Union[int, float, Fraction]]) -> Fraction:
+    """Least common multiple of positive rational numbers.
+
+    Args:
+        values (List): Positive numbers
+
+    Returns:
+        Fraction: Smallest rational that is an integer multiple of every value
+    """
+    fractions = [_rational(v) for v in values]
+    num, den = fractions[0].numerator, fractions[0].denominator
+    for f in fractions[1:]:
+        num = math.lcm(num, f.numerator)
+        den = math.gcd(den, f.denominator)
+    return Fraction(num, den)
+
+
+def _path_references(
+    path: Dict,
+    base: Fraction,
+    ks: np.ndarray,
+    ref_min: Fraction,
+    ref_max: Optional[Fraction],
+    max_denominator: Optional[int],
+) -> Iterator[Fraction]:
+    """Yield references reaching the sources ``k * base`` through one path.
+
+    Args:
+        path (Dict): Divider path from ``clock._reference_paths``
+        base (Fraction): Least common multiple of the required rates
+        ks (np.ndarray): Multiples of ``base`` giving valid output dividers
+        ref_min (Fraction): Lowest allowed reference
+        ref_max (Fraction, optional): Highest allowed reference
+        max_denominator (int, optional): Largest reduced denominator wanted.
+            Pairs exceeding it are skipped where cheap to detect.
+
+    Yields:
+        Fraction: Reference frequencies, smallest ``r`` divider first
+    """
+    r_values = _as_int_array(path["r"])
+    n_values = _as_int_array(path["n"])
+    pfd_max = path["pfd_max"]
+    n_max = int(n_values[-1])
+    for k in ks.tolist():
+        pll = base * k * path["post"]
+        if not path["f_min"] <= pll <= path["f_max"]:
+            continue
+        # ref = gain * r / n; bound n for every r before walking pairs
+        gain = pll / path["mult"]
+        n_lo = np.full(r_values.size, float(n_values[0]))
+        if pfd_max is not None:
+            n_lo = np.maximum(n_lo, float(pll) / pfd_max)
+        if ref_max is not None:
+            n_lo = np.maximum(n_lo, float(gain / ref_max) * r_values)
+        n_hi = np.full(r_values.size, float(n_values[-1]))
+        if ref_min > 0:
+            n_hi = np.minimum(n_hi, float(gain / ref_min) * r_values)
+        first = np.searchsorted(n_values, np.floor(n_lo), side="left")
+        last = np.searchsorted(n_values, np.ceil(n_hi), side="right")
+        # Drop pairs whose reduced reference needs too large a denominator
+        # while the products still fit in int64
+        vectorize = max_denominator is not None and (
+            max(gain.numerator * int(r_values[-1]), gain.denominator * n_max)
+            < _INT64_SAFE
+        )
+        for i in np.flatnonzero(last > first).tolist():
+            r = int(r_values[i])
+            ns = n_values[first[i] : last[i]]
+            if vectorize:
+                den = gain.denominator * ns
+                ns = ns[
+                    den // np.gcd(gain.numerator * r, den) <= max_denominator
+                ]
+            for n in ns.tolist():
+                ref = gain * r / n
+                if ref < ref_min or (ref_max is not None and ref > ref_max):
+                    continue
+                if pfd_max is not None and pll / n > pfd_max:
+                    continue
+                yield ref
+
+
+def rational_references(
+    clk: Any,
+    rates: Union[float, List[float]],
+    ref_min: Union[int, float, Fraction] = 0,
+    ref_max: Optional[Union[int, float, Fraction]] = None,
+    max_denominator: Optional[int] = None,
+    max_candidates: int = 32,
+    accept: Optional[Callable[[Fraction], bool]] = None,
+) -> List[Fraction]:
+    """Enumerate rational references that let a clock chip hit every rate.
+
+    Every output is ``source / d``, so the frequency into the output
+    dividers must be a multiple ``k * L`` of the rational least common
+    multiple ``L`` of the rates with each ``k * L / rate`` an allowed output
+    divider. For each such source and divider path the reference is
+    ``pll * r / (n * mult)``; the ``(r, n)`` pairs keeping it inside
+    ``[ref_min, ref_max]`` and the phase detector under its limit are walked
+    with the smallest ``r`` first. Candidates are returned simplest first:
+    by denominator, then in the order found.
+
+    Args:
+        clk (clock): Clock chip model. Divider restrictions set through
+            its properties are honored.
+        rates (float, List[float]): Required output rates in hertz
+        ref_min (int, float, Fraction): Lowest allowed reference
+        ref_max (int, float, Fraction, optional): Highest allowed reference
+        max_denominator (int, optional): Largest denominator of a candidate
+            in lowest terms
+        max_candidates (int): Number of candidates to return at most
+        accept (Callable, optional): Extra filter applied to each candidate
+
+    Returns:
+        List[Fraction]: Candidate reference frequencies in hertz
+
+    Raises:
+        ValueError: Rates are not positive or max_candidates is below 1
+    """
+    rates = [_rational(r) for r in np.atleast_1d(rates).tolist()]
+    if not rates or any(r <= 0 for r in rates):
+        raise ValueError("Required output rates must be positive")
+    if max_candidates < 1:
+        raise ValueError("max_candidates must be at least 1")
+    ref_min = _rational(ref_min)
+    ref_max = None if ref_max is None else _rational(ref_max)
+
+    base = rational_lcm(rates)
+    steps = [int(base / r) for r in rates]
+    d_values = _as_int_array(clk._reachability_spec()["d"])
+    d_set = np.zeros(int(d_values[-1]) + 1, dtype=bool)
+    d_set[d_values] = True
+    # Multiples k of the LCM whose output dividers are all allowed
+    ks = d_values[d_values % steps[0] == 0] // steps[0]
+    for step in steps[1:]:
+        ks = ks[ks * step < d_set.size]
+        ks = ks[d_set[ks * step]]
+
+    budget = max_candidates * _CANDIDATE_OVERSAMPLE
+    found: Dict[Fraction, None] = {}
+    for path in clk._reference_paths():
+        refs = _path_references(
+            path, base, ks, ref_min, ref_max, max_denominator
+        )
+        for ref in refs:
+            if ref in found:
+                continue
+            if (
+                max_denominator is not None
+                and ref.denominator > max_denominator
+            ):
+                continue
+            if accept is not None and not accept(ref):
+                continue
+            found[ref] = None
+            if len(found) >= budget:
+                break
+        if len(found) >= budget:
+            break
+
+    return sorted(found, key=lambda f: f.denominator)[:max_candidates]
@@ -3,9 +3,43 @@
 import copy
 from typing import Any, Dict, List, Optional, Union
 
+from adijif import gekko_rundir
 from adijif.optimization import Objective
 from adijif.solvers import GEKKO, CpoModel
 
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+_IMMUTABLE_TYPE_SET = frozenset(_IMMUTABLE_TYPES)
+
+
+def _clone_value(value: Any, model: Union[GEKKO, CpoModel]) -> Any:
+    """Copy one instance attribute for :meth:`core.clone`.
+
+    Args:
+        value (Any): Attribute value to copy.
+        model (GEKKO, CpoModel): Solver model of the clone, passed on to
+            nested components.
+
+    Returns:
+        Any: Independent copy of the value.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, core):
+        return value.clone(model)
+    if type(value) is list:
+        # Divider ranges can hold tens of thousands of plain numbers
+        if _IMMUTABLE_TYPE_SET.issuperset(map(type, value)):
+            return value.copy()
+        return [_clone_value(v, model) for v in value]
+    if type(value) is dict:
+        return {k: _clone_value(v, model) for k, v in value.items()}
+    if type(value) is tuple:
+        return tuple(_clone_value(v, model) for v in value)
+    if type(value) in (set, frozenset):
+        # Set members are hashable and in practice immutable
+        return type(value)(value)
+    return copy.deepcopy(value)
+
 
 class core:
     """Common class for all JIF components.
@@ -16,6 +50,19 @@ class core:
 
     solver = "CPLEX"
 
+    """Instance attributes holding solver, solution or diagram state. clone()
+    rebuilds these instead of copying them."""
+    _clone_reset_attrs = (
+        "model",
+        "config",
+        "configs",
+        "_objectives",
+        "_solution",
+        "_last_config",
+        "ic_diagram_node",
+        "_diagram_output_dividers",
+    )
+
     @property
     def diagram_theme(self) -> str:
         """Palette used by standalone component diagrams."""
@@ -97,6 +144,44 @@ class core:
         self._disabled_objectives.add(name)
         self._objectives = [o for o in self._objectives if o.name != name]
 
+    def clone(self, model: Union[GEKKO, CpoModel] = None) -> "core":
+        """Create an unsolved copy carrying this component's configuration.
+
+        Much cheaper than ``copy.deepcopy``: class-level tables such as
+        quick configuration modes stay shared, and solver models, cached
+        solutions and diagram nodes are rebuilt fresh instead of copied.
+        Nested components are cloned onto the same model.
+
+        Args:
+            model (GEKKO,CpoModel): Solver model for the clone. A new model
+                is created when not provided.
+
+        Returns:
+            core: New component of the same class
+        """
+        new = type(self).__new__(type(self))
+        if model is None:
+            # The class name only labels the run directory; the clone and
+            # the original never share one while both are alive
+            model = (
+                gekko_rundir.new_model(type(self).__name__)
+                if self.solver == "gekko"
+                else CpoModel()
+            )
+        new.model = model
+        state = new.__dict__
+        for name, value in self.__dict__.items():
+            if name not in self._clone_reset_attrs:
+                state[name] = _clone_value(value, model)
+        new._last_config = None
+        new._reset_config()
+        new._objectives = []
+        new._solution = None
+        new.configs = []
+        if hasattr(new, "_init_diagram"):
+            new._init_diagram()
+        return new
+
     def _reset_config(self) -> None:
         """Reset runtime configuration from the component's class template."""
         self.config = copy.deepcopy(getattr(type(self), "config", {}))
@@ -135,7 +220,7 @@ class core:
                     "Input model must be of type gekko.GEKKO"
                 )
             else:
-                model = GEKKO(remote=False)
+                model = gekko_rundir.new_model(type(self).__name__)
         elif self.solver == "CPLEX":
             if model:
                 assert isinstance(model, CpoModel), (
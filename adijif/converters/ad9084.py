@@ -10,8 +10,8 @@ from .ad9084_util import (
     _load_rx_config_modes,
     _load_tx_config_modes,
     apply_settings,
+    load_profile,
 )
-from .ad9084_util import parse_json_config as parse_json_cfg
 from .ad9088_dp import ad9088_dp_rx
 from .adc import adc
 from .converter import converter
@@ -99,12 +99,15 @@ class ad9084_core(ad9084_draw, converter, metaclass=ABCMeta):
     ) -> None:
         """Parse Apollo profiles and apply settings to the model.
 
+        Parsed profiles are cached by path, modification time and content
+        hash, so repeated calls with an unchanged file skip the JSON parse.
+
         Args:
             profile_json (str): Path to the profile JSON file.
             bypass_version_check (bool): Bypass the version check for profile
         """
         self._last_config = None
-        settings = parse_json_cfg(profile_json, bypass_version_check)
+        settings = load_profile(profile_json, bypass_version_check)
         apply_settings(self, settings)
 
     def get_config(self, solution: CpoSolveResult = None) -> Dict:
@@ -1,8 +1,13 @@
 """AD9084 MxFE Utility Functions."""
 
+import copy
+import glob
+import hashlib
 import json
 import os
-from typing import Dict, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -427,6 +432,244 @@ def parse_json_config(
     return df_row
 
 
+# Parsed profiles kept in-process, least recently used first
+_PROFILE_CACHE: "OrderedDict[Tuple[str, int, str, bool], Dict]" = OrderedDict()
+# Most parsed profiles kept before the least recently used are dropped
+PROFILE_CACHE_SIZE = 256
+
+_JESD_COLUMNS = ["L", "M", "F", "S", "HD", "Np"]
+
+_PROFILE_COLUMNS = (
+    [
+        "path",
+        "profile_name",
+        "device_clock_Hz",
+        "common_lane_rate_Hz",
+        "rx_jesd_mode",
+        "tx_jesd_mode",
+        "cddc_decimation",
+        "fddc_decimation",
+        "cduc_interpolation",
+        "fduc_interpolation",
+        "rx_sample_rate_Hz",
+        "tx_sample_rate_Hz",
+    ]
+    + [f"rx_{setting}" for setting in _JESD_COLUMNS]
+    + [f"tx_{setting}" for setting in _JESD_COLUMNS]
+    + ["settings", "error"]
+)
+
+
+def _profile_cache_key(
+    profile_json: str, bypass_version_check: bool
+) -> Tuple[str, int, str, bool]:
+    """Build the cache key of a profile file from its path, mtime and hash.
+
+    Args:
+        profile_json (str): Path to the profile JSON file.
+        bypass_version_check (bool): Version check flag used to parse it.
+
+    Returns:
+        Tuple[str, int, str, bool]: Absolute path, mtime in nanoseconds,
+            SHA-256 of the file contents and the version check flag.
+
+    Raises:
+        FileNotFoundError: If the profile JSON file does not exist.
+    """
+    if not os.path.exists(profile_json):
+        raise FileNotFoundError(
+            f"Profile JSON file does not exist: {profile_json}"
+        )
+    path = os.path.abspath(profile_json)
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return (path, os.stat(path).st_mtime_ns, digest, bypass_version_check)
+
+
+def _cache_get(key: Tuple[str, int, str, bool]) -> Optional[Dict]:
+    """Copy of a cached profile, marking it as recently used."""
+    if key not in _PROFILE_CACHE:
+        return None
+    _PROFILE_CACHE.move_to_end(key)
+    return copy.deepcopy(_PROFILE_CACHE[key])
+
+
+def _cache_put(key: Tuple[str, int, str, bool], settings: Dict) -> None:
+    """Cache a parsed profile, evicting the least recently used ones."""
+    _PROFILE_CACHE[key] = settings
+    _PROFILE_CACHE.move_to_end(key)
+    while len(_PROFILE_CACHE) > PROFILE_CACHE_SIZE:
+        _PROFILE_CACHE.popitem(last=False)
+
+
+def load_profile(profile_json: str, bypass_version_check: bool = False) -> Dict:
+    """Parse an Apollo profile, reusing earlier results for unchanged files.
+
+    Results of :func:`parse_json_config` are cached in-process keyed by file
+    path, modification time and content hash, so editing or replacing a
+    profile always triggers a fresh parse. Each lookup still reads and hashes
+    the file. At most ``PROFILE_CACHE_SIZE`` profiles are kept, least
+    recently used first out.
+
+    Args:
+        profile_json (str): Path to the profile JSON file.
+        bypass_version_check (bool): If True, bypasses the version check for
+            the profile.
+
+    Returns:
+        Dict: Copy of the parsed configuration data.
+    """
+    key = _profile_cache_key(profile_json, bypass_version_check)
+    settings = _cache_get(key)
+    if settings is None:
+        settings = parse_json_config(profile_json, bypass_version_check)
+        _cache_put(key, settings)
+        settings = copy.deepcopy(settings)
+    return settings
+
+
+def clear_profile_cache() -> None:
+    """Drop all cached Apollo profile settings."""
+    _PROFILE_CACHE.clear()
+
+
+def _parse_profile_worker(
+    args: Tuple[str, bool],
+) -> Tuple[str, Optional[Dict], Optional[str]]:
+    """Parse one profile in a worker process.
+
+    Args:
+        args (Tuple[str, bool]): Profile path and version check flag.
+
+    Returns:
+        Tuple[str, Optional[Dict], Optional[str]]: Path, parsed settings (or
+            None) and error message (or None).
+    """
+    path, bypass_version_check = args
+    try:
+        return path, parse_json_config(path, bypass_version_check), None
+    except Exception as e:  # noqa: BLE001
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+def _profile_row(path: str, settings: Dict) -> Dict:
+    """Flatten parsed profile settings into a single table row.
+
+    Args:
+        path (str): Absolute path of the profile.
+        settings (Dict): Output of :func:`parse_json_config`.
+
+    Returns:
+        Dict: Flat row with rates, datapath ratios and JESD parameters.
+    """
+    datapath = settings["datapath"]
+    device_clock = settings["device_clock_Hz"]
+    row = {
+        "path": path,
+        "profile_name": settings["profile_name"],
+        "device_clock_Hz": device_clock,
+        "common_lane_rate_Hz": settings["common_lane_rate_Hz"],
+        "rx_jesd_mode": settings["rx_jesd_mode"],
+        "tx_jesd_mode": settings["tx_jesd_mode"],
+        "cddc_decimation": datapath["cddc_decimation"],
+        "fddc_decimation": datapath["fddc_decimation"],
+        "cduc_interpolation": datapath["cduc_interpolation"],
+        "fduc_interpolation": datapath["fduc_interpolation"],
+        "rx_sample_rate_Hz": device_clock
+        / (datapath["cddc_decimation"] * datapath["fddc_decimation"]),
+        "tx_sample_rate_Hz": device_clock
+        / (datapath["cduc_interpolation"] * datapath["fduc_interpolation"]),
+    }
+    for prefix, link in [("rx", "jtx"), ("tx", "jrx")]:
+        for setting in _JESD_COLUMNS:
+            row[f"{prefix}_{setting}"] = settings["jesd_settings"][link][
+                setting
+            ]
+    row["settings"] = settings
+    return row
+
+
+def load_profiles(
+    directory: str,
+    pattern: str = "*.json",
+    processes: Optional[int] = None,
+    bypass_version_check: bool = False,
+    include_failed: bool = False,
+) -> pd.DataFrame:
+    """Parse a directory of Apollo profiles into a columnar table.
+
+    Profiles not already in the cache are parsed in a process pool. Each
+    row holds the rates, JESD parameters and datapath ratios of one profile
+    so a corpus can be filtered with pandas before any model is solved. The
+    full parsed settings are kept in the ``settings`` column and can be
+    passed straight to :func:`apply_settings`.
+
+    Args:
+        directory (str): Directory to scan for profiles.
+        pattern (str): Glob pattern of profile files, relative to
+            ``directory``. Use ``"**/*.json"`` to recurse.
+        processes (int): Number of worker processes. None uses the CPU
+            count, 1 parses in the calling process.
+        bypass_version_check (bool): If True, bypasses the version check for
+            the profiles.
+        include_failed (bool): Keep rows for profiles that could not be
+            parsed, with the reason in the ``error`` column.
+
+    Returns:
+        pd.DataFrame: One row per profile, sorted by path.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+    """
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(
+            f"Profile directory does not exist: {directory}"
+        )
+    paths = sorted(
+        os.path.abspath(p)
+        for p in glob.glob(os.path.join(directory, pattern), recursive=True)
+        if os.path.isfile(p)
+    )
+
+    results: Dict[str, Tuple[Optional[Dict], Optional[str]]] = {}
+    keys = {}
+    pending = []
+    for path in paths:
+        key = _profile_cache_key(path, bypass_version_check)
+        keys[path] = key
+        settings = _cache_get(key)
+        if settings is not None:
+            results[path] = (settings, None)
+        else:
+            pending.append(path)
+
+    jobs = [(path, bypass_version_check) for path in pending]
+    if processes == 1 or len(jobs) < 2:
+        parsed: List = [_parse_profile_worker(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            parsed = list(pool.map(_parse_profile_worker, jobs, chunksize=16))
+    for path, settings, error in parsed:
+        if settings is not None:
+            _cache_put(keys[path], settings)
+            settings = copy.deepcopy(settings)
+        results[path] = (settings, error)
+
+    rows = []
+    for path in paths:
+        settings, error = results[path]
+        if settings is not None:
+            row = _profile_row(path, settings)
+            row["error"] = None
+        elif include_failed:
+            row = {"path": path, "error": error}
+        else:
+            continue
+        rows.append(row)
+
+    return pd.DataFrame(rows, columns=_PROFILE_COLUMNS)
+
+
 def _apply_rx_settings(
     conv: converter, profile_settings: Dict, jesd_class: str
 ) -> None:
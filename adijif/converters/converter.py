@@ -1,13 +1,46 @@
 """Converter base meta class for all converter clocking models."""
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from ..common import core
 from ..draw import Layout, Node
 from ..gekko_trans import gekko_translation
 from ..jesd import jesd
 
+# Reverse indexes of quick configuration mode tables, keyed by id of the
+# table and the skipped parameters. The table itself is stored in the entry
+# so its id cannot be reused while the index is alive.
+_MODE_INDEXES: Dict[Tuple[int, Tuple[str, ...]], Tuple] = {}
+
+
+def _build_mode_index(
+    modes: Dict, skip: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], Optional[Dict[Tuple, str]]]:
+    """Map canonical JESD parameter tuples to mode names.
+
+    Args:
+        modes (Dict): Quick configuration modes of one JESD class.
+        skip (Tuple[str, ...]): Parameters ignored when matching modes.
+
+    Returns:
+        Tuple[Tuple[str, ...], Optional[Dict[Tuple, str]]]: Parameter names in
+            tuple order and the index, which is None when mode values cannot
+            be hashed.
+    """
+    first = next(iter(modes))
+    attrs = tuple(k for k in modes[first] if k not in skip)
+    index: Dict[Tuple, str] = {}
+    try:
+        for mode, cfg in modes.items():
+            if {k for k in cfg if k not in skip} != set(attrs):
+                continue
+            # First mode wins, matching the order of a linear scan
+            index.setdefault(tuple(cfg[k] for k in attrs), mode)
+    except TypeError:
+        return attrs, None
+    return attrs, index
+
 
 class converter(core, jesd, gekko_translation, metaclass=ABCMeta):
     """Converter base meta class used to enforce all converter classes.
@@ -355,6 +388,9 @@ class converter(core, jesd, gekko_translation, metaclass=ABCMeta):
     def _check_valid_jesd_mode(self) -> str:
         """Verify current JESD configuration for part is valid.
 
+        The current mode is found with a single lookup in a reverse index
+        of the quick configuration table, built once per table.
+
         Raises:
             Exception: Invalid JESD configuration
 
@@ -363,25 +399,35 @@ class converter(core, jesd, gekko_translation, metaclass=ABCMeta):
         """
         # Check to make sure JESD clocks in range
         self._check_jesd_config()
-        # Pull current mode
-        k = next(iter(self.quick_configuration_modes[self.jesd_class]))
-        attrs = self.quick_configuration_modes[self.jesd_class][k].keys()
+        modes = self.quick_configuration_modes[self.jesd_class]
+        skip = tuple(self._jesd_params_to_skip_check)
+        key = (id(modes), skip)
+        entry = _MODE_INDEXES.get(key)
+        if entry is None or entry[0] is not modes or entry[1] != len(modes):
+            entry = (modes, len(modes), *_build_mode_index(modes, skip))
+            _MODE_INDEXES[key] = entry
+        _, _, attrs, index = entry
 
-        current_config = {}
-        for attr in attrs:
-            if attr in self._jesd_params_to_skip_check:
-                continue
-            current_config[attr] = getattr(self, attr)
-
-        # Check mode in supported modes
-        for mode in self.quick_configuration_modes[self.jesd_class].keys():
-            cmode = self.quick_configuration_modes[self.jesd_class][mode].copy()
-            for k in self._jesd_params_to_skip_check:
-                if hasattr(cmode, k) or k in cmode:
-                    del cmode[k]
-                if hasattr(current_config, k) or k in current_config:
-                    del current_config[k]
+        # Pull current mode
+        current_config = {attr: getattr(self, attr) for attr in attrs}
+
+        if index is not None:
+            try:
+                mode = index.get(tuple(current_config.values()))
+            except TypeError:
+                mode = None
+            if mode is not None and mode in modes:
+                cmode = {k: v for k, v in modes[mode].items() if k not in skip}
+                if cmode == current_config:
+                    return mode
+
+        # Slow path: unhashable values or a table edited in place since the
+        # index was built
+        for mode, cfg in modes.items():
+            cmode = {k: v for k, v in cfg.items() if k not in skip}
             if current_config == cmode:
+                if index is not None:
+                    del _MODE_INDEXES[key]
                 return mode
         raise Exception(
             f"Invalid JESD configuration for {self.name}\n{current_config}"
@@ -2,15 +2,209 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
+import os
 import subprocess  # noqa: S404
+from collections import OrderedDict
 from importlib.util import find_spec
-from typing import Union
+from typing import Any, Callable, Hashable, Optional, Union
 
 connection_class_types = {
     "data": "jif-signal-data",
     "sysref": "jif-signal-sysref",
 }
 
+_RENDER_CACHE: OrderedDict[str, str] = OrderedDict()
+
+
+def clear_render_cache() -> None:
+    """Drop all in-process rendered diagrams."""
+    _RENDER_CACHE.clear()
+
+
+def _render_cache_get(key: str, cache_dir: Optional[str]) -> Optional[str]:
+    """Look up a rendered diagram in memory, then on disk.
+
+    Args:
+        key (str): Hash of the D2 source and render options.
+        cache_dir (str): Directory of the on-disk store, or None.
+
+    Returns:
+        str: Rendered SVG, or None when not cached.
+    """
+    if key in _RENDER_CACHE:
+        _RENDER_CACHE.move_to_end(key)
+        return _RENDER_CACHE[key]
+    if cache_dir:
+        path = os.path.join(cache_dir, f"{key}.svg")
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+    return None
+
+
+def _render_cache_put(
+    key: str, svg: str, cache_dir: Optional[str], size: int
+) -> None:
+    """Store a rendered diagram in memory and optionally on disk.
+
+    Args:
+        key (str): Hash of the D2 source and render options.
+        svg (str): Rendered SVG.
+        cache_dir (str): Directory of the on-disk store, or None.
+        size (int): Maximum number of diagrams kept in memory.
+    """
+    _RENDER_CACHE[key] = svg
+    _RENDER_CACHE.move_to_end(key)
+    while len(_RENDER_CACHE) > size:
+        _RENDER_CACHE.popitem(last=False)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, f"{key}.svg")
+        # Write then rename so concurrent readers never see partial files
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(svg)
+        os.replace(tmp, path)
+
+
+def _format_rate(rate: Union[int, float]) -> Optional[str]:
+    """Format a rate in hertz with the largest unit keeping it below 1000.
+
+    Args:
+        rate (int, float): Rate in hertz.
+
+    Returns:
+        str: Formatted rate, or None when it exceeds the largest unit.
+    """
+    for unit in ("Hz", "kHz", "MHz", "GHz"):
+        if rate < 1000:
+            return f"{rate:.2f} {unit}"
+        rate /= 1000
+    return None
+
+
+class _ListIndex:
+    """Lookup table over a public list of nodes or connections.
+
+    The list stays the source of truth, so callers may still append to or
+    replace it directly. The table is rebuilt on the next lookup whenever
+    the list object is replaced or its length changed behind its back.
+    Removals in place must be reported through ``removed``, since a later
+    append would restore the length the table was built for.
+    """
+
+    __slots__ = ("_key", "_source", "_size", "_table")
+
+    def __init__(self, key: Callable[[Any], Hashable]) -> None:
+        """Create an empty index.
+
+        Args:
+            key (Callable): Maps a list item to its lookup key.
+        """
+        self._key = key
+        self._source: Optional[list] = None
+        self._size = -1
+        self._table: dict[Hashable, list] = {}
+
+    def table(self, items: list) -> dict[Hashable, list]:
+        """Get the key -> matching items table of a list.
+
+        Args:
+            items (list): Indexed list.
+
+        Returns:
+            dict: Items sharing each key, in list order.
+        """
+        if items is not self._source or len(items) != self._size:
+            table: dict[Hashable, list] = {}
+            for item in items:
+                table.setdefault(self._key(item), []).append(item)
+            self._table, self._source, self._size = table, items, len(items)
+        return self._table
+
+    def appended(self, items: list, item: Any) -> None:  # noqa: ANN401
+        """Record an item just appended to the indexed list.
+
+        Args:
+            items (list): Indexed list, already holding ``item``.
+            item (Any): Appended item.
+        """
+        if items is self._source and len(items) == self._size + 1:
+            self._table.setdefault(self._key(item), []).append(item)
+            self._size += 1
+
+    def removed(self, items: list, item: Any) -> None:  # noqa: ANN401
+        """Record an item just removed in place from the indexed list.
+
+        Args:
+            items (list): Indexed list, no longer holding ``item``.
+            item (Any): Removed item.
+        """
+        if items is not self._source or len(items) != self._size - 1:
+            # Not in step with the list, rebuild on the next lookup
+            self._source = None
+            return
+        self._drop(item)
+        self._size -= 1
+
+    def replaced(self, old: list, new: list, dropped: list) -> None:
+        """Record that ``new`` replaced ``old`` with ``dropped`` left out.
+
+        Args:
+            old (list): Previously indexed list.
+            new (list): Replacement list.
+            dropped (list): Items of ``old`` missing from ``new``.
+        """
+        if old is not self._source or len(old) != self._size:
+            return
+        for item in dropped:
+            self._drop(item)
+        self._source, self._size = new, len(new)
+
+    def _drop(self, item: Any) -> None:  # noqa: ANN401
+        """Remove one item from the table."""
+        key = self._key(item)
+        kept = [i for i in self._table.get(key, []) if i is not item]
+        if kept:
+            self._table[key] = kept
+        else:
+            self._table.pop(key, None)
+
+    def first(self, items: list, key: Hashable) -> Any:  # noqa: ANN401
+        """Get the first item with a key.
+
+        Args:
+            items (list): Indexed list.
+            key (Hashable): Lookup key.
+
+        Returns:
+            Any: First matching item, or None.
+        """
+        matches = self.table(items).get(key)
+        return matches[0] if matches else None
+
+
+def _node_name(node: Node) -> str:
+    """Index key of a node."""
+    return node.name
+
+
+def _edge(conn: dict) -> tuple[str, str]:
+    """Index key of a connection by both endpoint names."""
+    return (conn["from"].name, conn["to"].name)
+
+
+def _edge_from(conn: dict) -> str:
+    """Index key of a connection by source name."""
+    return conn["from"].name
+
+
+def _edge_to(conn: dict) -> str:
+    """Index key of a connection by destination name."""
+    return conn["to"].name
+
 
 class Node:
     """Node model for diagraming which can have children and connections."""
@@ -30,6 +224,8 @@ class Node:
         self.ntype = ntype
         self.children = []
         self.connections = []
+        self._child_index = _ListIndex(_node_name)
+        self._edge_index = _ListIndex(_edge)
         self._shape = "rectangle"
         self._shape_explicit = False
         self.use_unit_conversion_for_rate = True
@@ -76,16 +272,12 @@ class Node:
                 optionally "rate" and "style".
         """
         if "rate" in connection and self.use_unit_conversion_for_rate:
-            units = ["Hz", "kHz", "MHz", "GHz"]
-            rate = connection["rate"]
-            # Convert to unit based on rate scale
-            for unit in units:
-                if rate < 1000:
-                    connection["rate"] = f"{rate:.2f} {unit}"
-                    break
-                rate /= 1000
+            rate = _format_rate(connection["rate"])
+            if rate is not None:
+                connection["rate"] = rate
 
         self.connections.append(connection)
+        self._edge_index.appended(self.connections, connection)
 
     def get_connection(self, from_s: str, to: str) -> dict:
         """Get connection between this node and another node.
@@ -100,10 +292,10 @@ class Node:
         Raises:
             ValueError: If connection not found.
         """
-        for conn in self.connections:
-            if conn["from"].name == from_s and conn["to"].name == to:
-                return conn
-        raise ValueError(f"Connection from {from_s} to {to} not found.")
+        conn = self._edge_index.first(self.connections, (from_s, to))
+        if conn is None:
+            raise ValueError(f"Connection from {from_s} to {to} not found.")
+        return conn
 
     def remove_connection(self, from_s: str, to: str) -> None:
         """Remove connection between this node and another node.
@@ -115,15 +307,11 @@ class Node:
         Raises:
             ValueError: If connection not found.
         """
-        conn_to_remove = None
-        for conn in self.connections:
-            if conn["from"].name == from_s and conn["to"].name == to:
-                conn_to_remove = conn
-                break
-        if conn_to_remove:
-            self.connections.remove(conn_to_remove)
-            return
-        raise ValueError(f"Connection from {from_s} to {to} not found.")
+        conn_to_remove = self._edge_index.first(self.connections, (from_s, to))
+        if conn_to_remove is None:
+            raise ValueError(f"Connection from {from_s} to {to} not found.")
+        self.connections.remove(conn_to_remove)
+        self._edge_index.removed(self.connections, conn_to_remove)
 
     def update_connection(
         self, from_s: str, to: str, rate: Union(int, float)
@@ -138,15 +326,11 @@ class Node:
         Raises:
             ValueError: If connection not found.
         """
-        for conn in self.connections:
-            if conn["from"].name == from_s and conn["to"].name == to:
-                units = ["Hz", "kHz", "MHz", "GHz"]
-                # Convert to unit based on rate scale
-                for unit in units:
-                    if rate < 1000:
-                        conn["rate"] = f"{rate:.2f} {unit}"
-                        return
-                    rate /= 1000
+        formatted = _format_rate(rate)
+        matches = self._edge_index.table(self.connections).get((from_s, to))
+        if matches and formatted is not None:
+            matches[0]["rate"] = formatted
+            return
 
         raise ValueError(f"Connection from {from_s} to {to} not found.")
 
@@ -161,6 +345,7 @@ class Node:
         for c in child:
             c.parent = self
             self.children.append(c)
+            self._child_index.appended(self.children, c)
 
     def get_child(self, name: str) -> Node:
         """Get child node by name.
@@ -174,10 +359,10 @@ class Node:
         Raises:
             ValueError: If child node not found.
         """
-        for child in self.children:
-            if child.name == name:
-                return child
-        raise ValueError(f"Child with name {name} not found.")
+        child = self._child_index.first(self.children, name)
+        if child is None:
+            raise ValueError(f"Child with name {name} not found.")
+        return child
 
     def remove_child(self, name: str) -> None:
         """Remove child node by name.
@@ -186,22 +371,12 @@ class Node:
             name (str): Name of the child node to remove.
         """
         # Remove connections with the child first
-        connections_to_keep = []
-        for conn in self.connections:
-            if conn["to"].name != name:
-                connections_to_keep.append(conn)
-        self.connections = connections_to_keep
-        connections_to_keep = []
-        for conn in self.connections:
-            if conn["from"].name != name:
-                connections_to_keep.append(conn)
-        self.connections = connections_to_keep
-
-        children_to_keep = []
-        for child in self.children:
-            if child.name != name:
-                children_to_keep.append(child)
-        self.children = children_to_keep
+        self.connections = [
+            conn
+            for conn in self.connections
+            if conn["to"].name != name and conn["from"].name != name
+        ]
+        self.children = [child for child in self.children if child.name != name]
 
 
 class Layout:
@@ -211,6 +386,13 @@ class Layout:
     use_d2_cli = False
     _write_out_d2_file = False
 
+    """Reuse rendered diagrams when the D2 source and theme are unchanged."""
+    use_render_cache = False
+    """Maximum number of rendered diagrams kept in process memory."""
+    render_cache_size = 128
+    """Optional directory persisting rendered diagrams across processes."""
+    render_cache_dir: Optional[str] = None
+
     def __init__(self, name: str, theme: str = "dark") -> None:
         """Initialize layout with name.
 
@@ -227,6 +409,10 @@ class Layout:
         self.theme = theme
         self.nodes = []
         self.connections = []
+        self._node_index = _ListIndex(_node_name)
+        self._edge_index = _ListIndex(_edge)
+        self._from_index = _ListIndex(_edge_from)
+        self._to_index = _ListIndex(_edge_to)
         self.use_unit_conversion_for_rate = True
         self.output_filename = "clocks.d2"
         self.output_image_filename = "clocks.svg"
@@ -240,6 +426,7 @@ class Layout:
             node (Node): Node to add to the layout.
         """
         self.nodes.append(node)
+        self._node_index.appended(self.nodes, node)
 
     def remove_node(self, name: str) -> None:
         """Remove node by name.
@@ -249,22 +436,23 @@ class Layout:
         """
         assert isinstance(name, str), "name must be a string"
         # Remove connections with the node first
-        connections_to_keep = []
-        for conn in self.connections:
-            if conn["to"].name != name:
-                connections_to_keep.append(conn)
-        self.connections = connections_to_keep
-        connections_to_keep = []
-        for conn in self.connections:
-            if conn["from"].name != name:
-                connections_to_keep.append(conn)
-        self.connections = connections_to_keep
-
-        nodes_to_keep = []
-        for node in self.nodes:
-            if node.name != name:
-                nodes_to_keep.append(node)
-        self.nodes = nodes_to_keep
+        touching = [
+            *self._from_index.table(self.connections).get(name, []),
+            *self._to_index.table(self.connections).get(name, []),
+        ]
+        if touching:
+            drop = {id(conn) for conn in touching}
+            old = self.connections
+            self.connections = [conn for conn in old if id(conn) not in drop]
+            dropped = list({id(conn): conn for conn in touching}.values())
+            for index in (self._edge_index, self._from_index, self._to_index):
+                index.replaced(old, self.connections, dropped)
+
+        dropped = self._node_index.table(self.nodes).get(name)
+        if dropped:
+            old = self.nodes
+            self.nodes = [node for node in old if node.name != name]
+            self._node_index.replaced(old, self.nodes, list(dropped))
 
     def add_connection(self, connection: dict) -> None:
         """Add connection between two nodes.
@@ -274,15 +462,12 @@ class Layout:
                 and optionally "rate".
         """
         if "rate" in connection and self.use_unit_conversion_for_rate:
-            units = ["Hz", "kHz", "MHz", "GHz"]
-            rate = connection["rate"]
-            # Convert to unit based on rate scale
-            for unit in units:
-                if rate < 1000:
-                    connection["rate"] = f"{rate:.2f} {unit}"
-                    break
-                rate /= 1000
+            rate = _format_rate(connection["rate"])
+            if rate is not None:
+                connection["rate"] = rate
         self.connections.append(connection)
+        for index in (self._edge_index, self._from_index, self._to_index):
+            index.appended(self.connections, connection)
 
     def get_connection(
         self, from_s: str = None, to: str = None
@@ -302,20 +487,13 @@ class Layout:
         """
         if from_s is None and to is None:
             raise ValueError("Both from and to cannot be None.")
-        found = []
         if from_s is None:
-            for conn in self.connections:
-                if conn["to"].name == to:
-                    found.append(conn)
-            return found
+            return list(self._to_index.table(self.connections).get(to, []))
         if to is None:
-            for conn in self.connections:
-                if conn["from"].name == from_s:
-                    found.append(conn)
-            return found
-        for conn in self.connections:
-            if conn["from"].name == from_s and conn["to"].name == to:
-                return conn
+            return list(
+                self._from_index.table(self.connections).get(from_s, [])
+            )
+        return self._edge_index.first(self.connections, (from_s, to))
 
     def get_node(self, name: str) -> Node:
         """Get node by name.
@@ -329,10 +507,10 @@ class Layout:
         Raises:
             ValueError: If node not found.
         """
-        for node in self.nodes:
-            if node.name == name:
-                return node
-        raise ValueError(f"Node with name {name} not found.")
+        node = self._node_index.first(self.nodes, name)
+        if node is None:
+            raise ValueError(f"Node with name {name} not found.")
+        return node
 
     def get_all_node_names(self) -> list[str]:
         """Get names of all nodes in the layout.
@@ -354,30 +532,53 @@ class Layout:
     def draw(self) -> str:
         """Draw diagram in d2 language.
 
+        When ``use_render_cache`` is set, diagrams whose D2 source and theme
+        match an earlier render are returned from the in-process LRU or the
+        ``render_cache_dir`` store without invoking d2.
+
         Returns:
             str: Path to the output image file.
 
         Raises:
             Exception: d2 support not installed.
         """
-        diag = "direction: right\n\n"
+        out = io.StringIO()
+        write = out.write
+        write("direction: right\n\n")
         connection_indexes: dict[tuple[str, str], int] = {}
+        parent_paths: dict[int, str] = {}
 
-        def apply_connection_style(diag: str, connection: dict) -> str:
-            """Apply style to the connection in the diagram.
+        def get_parents_names(node: Node) -> str:
+            """Get names of all parent nodes of the given node.
 
             Args:
-                diag (str): Current diagram string.
-                connection (dict): Connection dictionary with keys "from", "to",
-                    and optionally "style".
+                node (Node): Node for which to get parent names.
 
             Returns:
-                str: Updated diagram string with applied style.
+                str: Names of all parent nodes of the given node.
+            """
+            path = parent_paths.get(id(node))
+            if path is None:
+                parent = node.parent
+                path = (
+                    f"{get_parents_names(parent)}{parent.name}."
+                    if parent
+                    else ""
+                )
+                parent_paths[id(node)] = path
+            return path
+
+        def write_connection_style(
+            from_name: str, to_name: str, connection: dict
+        ) -> None:
+            """Write the signal class and style of a connection.
+
+            Args:
+                from_name (str): Qualified name of the source node.
+                to_name (str): Qualified name of the destination node.
+                connection (dict): Connection dictionary with keys "from",
+                    "to", and optionally "style".
             """
-            from_p_name = get_parents_names(connection["from"])
-            to_p_name = get_parents_names(connection["to"])
-            from_name = f"{from_p_name}{connection['from'].name}"
-            to_name = f"{to_p_name}{connection['to'].name}"
             connection_key = (from_name, to_name)
             index = connection.get(
                 "index", connection_indexes.get(connection_key, 0)
@@ -407,149 +608,100 @@ class Layout:
                 else:
                     signal_class = "jif-signal-clock"
 
-            diag += (
-                f"({from_name} -> {to_name})[{index}].class: {signal_class}\n"
-            )
+            edge = f"({from_name} -> {to_name})[{index}]"
+            write(f"{edge}.class: {signal_class}\n")
+            for key, value in connection.get("style", {}).items():
+                write(f"{edge}.style.{key}: {value}\n")
 
-            if "style" in connection:
-                for key in connection["style"]:
-                    diag += f"({from_name} -> {to_name})[{index}]"
-                    diag += f".style.{key}: {connection['style'][key]}\n"
-            return diag
-
-        def get_parents_names(node: Node) -> str:
-            """Get names of all parent nodes of the given node.
+        def write_connection(connection: dict) -> None:
+            """Write a connection, its rate label and its style.
 
             Args:
-                node (Node): Node for which to get parent names.
-
-            Returns:
-                str: Names of all parent nodes of the given node.
+                connection (dict): Connection dictionary with keys "from",
+                    "to" and optionally "rate".
             """
-            parents = []
-            while node.parent:
-                parents.append(node.parent.name)
-                node = node.parent
-            if not parents:
-                return ""
-            return ".".join(parents[::-1]) + "."
+            from_name = (
+                f"{get_parents_names(connection['from'])}"
+                f"{connection['from'].name}"
+            )
+            to_name = (
+                f"{get_parents_names(connection['to'])}{connection['to'].name}"
+            )
+            label = (
+                f"{connection['rate']}"
+                if self.show_rates and "rate" in connection
+                else None
+            )
+            write(f"{from_name} -> {to_name}")
+            if label:
+                write(f": {label}")
+            write("\n")
+            write_connection_style(from_name, to_name, connection)
 
-        def draw_subnodes(node: Node, spacing: str = "    ") -> str:
-            """Draw subnodes of the given node.
+        def write_subnodes(node: Node, spacing: str = "    ") -> None:
+            """Write subnodes of the given node.
 
             Args:
                 node (Node): Node for which to draw subnodes.
                 spacing (str): Spacing for indentation.
-
-            Returns:
-                str: Subnodes of the given node.
             """
-            diag = " {\n"
+            write(" {\n")
             for child in node.children:
+                write(spacing + child.name)
                 if child.value:
-                    diag += (
-                        spacing + child.name + f": {{tooltip: {child.value} }}"
-                    )
-                else:
-                    diag += spacing + child.name
+                    write(f": {{tooltip: {child.value} }}")
                 if child.children:
-                    diag += draw_subnodes(child, spacing + "    ")
+                    write_subnodes(child, spacing + "    ")
                 else:
-                    diag += "\n"
+                    write("\n")
                 if child.ntype:
-                    diag += (
-                        spacing + child.name + ".class: " + child.ntype + "\n"
-                    )
+                    write(f"{spacing}{child.name}.class: {child.ntype}\n")
                 if child._shape_explicit:
-                    diag += (
-                        spacing + child.name + ".shape: " + child.shape + "\n"
-                    )
-            lr = len("    ")
-            diag += spacing[:-lr] + "}\n"
-            return diag
-
-        # Add all nodes
-        for node in self.nodes:
-            diag += f"{node.name}"
-            if node.children:
-                diag += draw_subnodes(node)
-            diag += "\n"
-            if node.ntype:
-                diag += f"{node.name}.class: {node.ntype}\n"
-            if node._shape_explicit:
-                diag += f"{node.name}.shape: {node.shape}\n"
-
-        diag += "\n"
+                    write(f"{spacing}{child.name}.shape: {child.shape}\n")
+            write(spacing[: -len("    ")] + "}\n")
 
-        # # Set shapes
-        # for node in self.nodes:
-        #     parents_string = get_parents_names(node)
-        #     diag += f"{parents_string}{node.name}.shape = {node.shape}\n"
-
-        # diag += "\n"
-
-        # Add all connections
-        for connection in self.connections:
-            from_p_name = get_parents_names(connection["from"])
-            to_p_name = get_parents_names(connection["to"])
-            if self.show_rates:
-                label = (
-                    f"{connection['rate']}" if "rate" in connection else None
-                )
-            else:
-                label = None
-            diag += f"{from_p_name}{connection['from'].name} ->"
-            diag += f" {to_p_name}{connection['to'].name}"
-            diag += ": " + label if label else ""
-            diag += "\n"
-            diag = apply_connection_style(diag, connection)
-
-        def draw_nodes_connections(nodes: list[Node], show_rates: bool) -> str:
-            """Draw connections between nodes.
+        def write_nodes_connections(nodes: list[Node]) -> None:
+            """Write connections owned by nodes and their descendants.
 
             Args:
-                nodes (list[Node]): List of nodes to draw connections between.
-                show_rates (bool): Whether to show rates in the diagram.
-
-            Returns:
-                str: Connections between nodes.
+                nodes (list[Node]): Nodes whose connections are written.
             """
-            diag = ""
             for node in nodes:
                 for connection in node.connections:
-                    from_p_name = get_parents_names(connection["from"])
-                    to_p_name = get_parents_names(connection["to"])
-                    if show_rates:
-                        label = (
-                            f"{connection['rate']}"
-                            if "rate" in connection
-                            else ""
-                        )
-                    else:
-                        label = ""
-                    diag += f"{from_p_name}{connection['from'].name} -> "
-                    diag += f"{to_p_name}{connection['to'].name}"
-                    diag += ": " + label if label else ""
-                    diag += "\n"
-                    diag = apply_connection_style(diag, connection)
-
+                    write_connection(connection)
                 if node.children:
-                    diag += draw_nodes_connections(node.children, show_rates)
+                    write_nodes_connections(node.children)
 
-            return diag
+        # Add all nodes
+        for node in self.nodes:
+            write(node.name)
+            if node.children:
+                write_subnodes(node)
+            write("\n")
+            if node.ntype:
+                write(f"{node.name}.class: {node.ntype}\n")
+            if node._shape_explicit:
+                write(f"{node.name}.shape: {node.shape}\n")
 
-        # for node in self.nodes:
-        diag += draw_nodes_connections(self.nodes, show_rates=self.show_rates)
+        write("\n")
 
-        # for node in self.nodes:
-        #     for connection in node.connections:
-        #         from_p_name = get_parents_names(connection["from"])
-        #         to_p_name = get_parents_names(connection["to"])
-        #         label = f"{connection['rate']}" if "rate" in connection else ""
-        #         diag += f"{from_p_name}{connection['from'].name} -> "
-        #         diag += f"{to_p_name}{connection['to'].name}"
-        #         diag += ": " + label if label else ""
-        #         diag += "\n"
+        # Add all connections
+        for connection in self.connections:
+            write_connection(connection)
+        write_nodes_connections(self.nodes)
+
+        diag = out.getvalue()
+
+        cache_key = None
+        if self.use_render_cache:
+            cache_key = self._render_cache_key(diag)
+            svg = _render_cache_get(cache_key, self.render_cache_dir)
+            if svg is not None:
+                if self.use_d2_cli:
+                    with open(self.output_image_filename, "w") as f:
+                        f.write(svg)
+                    return self.output_image_filename
+                return svg
 
         if self.use_d2_cli:
             with open(self.output_filename, "w") as f:
@@ -567,6 +719,14 @@ class Layout:
                 ],
                 check=True,
             )
+            if cache_key:
+                with open(self.output_image_filename, "r") as f:
+                    _render_cache_put(
+                        cache_key,
+                        f.read(),
+                        self.render_cache_dir,
+                        self.render_cache_size,
+                    )
             return self.output_image_filename
         else:
             if self._write_out_d2_file:
@@ -586,5 +746,27 @@ class Layout:
             # with open(self.output_image_filename, "w") as f:
             #     f.write(out)
 
+            if cache_key:
+                _render_cache_put(
+                    cache_key,
+                    out,
+                    self.render_cache_dir,
+                    self.render_cache_size,
+                )
             # return self.output_image_filename
             return out
+
+    def _render_cache_key(self, diag: str) -> str:
+        """Hash D2 source together with every option affecting the render.
+
+        Args:
+            diag (str): Generated D2 source.
+
+        Returns:
+            str: Hex digest identifying the rendered diagram.
+        """
+        if self.use_d2_cli:
+            options = f"cli\0{self.layout_engine}"
+        else:
+            options = f"jif\0{self.theme}"
+        return hashlib.sha256(f"{options}\0{diag}".encode()).hexdigest()
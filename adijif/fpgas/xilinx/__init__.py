@@ -1,8 +1,10 @@
 """Xilinx FPGA clocking model."""
 
+import numbers
 from typing import Any, Dict, List, Optional, Union
 
-from docplex.cp.modeler import if_then
+import numpy as np
+from docplex.cp.modeler import if_then, logical_or
 
 from ...converters.converter import converter as conv
 from ...solvers import (
@@ -185,6 +187,12 @@ class xilinx(xilinx_bf, xilinx_draw):
     """
     force_single_quad_tile = False
 
+    """ Restrict an unconstrained reference clock to the values the
+        transceiver PLLs can use, found by exact enumeration before the
+        solve. Skipped when a PLL in use runs in fractional-N mode.
+    """
+    prefilter_ref_clocks = True
+
     """ Request that clock chip generated device clock
         device clock == LMFC/40
         NOTE: THIS IS NOT FPGA REF CLOCK
@@ -530,6 +538,38 @@ class xilinx(xilinx_bf, xilinx_draw):
             info = self.determine_qpll(bit_clock, fpga_ref_clock)
         return info
 
+    def determine_pll_batch(
+        self,
+        bit_clocks: Union[int, List[int]],
+        fpga_ref_clocks: Union[int, List[int]],
+    ) -> Dict:
+        """Determine PLL configurations for many lane rates and references.
+
+        Batched form of determine_pll. Every lane rate/reference pair is
+        evaluated in a single vectorized pass and the configuration
+        determine_pll would select (first CPLL match, otherwise first QPLL
+        match) is returned.
+
+        This is only used for brute-force implementations.
+
+        Args:
+            bit_clocks (int, List[int]): Lane rates in bits/second
+            fpga_ref_clocks (int, List[int]): System reference clocks
+
+        Returns:
+            Dict: PLL configuration keyed by (bit_clock, fpga_ref_clock).
+                Pairs without a valid configuration are omitted.
+        """
+        selected: Dict = {}
+        for info in self.determine_qpll_batch(bit_clocks, fpga_ref_clocks):
+            key = (info["bit_clock"], info["fpga_ref_clock"])
+            selected.setdefault(key, info)
+        for info in self.determine_cpll_batch(bit_clocks, fpga_ref_clocks):
+            key = (info["bit_clock"], info["fpga_ref_clock"])
+            if selected.get(key, {}).get("type") != "CPLL":
+                selected[key] = info
+        return selected
+
     def get_required_clock_names(self) -> List[str]:
         """Get list of strings of names of requested clocks.
 
@@ -880,6 +920,53 @@ class xilinx(xilinx_bf, xilinx_draw):
 
         return config, link_layer_input_rate
 
+    def _prefilter_ref_clock(
+        self,
+        converter: conv,
+        fpga_ref: Union[
+            int, GKVariable, GK_Intermediate, GK_Operators, CpoIntVar
+        ],
+    ) -> None:
+        """Limit a solver reference clock to PLL-compatible values.
+
+        Args:
+            converter (conv): Converter object connected to FPGA
+            fpga_ref: Reference clock for FPGA
+
+        Raises:
+            Exception: No PLL setting supports the converter lane rate
+        """
+        bit_clock = converter.bit_clock
+        if (
+            not self.prefilter_ref_clocks
+            or self.solver != "CPLEX"
+            or self.ref_clock_constraint != "Unconstrained"
+            or isinstance(fpga_ref, numbers.Real)
+            or not isinstance(bit_clock, numbers.Real)
+        ):
+            return
+        refs = self._transceiver_models[converter.name].ref_clock_candidates(
+            bit_clock, self.ref_clock_min, self.ref_clock_max
+        )
+        if refs is None:
+            return
+        if not len(refs):
+            raise Exception(
+                f"No solution found: no {self.transceiver_type} PLL setting "
+                f"supports lane rate {bit_clock} with a reference clock within "
+                f"[{self.ref_clock_min}, {self.ref_clock_max}]"
+            )
+
+        integer = refs == np.round(refs)
+        choices = [fpga_ref == float(ref) for ref in refs[~integer]]
+        if integer.any():
+            candidate = self._convert_input(
+                [int(ref) for ref in refs[integer]],
+                converter.name + "_fpga_ref_candidate",
+            )
+            choices.append(fpga_ref == candidate)
+        self._add_equation([logical_or(choices)])
+
     def _setup_quad_tile(
         self,
         converter: conv,
@@ -975,6 +1062,7 @@ class xilinx(xilinx_bf, xilinx_draw):
         if hasattr(self._transceiver_models[converter.name], "force_qpll1"):
             self._transceiver_models[converter.name].force_qpll1 = force_qpll1
 
+        self._prefilter_ref_clock(converter, fpga_ref)
         config = self._transceiver_models[converter.name].add_constraints(
             config, fpga_ref, converter
         )
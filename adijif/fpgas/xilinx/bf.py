@@ -1,5 +1,15 @@
 # flake8: noqa
+import numpy as np
+
 from adijif.fpgas.fpga import fpga
+from adijif.fpgas.xilinx.rates import as_rate_array
+
+CPLL_M = [1, 2]
+CPLL_D = [1, 2, 4, 8]
+CPLL_N1 = [5, 4]
+CPLL_N2 = [5, 4, 3, 2, 1]
+QPLL_M = [1, 2, 3, 4]
+QPLL_D = [1, 2, 4, 8, 16]
 
 
 class CPLLConfigurationError(Exception):
@@ -33,10 +43,10 @@ class xilinx_bf(fpga):
         # VCO = ( REF_CLK * N1 * N2 ) / M
         # bit_clock = ( VCO * 2 ) / D
 
-        for m in [1, 2]:
-            for d in [1, 2, 4, 8]:
-                for n1 in [5, 4]:
-                    for n2 in [5, 4, 3, 2, 1]:
+        for m in CPLL_M:
+            for d in CPLL_D:
+                for n1 in CPLL_N1:
+                    for n2 in CPLL_N2:
                         vco = fpga_ref_clock * n1 * n2 / m
                         # print("VCO", self.vco_min/1e9, vco/1e9, self.vco_max/1e9)
                         if vco > self.vco_max or vco < self.vco_min:
@@ -75,8 +85,8 @@ class xilinx_bf(fpga):
         ):
             raise Exception("fpga_ref_clock not within range")
 
-        for m in [1, 2, 3, 4]:
-            for d in [1, 2, 4, 8, 16]:
+        for m in QPLL_M:
+            for d in QPLL_D:
                 for n in self.N:
                     vco = fpga_ref_clock * n / m
                     if self.vco1_min <= vco <= self.vco1_max:
@@ -115,3 +125,119 @@ class xilinx_bf(fpga):
                         }
 
         raise Exception("No valid QPLL configuration found")
+
+    def determine_cpll_batch(self, bit_clocks, fpga_ref_clocks):
+        """Find every CPLL configuration for all lane rate/reference pairs
+
+        Vectorized form of determine_cpll. All combinations of lane rate,
+        reference clock, M, D, N1 and N2 are evaluated at once with exact
+        integer arithmetic.
+
+        Parameters:
+            bit_clocks:
+                Lane rate or sequence of lane rates in bits/second
+            fpga_ref_clocks:
+                Reference clock or sequence of reference clocks
+
+        Returns:
+            List of configuration dicts, each extended with the
+            "bit_clock" and "fpga_ref_clock" it belongs to. Entries are
+            ordered by lane rate, then reference, then the search order of
+            determine_cpll, so the first entry for a pair is what
+            determine_cpll would return.
+        """
+        rates = as_rate_array(bit_clocks, "bit_clocks", integer=True)
+        refs = as_rate_array(fpga_ref_clocks, "fpga_ref_clocks", integer=True)
+
+        rate = rates[:, None, None, None, None, None]
+        ref = refs[None, :, None, None, None, None]
+        m = np.array(CPLL_M)[:, None, None, None]
+        d = np.array(CPLL_D)[:, None, None]
+        n1 = np.array(CPLL_N1)[:, None]
+        n2 = np.array(CPLL_N2)
+
+        vco = ref * n1 * n2 / m
+        in_range = (vco >= self.vco_min) & (vco <= self.vco_max)
+        # ref / m / d == bit_clock / (2 * n1 * n2)
+        match = ref * 2 * n1 * n2 == rate * m * d
+        valid = np.broadcast_to(in_range & match, match.shape)
+
+        configs = []
+        for ri, fi, mi, di, n1i, n2i in zip(*np.nonzero(valid)):
+            configs.append(
+                {
+                    "bit_clock": int(rates[ri]),
+                    "fpga_ref_clock": int(refs[fi]),
+                    "vco": float(vco[0, fi, mi, 0, n1i, n2i]),
+                    "d": CPLL_D[di],
+                    "m": CPLL_M[mi],
+                    "n1": CPLL_N1[n1i],
+                    "n2": CPLL_N2[n2i],
+                    "type": "CPLL",
+                }
+            )
+        return configs
+
+    def determine_qpll_batch(self, bit_clocks, fpga_ref_clocks):
+        """Find every QPLL configuration for all lane rate/reference pairs
+
+        Vectorized form of determine_qpll. References outside of
+        [ref_clock_min, ref_clock_max] produce no configurations instead of
+        raising.
+
+        Parameters:
+            bit_clocks:
+                Lane rate or sequence of lane rates in bits/second
+            fpga_ref_clocks:
+                Reference clock or sequence of reference clocks
+
+        Returns:
+            List of configuration dicts, each extended with the
+            "bit_clock" and "fpga_ref_clock" it belongs to. Entries are
+            ordered by lane rate, then reference, then the search order of
+            determine_qpll, so the first entry for a pair is what
+            determine_qpll would return.
+        """
+        rates = as_rate_array(bit_clocks, "bit_clocks", integer=True)
+        refs = as_rate_array(fpga_ref_clocks, "fpga_ref_clocks", integer=True)
+
+        transceiver_type = self.transceiver_type or getattr(
+            self, "transciever_type", ""
+        )
+        # Last axis is qty4_full_rate: lane rate = VCO / D (0) or 2x (1)
+        full_rate = [0, 1] if transceiver_type == "GTY4" else [0]
+
+        rate = rates[:, None, None, None, None, None]
+        ref = refs[None, :, None, None, None, None]
+        m = np.array(QPLL_M)[:, None, None, None]
+        d = np.array(QPLL_D)[:, None, None]
+        n_values = list(self.N)
+        n = np.array(n_values, dtype=np.int64)[:, None]
+        fr = np.array(full_rate, dtype=np.int64)
+
+        ref_ok = (refs >= self.ref_clock_min) & (refs <= self.ref_clock_max)
+        vco = ref * n / m
+        band1 = (vco >= self.vco1_min) & (vco <= self.vco1_max)
+        band0 = (vco >= self.vco0_min) & (vco <= self.vco0_max)
+        # ref / m / d == bit_clock / n / (1 + full_rate)
+        match = ref * n * (1 + fr) == rate * m * d
+        valid = (
+            match & (band1 | band0) & ref_ok[None, :, None, None, None, None]
+        )
+
+        configs = []
+        for ri, fi, mi, di, ni, fri in zip(*np.nonzero(valid)):
+            configs.append(
+                {
+                    "bit_clock": int(rates[ri]),
+                    "fpga_ref_clock": int(refs[fi]),
+                    "vco": float(vco[0, fi, mi, 0, ni, 0]),
+                    "band": 1 if band1[0, fi, mi, 0, ni, 0] else 0,
+                    "d": QPLL_D[di],
+                    "m": QPLL_M[mi],
+                    "n": n_values[ni],
+                    "qty4_full_rate": full_rate[fri],
+                    "type": "QPLL",
+                }
+            )
+        return configs
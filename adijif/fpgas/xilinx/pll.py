@@ -1,13 +1,21 @@
 """Xilinx Common PLL class."""
 
 import copy
-from typing import Any, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from docplex.cp.solution import CpoSolveResult  # type: ignore
 
+from ... import gekko_rundir
 from ...common import core
 from ...gekko_trans import gekko_translation
 from ...solvers import CpoModel
+from .rates import as_rate_array
+
+
+def _rate_value(value: float) -> Union[int, float]:
+    """Report integer-valued rates as int."""
+    return int(value) if value == round(value) else float(value)
 
 
 class XilinxPLL(core, gekko_translation):
@@ -167,8 +175,7 @@ class XilinxPLL(core, gekko_translation):
             "minlp_gap_tol 0.1",
         ]
 
-        self.model.solve(disp=False)
-        self.model.cleanup()
+        gekko_rundir.solve(self.model, disp=False)
         return False
 
     # def _add_objective(self, sysrefs: List) -> None:
@@ -199,6 +206,72 @@ class XilinxPLL(core, gekko_translation):
         else:
             raise Exception(f"Unknown solver {self.solver}")
 
+    def plls_in_use(self) -> List["PLLCommon"]:
+        """PLLs the solver may select, honouring the force_* flags.
+
+        Returns:
+            List[PLLCommon]: Forced PLL, or every PLL when none is forced
+        """
+        assert self.plls, "No PLLs configured. Run the add_plls method"
+        forced = [
+            pll
+            for name, pll in self.plls.items()
+            if getattr(self, "force_" + name.lower(), False)
+        ]
+        return forced or list(self.plls.values())
+
+    def enumerate_plls(
+        self,
+        bit_clocks: Union[float, List[float]],
+        fpga_ref_clocks: Union[float, List[float]],
+    ) -> List[Dict]:
+        """Find every PLL setting for all lane rate/reference pairs.
+
+        Exact alternative to a standalone solve. Each PLL in use is searched
+        over its current M/N/D (and CLKOUTRATE) selections with its VCO
+        limits, without building a solver model.
+
+        Args:
+            bit_clocks (float, List[float]): Lane rates in bits/second
+            fpga_ref_clocks (float, List[float]): Reference clocks in Hz
+
+        Returns:
+            List[Dict]: Settings in the format of get_config, extended with
+                "bit_clock" and "fpga_ref_clock". Ordered by lane rate, then
+                reference, then PLL.
+        """
+        configs = []
+        for pll in self.plls_in_use():
+            configs.extend(pll.enumerate_settings(bit_clocks, fpga_ref_clocks))
+        configs.sort(key=lambda c: (c["bit_clock"], c["fpga_ref_clock"]))
+        return configs
+
+    def ref_clock_candidates(
+        self,
+        bit_clock: float,
+        ref_clock_min: float = 0,
+        ref_clock_max: float = np.inf,
+    ) -> Optional[np.ndarray]:
+        """Reference clocks any PLL in use can convert to a lane rate.
+
+        Args:
+            bit_clock (float): Lane rate in bits/second
+            ref_clock_min (float): Lowest reference clock in Hz
+            ref_clock_max (float): Highest reference clock in Hz
+
+        Returns:
+            np.ndarray: Sorted unique reference clocks, or None when a PLL
+                in use runs in fractional-N mode and cannot be enumerated
+        """
+        plls = self.plls_in_use()
+        if any(not pll.integer_mode(bit_clock) for pll in plls):
+            return None
+        refs = [
+            pll.ref_clock_candidates(bit_clock, ref_clock_min, ref_clock_max)
+            for pll in plls
+        ]
+        return np.unique(np.concatenate(refs))
+
 
 class PLLCommon(gekko_translation):
     """Common PLL class for Xilinx and Intel PLLs."""
@@ -253,3 +326,145 @@ class PLLCommon(gekko_translation):
             CpoSolveResult: Solution object from solver
         """
         return self.parent._solution
+
+    def integer_mode(self, bit_clock: float) -> bool:
+        """Check if the PLL only uses integer dividers at a lane rate.
+
+        Args:
+            bit_clock (float): Lane rate in bits/second
+
+        Returns:
+            bool: False when fractional-N feedback is enabled
+        """
+        return True
+
+    def _dividers(self) -> Dict[str, List[int]]:
+        """Current divider selections in search order.
+
+        Raises:
+            NotImplementedError: PLL does not support setting enumeration
+        """
+        raise NotImplementedError(
+            f"Setting enumeration not supported for {type(self).__name__}"
+        )
+
+    def _ratios(self, div: Dict[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+        """Integer-mode PLL relations for flattened divider settings.
+
+        Args:
+            div (Dict[str, np.ndarray]): Divider values, one entry per
+                setting
+
+        Returns:
+            Tuple[np.ndarray, ...]: Integer factors ``(a, b, vn, vd)`` with
+                ``bit_clock * a == ref * b`` and ``vco == ref * vn / vd``
+
+        Raises:
+            NotImplementedError: PLL does not support setting enumeration
+        """
+        raise NotImplementedError(
+            f"Setting enumeration not supported for {type(self).__name__}"
+        )
+
+    def _vco_valid(
+        self, vco: np.ndarray, div: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """Mask of VCO frequencies within the PLL limits."""
+        return (vco >= self.vco_min) & (vco <= self.vco_max)
+
+    def _settings(self) -> Tuple:
+        """Flatten the divider selections and evaluate the PLL relations."""
+        dividers = {
+            name: list(np.atleast_1d(values))
+            for name, values in self._dividers().items()
+        }
+        grids = np.meshgrid(*dividers.values(), indexing="ij")
+        div = {
+            name: grid.ravel().astype(np.int64)
+            for name, grid in zip(dividers, grids, strict=True)
+        }
+        return (div, *self._ratios(div))
+
+    def _check_integer_mode(self, rates: np.ndarray) -> None:
+        """Reject lane rates where the PLL runs in fractional-N mode."""
+        for rate in rates:
+            if not self.integer_mode(rate):
+                raise Exception(
+                    f"{self._pname.upper()} uses fractional-N dividers at "
+                    f"{rate} bps and cannot be enumerated. "
+                    "Set force_integer_mode to search integer settings."
+                )
+
+    def enumerate_settings(
+        self,
+        bit_clocks: Union[float, List[float]],
+        fpga_ref_clocks: Union[float, List[float]],
+    ) -> List[Dict]:
+        """Find every setting of this PLL for all lane rate/reference pairs.
+
+        All combinations of lane rate, reference clock and the current
+        divider selections are evaluated at once. Products of integer rates
+        and dividers stay below 2**53, so matches are exact.
+
+        Args:
+            bit_clocks (float, List[float]): Lane rates in bits/second
+            fpga_ref_clocks (float, List[float]): Reference clocks in Hz
+
+        Returns:
+            List[Dict]: Settings in the format of get_config, extended with
+                "bit_clock" and "fpga_ref_clock". Ordered by lane rate, then
+                reference, then divider search order.
+
+        Raises:
+            Exception: PLL uses fractional-N dividers at a lane rate
+        """
+        rates = as_rate_array(bit_clocks, "bit_clocks")
+        refs = as_rate_array(fpga_ref_clocks, "fpga_ref_clocks")
+        self._check_integer_mode(rates)
+        div, a, b, vn, vd = self._settings()
+
+        vco = refs[:, None] * vn / vd
+        valid = (rates[:, None, None] * a == refs[None, :, None] * b) & (
+            self._vco_valid(vco, div)
+        )
+
+        configs = []
+        for ri, fi, k in zip(*np.nonzero(valid), strict=True):
+            config = {
+                "bit_clock": _rate_value(rates[ri]),
+                "fpga_ref_clock": _rate_value(refs[fi]),
+                "type": self._pname,
+            }
+            config.update({name: int(div[name][k]) for name in div})
+            config["vco"] = float(vco[fi, k])
+            configs.append(config)
+        return configs
+
+    def ref_clock_candidates(
+        self,
+        bit_clock: float,
+        ref_clock_min: float = 0,
+        ref_clock_max: float = np.inf,
+    ) -> np.ndarray:
+        """Reference clocks this PLL can convert to a lane rate.
+
+        Args:
+            bit_clock (float): Lane rate in bits/second
+            ref_clock_min (float): Lowest reference clock in Hz
+            ref_clock_max (float): Highest reference clock in Hz
+
+        Returns:
+            np.ndarray: Sorted unique reference clocks
+
+        Raises:
+            Exception: PLL uses fractional-N dividers at the lane rate
+        """
+        self._check_integer_mode(np.array([bit_clock]))
+        div, a, b, vn, vd = self._settings()
+        refs = bit_clock * a / b
+        keep = (
+            self._vco_valid(refs * vn / vd, div)
+            & (refs >= ref_clock_min)
+            & (refs <= ref_clock_max)
+        )
+        return np.unique(refs[keep])
@@ -0,0 +1,32 @@
+"""Input validation shared by the transceiver PLL enumeration searches."""
+
+from typing import List, Union
+
+import numpy as np
+
+
+def as_rate_array(
+    values: Union[float, List[float]], name: str, integer: bool = False
+) -> np.ndarray:
+    """Convert a scalar or sequence of rates to a 1-D array.
+
+    Args:
+        values (float, List[float]): Rate or rates in Hz
+        name (str): Argument name used in error messages
+        integer (bool): Require integer-valued rates and return int64
+
+    Returns:
+        np.ndarray: 1-D float array, or int64 when ``integer`` is set
+
+    Raises:
+        ValueError: Not a scalar or 1-D sequence, or a rate is not integer
+            valued when ``integer`` is set
+    """
+    arr = np.atleast_1d(np.asarray(values, dtype=float))
+    if arr.ndim != 1:
+        raise ValueError(f"{name} must be a scalar or 1-D sequence")
+    if not integer:
+        return arr
+    if not np.all(arr == np.round(arr)):
+        raise ValueError(f"{name} must be integer valued")
+    return arr.astype(np.int64)
@@ -1,7 +1,8 @@
 """7 series transceiver model."""
 
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 
+import numpy as np
 from docplex.cp.modeler import if_then
 
 from ...converters.converter import converter as conv
@@ -92,6 +93,8 @@ class SevenSeries(XilinxPLL):
 class CPLL(PLLCommon):
     """Channel PLL (CPLL) for 7 series FPGAs."""
 
+    _pname = "cpll"
+
     @property
     def vco_min(self) -> int:
         """Get the minimum VCO frequency for the transceiver type.
@@ -289,10 +292,21 @@ class CPLL(PLLCommon):
 
         return config
 
+    def _dividers(self) -> Dict[str, List[int]]:
+        """Current divider selections in search order."""
+        return {"m": self.M, "d": self.D, "n1": self.N1, "n2": self.N2}
+
+    def _ratios(self, div: Dict[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+        """CPLL relations: bit_clock * D * M == ref * N1 * N2 * 2."""
+        n = div["n1"] * div["n2"]
+        return div["m"] * div["d"], 2 * n, n, div["m"]
+
 
 class QPLL(PLLCommon):
     """QPLL for 7 series FPGAs."""
 
+    _pname = "qpll"
+
     M_available = [1, 2, 3, 4]
     _M = [1, 2, 3, 4]
 
@@ -540,3 +554,27 @@ class QPLL(PLLCommon):
         )
 
         return pll_config
+
+    def _dividers(self) -> Dict[str, List[int]]:
+        """Current divider selections in search order."""
+        return {"m": self.M, "d": self.D, "n": self.N}
+
+    def _ratios(self, div: Dict[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+        """QPLL relations: bit_clock * D * M == ref * N."""
+        return div["m"] * div["d"], div["n"], div["n"], div["m"]
+
+    def _vco_valid(
+        self, vco: np.ndarray, div: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """Mask of VCO frequencies within the QPLL band limits.
+
+        Raises:
+            Exception: Unsupported transceiver type.
+        """
+        if self.parent.transceiver_type[:3] == "GTH":
+            return super()._vco_valid(vco, div)
+        elif self.parent.transceiver_type[:3] == "GTX":
+            lower = (vco >= int(self.vco_min)) & (vco <= int(8e9))
+            upper = (vco >= int(9.8e9)) & (vco <= int(self.vco_max))
+            return (lower & (div["d"] <= 8)) | upper
+        raise Exception("Unsupported transceiver type")
@@ -1,14 +1,15 @@
 """Ultrascale+ PLLs transceiver models."""
 
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 
+import numpy as np
 from docplex.cp.modeler import if_then
 
 from ...common import core
 from ...converters.converter import converter as conv
 from ...gekko_trans import gekko_translation
 from ...solvers import CpoIntVar, GK_Intermediate, GK_Operators, GKVariable
-from .pll import XilinxPLL
+from .pll import PLLCommon, XilinxPLL
 from .sevenseries import CPLL as SevenSeriesCPLL
 from .sevenseries import QPLL as SevenSeriesQPLL
 
@@ -486,6 +487,37 @@ class QPLL(SevenSeriesQPLL):
 
         return config
 
+    def integer_mode(self, bit_clock: float) -> bool:
+        """Check if the QPLL only uses integer dividers at a lane rate.
+
+        Args:
+            bit_clock (float): Lane rate in bits/second
+
+        Returns:
+            bool: False when fractional-N feedback is enabled
+        """
+        return self.force_integer_mode or bit_clock >= 28.1e9
+
+    def _dividers(self) -> Dict[str, List[int]]:
+        """Current divider selections in search order."""
+        return {
+            "m": self.M,
+            "d": self.D,
+            "n": self.N,
+            "clkout_rate": self.QPLL_CLKOUTRATE,
+        }
+
+    def _ratios(self, div: Dict[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+        """QPLL relations: bit_clock * D * M * CLKOUTRATE == ref * N * 2."""
+        m_clk = div["m"] * div["clkout_rate"]
+        return m_clk * div["d"], 2 * div["n"], div["n"], m_clk
+
+    def _vco_valid(
+        self, vco: np.ndarray, div: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """Mask of VCO frequencies within the QPLL limits."""
+        return PLLCommon._vco_valid(self, vco, div)
+
 
 class QPLL1(QPLL):
     """QPLL1 model for Ultrascale+ transceivers."""
@@ -12,8 +12,9 @@ References:
 - DS957 Versal AI Core Data Sheet
 """
 
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 
+import numpy as np
 from docplex.cp.modeler import if_then
 
 from ...common import core
@@ -437,6 +438,25 @@ class RPLL(PLLCommon):
 
         return config
 
+    def integer_mode(self, bit_clock: float) -> bool:
+        """Check if the RPLL only uses integer dividers at a lane rate.
+
+        Args:
+            bit_clock (float): Lane rate in bits/second
+
+        Returns:
+            bool: False when fractional-N feedback is enabled
+        """
+        return self.force_integer_mode
+
+    def _dividers(self) -> Dict[str, List[int]]:
+        """Current divider selections in search order."""
+        return {"m": self.M, "d": self.D, "n": self.N}
+
+    def _ratios(self, div: Dict[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+        """RPLL relations: bit_clock * D * M == ref * N * 2."""
+        return div["m"] * div["d"], 2 * div["n"], div["n"], div["m"]
+
 
 class LCPLL(PLLCommon):
     """LC-Tank PLL (LCPLL) for Versal transceivers.
@@ -802,3 +822,28 @@ class LCPLL(PLLCommon):
         )
 
         return config
+
+    def integer_mode(self, bit_clock: float) -> bool:
+        """Check if the LCPLL only uses integer dividers at a lane rate.
+
+        Args:
+            bit_clock (float): Lane rate in bits/second
+
+        Returns:
+            bool: False when fractional-N feedback is enabled
+        """
+        return self.force_integer_mode
+
+    def _dividers(self) -> Dict[str, List[int]]:
+        """Current divider selections in search order."""
+        return {
+            "m": self.M,
+            "d": self.D,
+            "n": self.N,
+            "clkout_rate": self.LCPLL_CLKOUTRATE,
+        }
+
+    def _ratios(self, div: Dict[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+        """LCPLL relations: bit_clock * D * M * CLKOUTRATE == ref * N * 2."""
+        m_d_clk = div["m"] * div["d"] * div["clkout_rate"]
+        return m_d_clk, 2 * div["n"], div["n"], div["m"]
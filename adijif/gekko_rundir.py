@@ -0,0 +1,202 @@
+"""Managed run directories for the GEKKO solver backend.
+
+GEKKO writes every model to a fresh ``tempfile.mkdtemp`` folder when the
+model is created, whether or not it is ever solved, and leaves it behind
+unless ``cleanup`` is called. Models created through :func:`new_model`
+instead get a run directory of their own under a per-process folder in a
+configurable base directory (for example a tmpfs mount such as
+``/dev/shm``). No two live models ever share a directory: the topology
+key only names the directory, and once a model is garbage collected its
+directory is emptied and handed to the next model with the same key.
+Solving through :func:`solve` empties the directory after every solve,
+successful or not, and all managed directories are removed when the
+interpreter exits.
+
+The base directory is taken from :func:`set_run_dir_base`, then the
+``ADIJIF_GEKKO_RUN_DIR`` environment variable, then the system temporary
+directory.
+"""
+
+import atexit
+import os
+import re
+import shutil
+import tempfile
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Set
+
+from adijif.solvers import GEKKO
+
+RUN_DIR_ENV = "ADIJIF_GEKKO_RUN_DIR"
+
+_base_dir: Optional[str] = None
+_lock = threading.Lock()
+_run_dirs: Dict[str, str] = {}
+_idle_dirs: Dict[str, List[str]] = {}
+_kept_dirs: Set[str] = set()
+_stats = {"created": 0, "reused": 0, "cleared": 0}
+
+
+def set_run_dir_base(path: Optional[str]) -> None:
+    """Select the directory managed GEKKO run directories are created in.
+
+    Existing run directories stay where they are; only directories created
+    afterwards use the new base.
+
+    Args:
+        path (str): Base directory, or None to fall back to
+            ``ADIJIF_GEKKO_RUN_DIR`` or the system temporary directory
+    """
+    global _base_dir
+    _base_dir = path
+
+
+def get_run_dir_base() -> str:
+    """Get the base directory of managed GEKKO run directories.
+
+    Returns:
+        str: Base directory path
+    """
+    return _base_dir or os.environ.get(RUN_DIR_ENV) or tempfile.gettempdir()
+
+
+def _process_dir() -> str:
+    """Directory holding this process's run directories."""
+    return os.path.join(get_run_dir_base(), f"adijif-gekko-{os.getpid()}")
+
+
+def _lease_run_dir(key: str) -> str:
+    """Take an idle run directory of a key, or create a new one."""
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+    with _lock:
+        idle = _idle_dirs.get(safe)
+        if idle:
+            _stats["reused"] += 1
+            return idle.pop()
+    process_dir = _process_dir()
+    os.makedirs(process_dir, exist_ok=True)
+    path = tempfile.mkdtemp(prefix=f"{safe}-", dir=process_dir)
+    with _lock:
+        _run_dirs[path] = safe
+        _stats["created"] += 1
+    return path
+
+
+def _release_run_dir(path: str) -> None:
+    """Return the run directory of a collected model to its key's pool."""
+    with _lock:
+        safe = _run_dirs.get(path)
+        if safe is None or path in _kept_dirs:
+            # Removed by cleanup_run_dirs, or holding files kept for
+            # debugging that the next model must not overwrite
+            return
+    _clear_dir(path)
+    with _lock:
+        if path in _run_dirs:
+            _idle_dirs.setdefault(safe, []).append(path)
+
+
+def new_model(key: str = "model") -> GEKKO:
+    """Create a local GEKKO model that writes into a managed run directory.
+
+    Args:
+        key (str): Topology key naming the run directory. The directory is
+            used by this model alone and is recycled for a later model with
+            the same key once this one is garbage collected.
+
+    Returns:
+        GEKKO: New model with ``remote=False``
+    """
+    model = GEKKO(remote=False)
+    # GEKKO has no option to choose its run directory: it always creates a
+    # temporary folder and keeps it in the private ``_path`` (``path`` is
+    # the public alias). Swap in a managed directory only where that layout
+    # is present; otherwise leave the model in GEKKO's own folder.
+    own_path = getattr(model, "_path", None)
+    if not isinstance(own_path, str):
+        return model
+    path = _lease_run_dir(key)
+    shutil.rmtree(own_path, ignore_errors=True)
+    model._path = model.path = path
+    weakref.finalize(model, _release_run_dir, path)
+    return model
+
+
+def _clear_dir(path: str) -> None:
+    """Remove the contents of a directory, keeping the directory."""
+    if not os.path.isdir(path):
+        return
+    for entry in os.scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+def clear_run_dir(model: GEKKO) -> None:
+    """Remove the files a model wrote, keeping its directory for reuse.
+
+    Args:
+        model (GEKKO): Model whose run directory is emptied
+    """
+    _clear_dir(model._path)
+    with _lock:
+        _kept_dirs.discard(model._path)
+        _stats["cleared"] += 1
+
+
+def solve(model: GEKKO, keep_files: bool = False, **kwargs: Any) -> None:
+    """Solve a GEKKO model and clean its run directory afterwards.
+
+    Args:
+        model (GEKKO): Model to solve
+        keep_files (bool): Leave the model files in place for debugging
+        **kwargs: Passed to ``GEKKO.solve``
+    """
+    # A previous GEKKO cleanup() may have removed an unmanaged directory
+    os.makedirs(model._path, exist_ok=True)
+    try:
+        model.solve(**kwargs)
+    finally:
+        if keep_files:
+            with _lock:
+                _kept_dirs.add(model._path)
+            print(f"GEKKO run files kept in {model._path}")
+        else:
+            clear_run_dir(model)
+
+
+def run_dir_stats() -> Dict[str, int]:
+    """Count managed run directory operations since start-up.
+
+    Returns:
+        Dict[str, int]: ``created`` and recycled (``reused``) directories,
+        ``cleared`` solves and currently ``active`` directories
+    """
+    with _lock:
+        stats = dict(_stats)
+        stats["active"] = len(_run_dirs)
+    return stats
+
+
+def cleanup_run_dirs() -> None:
+    """Remove every run directory created by this process."""
+    with _lock:
+        paths = list(_run_dirs)
+        _run_dirs.clear()
+        _idle_dirs.clear()
+        _kept_dirs.clear()
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+    for parent in {os.path.dirname(p) for p in paths}:
+        try:
+            os.rmdir(parent)
+        except OSError:
+            pass
+
+
+atexit.register(cleanup_run_dirs)
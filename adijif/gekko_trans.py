@@ -1,6 +1,6 @@
 """Translation methods for solvers and module."""
 
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 
@@ -17,6 +17,75 @@ from adijif.solvers import (
 )
 
 
+class SolutionSnapshot:
+    """Flat name to value view of a CPLEX solve result.
+
+    ``CpoSolveResult.get_value`` resolves a variable solution object on every
+    call. Building this snapshot reads every variable and KPI value once, so
+    the many ``_get_val`` lookups made while extracting component configs
+    become plain dictionary hits. It can be passed anywhere a
+    ``CpoSolveResult`` is accepted by ``get_config`` methods.
+    """
+
+    def __init__(self, result: CpoSolveResult) -> None:
+        """Read all variable and KPI values from a solve result.
+
+        Args:
+            result (CpoSolveResult): Result returned by ``CpoModel.solve``
+        """
+        self.result = result
+        self.solve_status = result.get_solve_status()
+        self.values: Dict[str, Any] = {}
+        solution = result.get_solution()
+        if solution is not None:
+            for var in solution.get_all_var_solutions():
+                self.values[var.get_name()] = var.get_value()
+        self.kpis: Dict[str, Any] = dict(result.get_kpis() or {})
+
+    def is_solution(self) -> bool:
+        """Check if the snapshot holds a solution.
+
+        Returns:
+            bool: True if the solver found a solution
+        """
+        return self.result.is_solution()
+
+    def get_kpis(self) -> Dict[str, Any]:
+        """Get KPI values of the solution.
+
+        Returns:
+            Dict[str, Any]: KPI values keyed by publish name
+        """
+        return self.kpis
+
+    def get_value(self, expr: Union[str, CpoExpr]) -> Any:
+        """Get the value of a variable or KPI.
+
+        Args:
+            expr (str, CpoExpr): Variable, variable name or KPI name
+
+        Returns:
+            Any: Solved value
+        """
+        name = expr if isinstance(expr, str) else expr.get_name()
+        if name in self.values:
+            return self.values[name]
+        if name in self.kpis:
+            return self.kpis[name]
+        return self.result.get_value(expr)
+
+    def __getitem__(self, expr: Union[str, CpoExpr]) -> Any:
+        """Get the value of a variable or KPI.
+
+        Args:
+            expr (str, CpoExpr): Variable, variable name or KPI name
+
+        Returns:
+            Any: Solved value
+        """
+        return self.get_value(expr)
+
+
 class gekko_translation:
     """Collection of utility functions to translate to and from solver types."""
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import re
 from copy import deepcopy
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Literal
+from typing import IO, Any, Iterator, Literal
 
 CONTRACT_NAME = "adi.jif-dt"
 CONTRACT_VERSION = "1.0"
@@ -26,6 +27,30 @@ def _integer_hz(value: Any, field_name: str) -> int:
     return converted
 
 
+def _check_json_value(value: Any, where: str) -> None:
+    """Reject values that ``json.dumps`` could not serialize."""
+    if value is None or isinstance(value, (str, int, float)):
+        return
+    if isinstance(value, (list, tuple)):
+        for index, item in enumerate(value):
+            _check_json_value(item, f"{where}[{index}]")
+        return
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key is not None and not isinstance(key, (str, int, float)):
+                raise TypeError(f"{where} has non-JSON key {key!r}")
+            _check_json_value(item, f"{where}.{key}")
+        return
+    raise TypeError(
+        f"{where} holds {type(value).__name__}, which is not JSON serializable"
+    )
+
+
+def _is_gzip_path(path: str | Path) -> bool:
+    """Return whether *path* names a gzip-compressed JSON-lines file."""
+    return str(path).endswith(".gz")
+
+
 @dataclass(frozen=True)
 class Producer:
     """Identity of the package that generated a contract."""
@@ -152,8 +177,12 @@ class JifDtContract:
             duplicates = sorted({item for item in ids if ids.count(item) > 1})
             if duplicates:
                 raise ValueError(f"duplicate {kind} IDs: {duplicates}")
-        # Reject backend objects hidden in extension dictionaries.
-        json.dumps(self.to_dict())
+        # Reject backend objects hidden in extension dictionaries. Typed
+        # fields are validated by their own dataclasses, so only the free-form
+        # dictionaries need walking instead of serializing the whole contract.
+        _check_json_value(self.metadata, "metadata")
+        for link in self.jesd_links:
+            _check_json_value(link.fpga_config, f"{link.id}.fpga_config")
 
     def to_dict(self) -> dict[str, Any]:
         """Return a detached JSON-compatible snapshot."""
@@ -167,6 +196,38 @@ class JifDtContract:
         """Write deterministic interchange JSON to *path*."""
         Path(path).write_text(self.to_json())
 
+    def to_json_line(self) -> str:
+        """Serialize the contract as one compact, deterministic JSON line."""
+        return (
+            json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+            + "\n"
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "JifDtContract":
+        """Rebuild and revalidate a contract from :meth:`to_dict` output."""
+        data = deepcopy(data)
+        links = tuple(
+            JesdLink(
+                **{
+                    **link,
+                    "parameters": JesdParameters(**link["parameters"]),
+                }
+            )
+            for link in data["jesd_links"]
+        )
+        return cls(
+            producer=Producer(**data["producer"]),
+            jesd_links=links,
+            clock_requirements=tuple(
+                ClockRequirement(**clock)
+                for clock in data["clock_requirements"]
+            ),
+            metadata=data.get("metadata", {}),
+            schema=data["schema"],
+            version=data["version"],
+        )
+
     @classmethod
     def from_system_solution(
         cls, system: Any, solution: dict[str, Any]
@@ -235,6 +296,67 @@ class JifDtContract:
         )
 
 
+class JifDtWriter:
+    """Stream contracts to a JSON-lines file, one contract per line.
+
+    Paths ending in ``.gz`` are gzip-compressed. Each contract is serialized
+    and written as soon as it is passed to :meth:`write`, so memory stays
+    flat across large sweeps::
+
+        with JifDtWriter("sweep.jsonl.gz") as writer:
+            for sample_rate in rates:
+                ...
+                writer.write(sys.export_config(format="adi.jif-dt"))
+    """
+
+    def __init__(self, path: str | Path, *, append: bool = False) -> None:
+        """Open *path* for writing, truncating it unless *append* is set."""
+        self.path = Path(path)
+        mode = "at" if append else "wt"
+        self._file: IO[str]
+        if _is_gzip_path(self.path):
+            self._file = gzip.open(self.path, mode, encoding="utf-8")
+        else:
+            self._file = open(self.path, mode, encoding="utf-8")
+        self.count = 0
+
+    def write(self, contract: JifDtContract) -> None:
+        """Append one contract to the stream."""
+        self._file.write(contract.to_json_line())
+        self.count += 1
+
+    def close(self) -> None:
+        """Flush and close the underlying file."""
+        self._file.close()
+
+    def __enter__(self) -> "JifDtWriter":
+        """Return the writer for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the file when leaving the context."""
+        self.close()
+
+
+def iter_contracts(path: str | Path) -> Iterator[JifDtContract]:
+    """Lazily read contracts written by :class:`JifDtWriter`.
+
+    Lines are parsed and validated one at a time; blank lines are skipped.
+    """
+    opener = gzip.open if _is_gzip_path(path) else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(
+                    f"{path}:{line_number}: invalid JSON-lines record"
+                ) from error
+            yield JifDtContract.from_dict(data)
+
+
 def _clock_requirement(
     clock_name: str,
     config: dict[str, Any],
@@ -9,6 +9,7 @@ from fastmcp import FastMCP
 from adijif.agent_api import (
     _apply_config_recursively,
     _parse_vcxo,
+    configure_system_pool,
     get_component_info as _get_component_info,
     list_components as _list_components,
     query_jesd_modes as _query_jesd_modes,
@@ -103,9 +104,22 @@ def create_mcp_server() -> FastMCP:
     default=5000,
     help="The port to use if the transport is 'http'.",
 )
-def main(transport: str, port: int) -> None:
+@click.option(
+    "--pool-size",
+    type=int,
+    default=8,
+    help="Idle systems kept for reuse across requests (0 disables pooling).",
+)
+@click.option(
+    "--pool-idle",
+    type=float,
+    default=300.0,
+    help="Seconds an idle pooled system is kept before eviction.",
+)
+def main(transport: str, port: int, pool_size: int, pool_idle: float) -> None:
     """Start the pyadi-jif MCP server."""
     click.echo(f"Starting pyadi-jif MCP server with transport: {transport}")
+    configure_system_pool(pool_size, pool_idle)
     mcp = create_mcp_server()
     if transport == "http":
         click.echo(f"Listening on port: {port}")
@@ -16,14 +16,27 @@ CPLEX backend uses ``CpoModel.minimize_static_lex`` /
 ``minimize``/``maximize`` for one-tier. The gekko backend supports a single
 tier only (summed into one ``model.Obj`` call); multi-tier objectives on
 gekko raise ``NotImplementedError``.
+
+With ``lex_strategy="staged"`` multi-tier CPLEX objectives are not added to
+the model. ``apply_objectives`` returns the per-tier stages instead and
+``solve_staged`` optimizes them one at a time: each tier's optimum is fixed
+as a constraint before the next tier runs, starting from the previous
+stage's solution.
 """
 
+import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union
 
 if TYPE_CHECKING:
     from adijif.system import system
 
+# Ways to optimize objectives spanning several tiers
+LEX_STRATEGIES = ("static", "staged")
+
+# Relative slack when fixing a stage's optimum, absorbing float round-off
+_STAGE_TOL = 1e-9
+
 
 @dataclass
 class Objective:
@@ -107,8 +120,11 @@ def collect_objectives(sys_obj: "system") -> List[Objective]:
 
 
 def apply_objectives(
-    model: Any, solver: str, objectives: List[Objective]
-) -> None:
+    model: Any,
+    solver: str,
+    objectives: List[Objective],
+    lex_strategy: str = "static",
+) -> Optional[List[Tuple[int, Any, str]]]:
     """Apply collected objectives to the solver model as a lex objective.
 
     Groups objectives by ``tier``; within each tier, sums ``weight * expr``
@@ -121,14 +137,27 @@ def apply_objectives(
         solver: ``"CPLEX"`` or ``"gekko"``.
         objectives: List of Objective instances to apply. Empty list is a
             no-op.
+        lex_strategy: ``"static"`` adds one lexicographic objective.
+            ``"staged"`` leaves multi-tier CPLEX objectives off the model
+            and returns them for :func:`solve_staged`.
+
+    Returns:
+        ``(tier, expr, sense)`` per tier, highest priority first, when
+        staged solving applies; otherwise None.
 
     Raises:
         NotImplementedError: solver is ``"gekko"`` and objectives span more
             than one tier (gekko has no native lexicographic optimization).
+        ValueError: Unknown lex_strategy.
         Exception: Unknown solver name.
     """
+    if lex_strategy not in LEX_STRATEGIES:
+        raise ValueError(
+            f"lex_strategy must be one of {LEX_STRATEGIES}, "
+            f"got {lex_strategy!r}"
+        )
     if not objectives:
-        return
+        return None
 
     # Group by tier. Track the dominant sense per tier so we can pass tiers
     # whose objectives all agree on direction directly to the solver's
@@ -158,6 +187,8 @@ def apply_objectives(
         tier_sums.append(sum(exprs[1:], exprs[0]))
 
     if solver == "CPLEX":
+        if lex_strategy == "staged" and len(tier_sums) > 1:
+            return list(zip(tiers, tier_sums, tier_dominant_sense, strict=True))
         if len(tier_sums) == 1:
             if tier_dominant_sense[0] == "min":
                 model.minimize(tier_sums[0])
@@ -190,3 +221,101 @@ def apply_objectives(
         model.Obj(expr)
     else:
         raise Exception(f"Unknown solver {solver}")
+    return None
+
+
+@dataclass
+class StageResult:
+    """Outcome of one tier of a staged lexicographic solve.
+
+    Attributes:
+        tier: Objective tier optimized by the stage.
+        sense: ``"min"`` or ``"max"``.
+        value: Best objective value found, or None without a solution.
+        status: CPLEX solve status of the stage.
+        solve_time: Solver time of the stage in seconds.
+    """
+
+    tier: int
+    sense: str
+    value: Optional[float]
+    status: str
+    solve_time: float
+
+
+def solve_staged(
+    model: Any,
+    stages: List[Tuple[int, Any, str]],
+    time_limit: Union[None, float, Sequence[Optional[float]]] = None,
+    **solve_kwargs: Any,
+) -> Tuple[Any, List[StageResult]]:
+    """Optimize objective tiers one after another on a CPLEX model.
+
+    Each stage optimizes one tier, then bounds that tier by the value it
+    reached so later stages only break ties. Every stage starts from the
+    previous stage's solution. Stages run on a clone, so ``model`` is left
+    unchanged and can be solved again.
+
+    A stage that stops at its time limit still fixes the best value it
+    found. A stage that finds no solution ends the search, returning the
+    previous stage's solution.
+
+    Args:
+        model: CpoModel without an objective.
+        stages: ``(tier, expr, sense)`` per tier, as returned by
+            :func:`apply_objectives` with ``lex_strategy="staged"``.
+        time_limit: Seconds per stage, or one limit per stage. None means
+            no limit.
+        **solve_kwargs: Further ``CpoModel.solve`` arguments for every stage.
+
+    Returns:
+        Tuple of the final solve result and one StageResult per stage run.
+
+    Raises:
+        ValueError: Number of time limits does not match the stages.
+    """
+    if time_limit is None or isinstance(time_limit, (int, float)):
+        limits = [time_limit] * len(stages)
+    else:
+        limits = list(time_limit)
+        if len(limits) != len(stages):
+            raise ValueError(
+                f"Got {len(limits)} stage time limits for {len(stages)} stages"
+            )
+
+    staged = model.clone()
+    result = None
+    report: List[StageResult] = []
+    for (tier, expr, sense), limit in zip(stages, limits, strict=True):
+        # minimize/maximize add the objective and return it for removal
+        goal = (
+            staged.minimize(expr) if sense == "min" else staged.maximize(expr)
+        )
+        if result is not None:
+            staged.set_starting_point(result.get_solution())
+        kwargs = dict(solve_kwargs)
+        if limit is not None:
+            kwargs["TimeLimit"] = limit
+        start = time.perf_counter()
+        stage = staged.solve(**kwargs)
+        elapsed = stage.get_solve_time() or time.perf_counter() - start
+        if not stage.is_solution():
+            report.append(
+                StageResult(
+                    tier, sense, None, stage.get_solve_status(), elapsed
+                )
+            )
+            break
+        value = stage.get_objective_value()
+        if isinstance(value, (list, tuple)):
+            value = value[0]
+        report.append(
+            StageResult(tier, sense, value, stage.get_solve_status(), elapsed)
+        )
+        result = stage
+        staged.remove(goal)
+        slack = abs(value) * _STAGE_TOL
+        staged.add(
+            expr <= value + slack if sense == "min" else expr >= value - slack
+        )
+    return result if result is not None else stage, report
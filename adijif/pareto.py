@@ -0,0 +1,19 @@
+"""Pareto dominance helpers shared by the rate and architecture searches."""
+
+import numpy as np
+
+
+def pareto_mask(values: np.ndarray) -> np.ndarray:
+    """Flag rows not dominated by any other row.
+
+    Args:
+        values (np.ndarray): (rows, objectives) array where larger is better
+
+    Returns:
+        np.ndarray: Boolean mask of non-dominated rows
+    """
+    ge = np.all(values[:, None, :] >= values[None, :, :], axis=2)
+    gt = np.any(values[:, None, :] > values[None, :, :], axis=2)
+    # dominated[i]: some row j is at least as good everywhere and better once
+    dominated = np.any(ge & gt, axis=0)
+    return ~dominated
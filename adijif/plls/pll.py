@@ -6,6 +6,7 @@ from typing import Any, Union
 
 from docplex.cp.solution import CpoSolveResult  # type: ignore
 
+from adijif import gekko_rundir
 from adijif.common import core
 from adijif.gekko_trans import gekko_translation
 from adijif.optimization import apply_objectives
@@ -79,8 +80,7 @@ class pll(core, gekko_translation, metaclass=ABCMeta):
             "minlp_gap_tol 0.1",
         ]
 
-        self.model.solve(disp=False)
-        self.model.cleanup()
+        gekko_rundir.solve(self.model, disp=False)
         return False
 
     # def _add_objective(self, sysrefs: List) -> None:
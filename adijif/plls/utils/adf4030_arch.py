@@ -1,8 +1,12 @@
 """Utility functions for ADF4030 architecture calculations."""
 
+from collections.abc import Iterable, Sequence
 from math import ceil, floor
 
+import numpy as np
+
 from adijif.draw import Layout, Node
+from adijif.pareto import pareto_mask
 
 
 def convert_sec_into_hms(time: float) -> str:
@@ -266,6 +270,14 @@ def _connect_aions_hybrid2(aions: list, N_branch: int) -> list:
 
 ARCHITECTURES = ("cascade", "tree", "hybrid", "hybrid2")
 
+DETAIL_LEVELS = ("auto", "full", "summary")
+
+FRONTIER_OBJECTIVES = ("N_Aion_system", "Max_Aion_per_FPGA", "cascade_depth")
+
+# System-scope diagrams above this many nodes are summarized at
+# ``detail="auto"``; d2 layout time grows quickly beyond it.
+FULL_DETAIL_MAX_NODES = 400
+
 
 class Adf4030Architecture:
     """Partition descriptor for an ADF4030 (Aion) clock-distribution system.
@@ -317,6 +329,7 @@ class Adf4030Architecture:
         self.architecture = architecture
         self.N_branch = N_branch
         self._partition: dict | None = None
+        self._svg_cache: dict[tuple, str] = {}
 
     @property
     def partition(self) -> dict:
@@ -397,40 +410,175 @@ class Adf4030Architecture:
                 fpga.add_connection(c)
         return ub
 
+    def _fpga_loads(self) -> list[tuple[int, int]]:
+        """Count the Aions and Apollos hanging off each FPGA of a Unit Board.
+
+        Every Unit Board shares the same partition, so this is the template
+        the collapsed replicas of a system-scope diagram are labelled from.
+
+        Returns:
+            list[tuple[int, int]]: ``(N_Aion, N_Apollo)`` per FPGA.
+        """
+        p = self.partition
+        loads = []
+        aion_cursor = 0
+        for n_aions in p["N_Aion_per_FPGA"]:
+            apollos = p["N_Apollo_per_Aion"][
+                aion_cursor : aion_cursor + n_aions
+            ]
+            loads.append((n_aions, sum(apollos)))
+            aion_cursor += n_aions
+        return loads
+
+    def _build_collapsed_unit_board_node(self, name: str) -> Node:
+        """Construct a summarized UnitBoard subtree.
+
+        Each FPGA holds a single Aion group node, which holds a single
+        Apollo group node, named after the device counts they stand for.
+        """
+        ub = Node(name, ntype="board")
+        for fpga_i, (n_aion, n_apollo) in enumerate(self._fpga_loads()):
+            fpga = Node(f"FPGA_{fpga_i}", ntype="fpga")
+            ub.add_child(fpga)
+            if not n_aion:
+                continue
+            aions = Node(f"Aion_x{n_aion}", ntype="ic")
+            fpga.add_child(aions)
+            fpga.add_connection({"from": fpga, "to": aions})
+            apollos = Node(f"Apollo_x{n_apollo}", ntype="converter")
+            aions.add_child(apollos)
+            aions.add_connection({"from": aions, "to": apollos})
+        return ub
+
+    def _build_unit_board_range_node(self, first: int, last: int) -> Node:
+        """Construct one node standing in for a run of collapsed UnitBoards."""
+        p = self.partition
+        node = Node(f"UnitBoard_{first}_to_{last}", ntype="board")
+        node.value = (
+            f"{last - first + 1} Unit Boards with {self.N_FPGA} FPGA "
+            f"{p['N_Aion_UB']} Aion {self.N_Apollo} Apollo each"
+        )
+        return node
+
+    def _system_detail(self) -> str:
+        """Pick the system-scope detail level for ``detail="auto"``."""
+        p = self.partition
+        board_nodes = 1 + self.N_FPGA + p["N_Aion_UB"] + self.N_Apollo
+        if p["N_UB"] * board_nodes <= FULL_DETAIL_MAX_NODES:
+            return "full"
+        return "summary"
+
+    def _build_system_node(
+        self, detail: str, expand: tuple[int, ...], max_boards: int
+    ) -> Node:
+        """Construct the System node of a system-scope diagram.
+
+        At ``"full"`` detail every UnitBoard is built in full. At
+        ``"summary"`` detail the boards in ``expand`` are built in full,
+        the rest of the first ``max_boards - 1`` boards and the last board
+        are collapsed, and every other run of two or more boards is merged
+        into a single range node, which bounds the diagram size
+        independently of ``N_UB``.
+        """
+        n_ub = self.partition["N_UB"]
+        system = Node("System", ntype="system")
+        if detail == "full":
+            for i in range(n_ub):
+                system.add_child(self._build_unit_board_node(f"UnitBoard_{i}"))
+        else:
+            shown = set(expand) | set(range(min(max_boards - 1, n_ub)))
+            shown.add(n_ub - 1)
+            # A gap of one board is drawn as that board, not a range.
+            shown |= {i + 1 for i in shown if i + 2 in shown}
+            previous = -1
+            for i in sorted(shown):
+                if i - previous > 1:
+                    system.add_child(
+                        self._build_unit_board_range_node(previous + 1, i - 1)
+                    )
+                build = (
+                    self._build_unit_board_node
+                    if i in expand
+                    else self._build_collapsed_unit_board_node
+                )
+                system.add_child(build(f"UnitBoard_{i}"))
+                previous = i
+        # Inter-UB chain: feed each UnitBoard's FPGA_0 (or a range node)
+        # from the previous one's (a simple cascade between UBs).
+        entries = [
+            ub.children[0] if ub.children else ub for ub in system.children
+        ]
+        for src, dst in zip(entries, entries[1:], strict=False):
+            system.add_connection({"from": src, "to": dst})
+        return system
+
     def draw(
-        self, scope: str = "ub", path: str | None = None, theme: str = "dark"
+        self,
+        scope: str = "ub",
+        path: str | None = None,
+        theme: str = "dark",
+        detail: str = "auto",
+        expand: Iterable[int] | None = None,
+        max_boards: int = 8,
     ) -> str:
         """Render the architecture as an SVG diagram.
 
+        System-scope diagrams of large arrays are summarized: Unit Boards
+        are drawn as collapsed replicas of the board template, labelled
+        with their Aion and Apollo counts, and long runs of boards are
+        merged into one node. Rendered diagrams are kept on the instance,
+        so redrawing the same view does not invoke d2 again.
+
         Args:
             scope (str): ``"ub"`` for one Unit Board, ``"system"`` for the full multi-Unit-Board diagram.
             path (str): If set, also write the rendered SVG to this file.
             theme (str): JIF palette, either ``"light"`` or ``"dark"``.
+            detail (str): System-scope detail level. ``"full"`` draws every
+                device of every Unit Board, ``"summary"`` draws collapsed
+                boards, and ``"auto"`` draws in full unless the diagram
+                would exceed ``FULL_DETAIL_MAX_NODES`` nodes.
+            expand (Iterable[int]): Unit Board indices drawn in full at
+                ``"summary"`` detail. Defaults to the first board.
+            max_boards (int): Collapsed Unit Boards drawn individually at
+                ``"summary"`` detail before runs are merged.
 
         Returns:
             str: SVG content as a string.
 
         Raises:
-            ValueError: ``scope`` is not ``"ub"`` or ``"system"``.
+            ValueError: ``scope``, ``detail``, ``expand`` or ``max_boards``
+                is invalid.
         """
         if scope not in ("ub", "system"):
             raise ValueError(f"scope must be 'ub' or 'system', got {scope!r}")
-        lo = Layout(f"ADF4030 {self.architecture} ({scope})", theme=theme)
-        if scope == "ub":
-            lo.add_node(self._build_unit_board_node("UnitBoard"))
-        else:
-            system = Node("System", ntype="system")
-            for i in range(self.partition["N_UB"]):
-                ub = self._build_unit_board_node(f"UnitBoard_{i}")
-                system.add_child(ub)
-            # Inter-UB chain: feed UnitBoard_{i}'s FPGA_0 from
-            # UnitBoard_{i-1}'s FPGA_0 (a simple cascade between UBs).
-            for i in range(self.partition["N_UB"] - 1):
-                src = system.children[i].children[0]
-                dst = system.children[i + 1].children[0]
-                system.add_connection({"from": src, "to": dst})
-            lo.add_node(system)
-        svg = lo.draw()
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(
+                f"detail must be one of {DETAIL_LEVELS}, got {detail!r}"
+            )
+        if max_boards < 2:
+            raise ValueError(f"max_boards must be at least 2, got {max_boards}")
+        n_ub = self.partition["N_UB"]
+        expand = (0,) if expand is None else tuple(sorted(set(expand)))
+        if any(i < 0 or i >= n_ub for i in expand):
+            raise ValueError(
+                f"expand indices must be in range(N_UB={n_ub}), got {expand}"
+            )
+        if scope == "system" and detail == "auto":
+            detail = self._system_detail()
+        key: tuple = (scope, theme)
+        if scope == "system":
+            key += (detail,)
+            if detail == "summary":
+                key += (expand, max_boards)
+        svg = self._svg_cache.get(key)
+        if svg is None:
+            lo = Layout(f"ADF4030 {self.architecture} ({scope})", theme=theme)
+            if scope == "ub":
+                lo.add_node(self._build_unit_board_node("UnitBoard"))
+            else:
+                lo.add_node(self._build_system_node(detail, expand, max_boards))
+            svg = lo.draw()
+            self._svg_cache[key] = svg
         if path is not None:
             with open(path, "w") as f:
                 f.write(svg)
@@ -462,3 +610,149 @@ class Adf4030Architecture:
             "N_UB": N_UB,
             "N_Aion_system": N_UB * N_Aion_UB,
         }
+
+
+def _cascade_depths(
+    architecture: str, n_aions: int, branches: np.ndarray
+) -> np.ndarray:
+    """Longest Aion chain behind one FPGA for each branch count.
+
+    Counts the Aions on the longest path from the FPGA's root Aion, as
+    wired by the ``_connect_aions_*`` helpers.
+
+    Args:
+        architecture (str): One of ``ARCHITECTURES``.
+        n_aions (int): Aions driven by the FPGA.
+        branches (np.ndarray): Branch counts, ignored for ``"cascade"``.
+
+    Returns:
+        np.ndarray: Cascade depth per branch count.
+    """
+    if architecture == "cascade":
+        return np.full(branches.shape, n_aions)
+    if architecture == "hybrid":
+        # Walk the outer chain to a branch root, then down that branch.
+        base, extra = np.divmod(n_aions, branches)
+        return np.maximum(
+            np.where(extra > 0, extra + base, 0),
+            np.where(base > 0, branches - 1 + base, 0),
+        )
+    # tree and hybrid2: root, then the longest branch.
+    leaves = max(n_aions - 1, 0)
+    return 1 + -(-leaves // branches)
+
+
+def find_architecture_frontier(
+    N: int,
+    N_Apollo: int,
+    N_FPGA: int,
+    *,
+    architectures: Sequence[str] = ARCHITECTURES,
+    objectives: Sequence[str] = FRONTIER_OBJECTIVES,
+    max_branch: int | None = None,
+) -> list[dict]:
+    """Find the Pareto set of ADF4030 architectures for a system size.
+
+    Every architecture is evaluated with every useful ``N_branch``: from
+    1 up to the number of Aions that can head a branch behind the busiest
+    FPGA, as more branches would stay empty. The partition depends only on
+    whether the architecture is ``"cascade"`` or tree-shaped, so it is
+    computed once per family, and cascade depths for all branch counts are
+    computed in one array operation. All objectives are minimized.
+
+    Args:
+        N (int): Total Apollo devices in the system.
+        N_Apollo (int): Apollo devices per Unit Board.
+        N_FPGA (int): FPGA devices per Unit Board.
+        architectures (Sequence[str]): Architectures to consider.
+        objectives (Sequence[str]): Columns to trade off, any of
+            ``"N_Aion_system"`` (Aions in the system),
+            ``"Max_Aion_per_FPGA"`` and ``"cascade_depth"`` (Aions on the
+            longest chain behind one FPGA).
+        max_branch (int): Optional upper bound on ``N_branch``.
+
+    Returns:
+        list[dict]: Frontier points sorted by ``N_Aion_system`` then
+        ``cascade_depth``. Each holds ``architecture``, ``N_branch``,
+        ``N_UB``, ``N_Aion_UB``, ``N_Aion_system``, ``Max_Aion_per_FPGA``
+        and ``cascade_depth``, plus ``candidates`` listing every
+        ``(architecture, N_branch)`` pair with identical objective values;
+        the other columns are those of the first candidate.
+
+    Raises:
+        ValueError: Unknown architecture or objective, or a bound is not a
+            positive integer.
+    """
+    for architecture in architectures:
+        if architecture not in ARCHITECTURES:
+            raise ValueError(
+                f"Unknown architecture {architecture!r}. "
+                f"Must be one of {ARCHITECTURES}."
+            )
+    if not objectives:
+        raise ValueError("objectives must not be empty")
+    for column in objectives:
+        if column not in FRONTIER_OBJECTIVES:
+            raise ValueError(
+                f"Unknown objective {column!r}. Options: {FRONTIER_OBJECTIVES}"
+            )
+    if max_branch is not None and max_branch < 1:
+        raise ValueError(f"max_branch must be at least 1, got {max_branch}")
+    if min(N, N_Apollo, N_FPGA) < 1:
+        raise ValueError("N, N_Apollo and N_FPGA must be positive")
+
+    partitions: dict[bool, dict] = {}
+    names: list[tuple[str, int | None]] = []
+    blocks = []
+    for architecture in dict.fromkeys(architectures):
+        cascade = architecture == "cascade"
+        if cascade not in partitions:
+            partitions[cascade] = Adf4030Architecture(
+                N, N_Apollo, N_FPGA, architecture, None if cascade else 1
+            ).partition
+        p = partitions[cascade]
+        n_aions = p["Max_Aion_per_FPGA"]
+        if cascade:
+            branches = np.ones(1, dtype=int)
+        else:
+            heads = n_aions if architecture == "hybrid" else n_aions - 1
+            heads = max(heads, 1)
+            if max_branch is not None:
+                heads = min(heads, max_branch)
+            branches = np.arange(1, heads + 1)
+        depths = _cascade_depths(architecture, n_aions, branches)
+        block = np.empty((branches.size, 3), dtype=int)
+        block[:, 0] = p["N_Aion_system"]
+        block[:, 1] = n_aions
+        block[:, 2] = depths
+        blocks.append(block)
+        names.extend(
+            (architecture, None if cascade else int(b)) for b in branches
+        )
+
+    values = np.concatenate(blocks)
+    columns = [FRONTIER_OBJECTIVES.index(c) for c in dict.fromkeys(objectives)]
+    mask = pareto_mask(-values[:, columns])
+
+    frontier: dict[tuple, dict] = {}
+    for i in np.flatnonzero(mask):
+        architecture, n_branch = names[i]
+        point = tuple(int(v) for v in values[i, columns])
+        if point in frontier:
+            frontier[point]["candidates"].append((architecture, n_branch))
+            continue
+        p = partitions[architecture == "cascade"]
+        frontier[point] = {
+            "architecture": architecture,
+            "N_branch": n_branch,
+            "N_UB": p["N_UB"],
+            "N_Aion_UB": p["N_Aion_UB"],
+            "N_Aion_system": int(values[i, 0]),
+            "Max_Aion_per_FPGA": int(values[i, 1]),
+            "cascade_depth": int(values[i, 2]),
+            "candidates": [(architecture, n_branch)],
+        }
+    return sorted(
+        frontier.values(),
+        key=lambda r: (r["N_Aion_system"], r["cascade_depth"]),
+    )
@@ -0,0 +1,752 @@
+"""Local SQLite store of solved configurations.
+
+:class:`SolutionDB` records the results of :meth:`adijif.system.solve`,
+:func:`adijif.utils.find_extreme_rate` and
+:func:`adijif.utils.get_max_sample_rates` keyed by a SHA-256 of the
+canonical description of the problem: the classes and settings of every
+part, the reference and the registered objectives, together with the
+pyadi-jif version. Repeating a solve returns the stored result instead of
+running the solver again. Failures are stored only when they follow from
+the problem itself, so solves stopped by a time limit or
+:meth:`adijif.system.abort_solve` run again next time.
+
+Each record keeps its status, solve time and result, with the clock chip,
+FPGA and dev kit on the record and one indexed row per converter holding
+its sample rate, lane rate and JESD mode, so stored results can be
+queried::
+
+    db = SolutionDB("solutions.db")
+    cfg = db.solve(sys)
+    db.query(converter="AD9081", dev_kit="vcu118", lane_rate_max=16.5e9)
+
+Only the standard library ``sqlite3`` module is needed.
+"""
+
+import datetime
+import hashlib
+import json
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from adijif import __version__
+from adijif.agent_api import json_default
+
+if TYPE_CHECKING:
+    from adijif.system import system
+
+SCHEMA_VERSION = 1
+# Longer list settings (e.g. full divider ranges) are stored as a summary
+_MAX_LIST_SETTING = 256
+KINDS = ("system", "find_extreme_rate", "get_max_sample_rates")
+# Failures caused by the environment rather than the problem, never stored
+_TRANSIENT_ERRORS = (OSError, MemoryError)
+# Solver and diagram bookkeeping that does not change the problem
+_SKIP_STATE = {
+    "model",
+    "config",
+    "configs",
+    "ic_diagram_node",
+    "_last_config",
+    "_solution",
+    "_objectives",
+    "_diagram_theme",
+    "_diagram_output_dividers",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    clock TEXT COLLATE NOCASE,
+    fpga TEXT COLLATE NOCASE,
+    dev_kit TEXT COLLATE NOCASE,
+    solver TEXT,
+    solve_time REAL,
+    created TEXT NOT NULL,
+    description TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    UNIQUE (kind, key)
+);
+CREATE TABLE IF NOT EXISTS converters (
+    solution_id INTEGER NOT NULL
+        REFERENCES solutions (id) ON DELETE CASCADE,
+    device TEXT NOT NULL COLLATE NOCASE,
+    converter TEXT NOT NULL COLLATE NOCASE,
+    sample_rate REAL,
+    lane_rate REAL,
+    jesd_class TEXT,
+    jesd_mode TEXT,
+    M INTEGER,
+    L INTEGER
+);
+CREATE INDEX IF NOT EXISTS solutions_clock ON solutions (clock);
+CREATE INDEX IF NOT EXISTS solutions_fpga ON solutions (fpga);
+CREATE INDEX IF NOT EXISTS solutions_dev_kit ON solutions (dev_kit);
+CREATE INDEX IF NOT EXISTS converters_solution ON converters (solution_id);
+CREATE INDEX IF NOT EXISTS converters_device ON converters (device);
+CREATE INDEX IF NOT EXISTS converters_converter ON converters (converter);
+CREATE INDEX IF NOT EXISTS converters_sample_rate ON converters (sample_rate);
+CREATE INDEX IF NOT EXISTS converters_lane_rate ON converters (lane_rate);
+CREATE INDEX IF NOT EXISTS converters_jesd_mode ON converters (jesd_mode);
+"""
+
+
+def _encode(value: Any) -> Any:
+    """Convert numpy values and sets for canonical JSON."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return json_default(value)
+
+
+def _canonical(value: Any) -> str:
+    """Serialize JSON deterministically."""
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), default=_encode
+    )
+
+
+def _state(obj: Any) -> Dict[str, Any]:
+    """Collect the JSON-representable instance state of a part.
+
+    Unlike capture manifests, private attributes are included since most
+    settings (dividers, JESD parameters, decimation) are stored in them.
+    Lists longer than ``_MAX_LIST_SETTING`` are recorded as their count,
+    bounds and a hash of their content.
+
+    Args:
+        obj (Any): Clock, converter, FPGA, PLL, reference or system
+
+    Returns:
+        Dict[str, Any]: Attribute values keyed by name
+    """
+    state = {}
+    for name, value in sorted(vars(obj).items()):
+        if name in _SKIP_STATE or name.startswith("__"):
+            continue
+        if (
+            isinstance(value, (list, tuple, np.ndarray))
+            and len(value) > _MAX_LIST_SETTING
+        ):
+            summary = _summarize(value)
+            if summary is not None:
+                state[name] = summary
+            continue
+        try:
+            state[name] = json.loads(_canonical(value))
+        except (TypeError, ValueError):
+            continue
+    return state
+
+
+def _summarize(values: Any) -> Optional[Dict[str, Any]]:
+    """Summarize a long list setting by its count, bounds and content hash.
+
+    Returns:
+        Optional[Dict[str, Any]]: Summary, or None when not representable
+    """
+    array = np.asarray(values)
+    if array.dtype.kind in "iuf":
+        return {
+            "count": len(array),
+            "min": array.min().item(),
+            "max": array.max().item(),
+            "sha256": hashlib.sha256(
+                array.astype(np.float64).tobytes()
+            ).hexdigest(),
+        }
+    try:
+        text = _canonical(values)
+    except (TypeError, ValueError):
+        return None
+    return {
+        "count": len(array),
+        "sha256": hashlib.sha256(text.encode()).hexdigest(),
+    }
+
+
+def describe_part(part: Any) -> Optional[Dict[str, Any]]:
+    """Describe the class and settings of one part.
+
+    Args:
+        part (Any): Clock, converter, FPGA, PLL or reference. Numbers are
+            returned as is.
+
+    Returns:
+        Optional[Dict[str, Any]]: Description, or None when ``part`` is None
+    """
+    if part is None or isinstance(part, (int, float)):
+        return part
+    entry = {"class": type(part).__name__, "state": _state(part)}
+    for name in getattr(part, "_nested", None) or []:
+        entry[name] = describe_part(getattr(part, name))
+    return entry
+
+
+def describe_system(sys_obj: "system") -> Dict[str, Any]:
+    """Describe everything that determines the solution of a system.
+
+    Solving changes the state of the parts, so describe a system before
+    its first solve.
+
+    Args:
+        sys_obj (system): System to describe
+
+    Returns:
+        Dict[str, Any]: Canonical system description
+    """
+    converters = (
+        sys_obj.converter
+        if isinstance(sys_obj.converter, list)
+        else [sys_obj.converter]
+    )
+    return {
+        "system": _state(sys_obj),
+        "vcxo": describe_part(sys_obj.vcxo),
+        "clock": describe_part(sys_obj.clock),
+        "fpga": describe_part(sys_obj.fpga),
+        "converters": [describe_part(conv) for conv in converters],
+        "plls": [describe_part(pll) for pll in sys_obj._plls],
+        "plls_sysref": [describe_part(pll) for pll in sys_obj._plls_sysref],
+        "objectives": [
+            {
+                "name": obj.name,
+                "component": obj.component,
+                "sense": obj.sense,
+                "tier": obj.tier,
+                "weight": obj.weight,
+                "expr": str(obj.expr),
+            }
+            for obj in sys_obj.list_objectives()
+        ],
+    }
+
+
+def description_key(description: Dict[str, Any]) -> str:
+    """Hash a canonical description.
+
+    The pyadi-jif version is part of the hash, so results stored by another
+    release are not reused.
+
+    Args:
+        description (Dict[str, Any]): Problem description
+
+    Returns:
+        str: SHA-256 hex digest of the canonical description JSON
+    """
+    keyed = {"adijif": __version__, "description": description}
+    return hashlib.sha256(_canonical(keyed).encode()).hexdigest()
+
+
+def _problem_error(exc: Exception) -> bool:
+    """Whether a failure follows from the problem and can be stored."""
+    return not isinstance(exc, _TRANSIENT_ERRORS)
+
+
+def _dev_kit(fpga: Any) -> Optional[str]:
+    """Dev kit an FPGA was set up for, if any."""
+    name = getattr(fpga, "name", None)
+    kits = getattr(fpga, "_available_dev_kit_names", [])
+    if isinstance(name, str) and name.lower() in kits:
+        return name.lower()
+    return None
+
+
+def _converter_row(device: str, conv: Any) -> Dict[str, Any]:
+    """Indexed rates and JESD mode of a solved converter."""
+    try:
+        mode = conv._check_valid_jesd_mode()
+    except Exception:
+        mode = None
+    try:
+        lane_rate = float(conv.bit_clock)
+    except Exception:
+        lane_rate = None
+    return {
+        "device": device,
+        "converter": conv.name,
+        "sample_rate": float(conv.sample_clock),
+        "lane_rate": lane_rate,
+        "jesd_class": conv.jesd_class,
+        "jesd_mode": mode,
+        "M": conv.M,
+        "L": conv.L,
+    }
+
+
+def _system_converter_rows(sys_obj: "system") -> List[Dict[str, Any]]:
+    """Converter rows of a system, one per leaf of nested converters."""
+    converters = (
+        sys_obj.converter
+        if isinstance(sys_obj.converter, list)
+        else [sys_obj.converter]
+    )
+    rows = []
+    for conv in converters:
+        nested = getattr(conv, "_nested", None) or []
+        leaves = [getattr(conv, name) for name in nested] or [conv]
+        rows.extend(_converter_row(conv.name, leaf) for leaf in leaves)
+    return rows
+
+
+class SolutionDB:
+    """SQLite store and cache of solved configurations.
+
+    Args:
+        path (str): Database file. Defaults to an in-memory database.
+
+    Raises:
+        Exception: Database was written by an incompatible version
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """Open or create the database."""
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self._conn.close()
+            raise Exception(
+                f"{path} has solution database version {version}, "
+                f"expected {SCHEMA_VERSION}"
+            )
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "SolutionDB":
+        """Use the database as a context manager.
+
+        Returns:
+            SolutionDB: This database
+        """
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the database on leaving the context."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of stored records.
+
+        Returns:
+            int: Record count
+        """
+        return self._conn.execute("SELECT COUNT(*) FROM solutions").fetchone()[
+            0
+        ]
+
+    def record(
+        self,
+        kind: str,
+        description: Dict[str, Any],
+        *,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+        solve_time: Optional[float] = None,
+        clock: Optional[str] = None,
+        fpga: Optional[str] = None,
+        dev_kit: Optional[str] = None,
+        solver: Optional[str] = None,
+        converters: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        """Store a result, replacing any earlier one for the same problem.
+
+        Args:
+            kind (str): One of ``KINDS``
+            description (Dict[str, Any]): Canonical problem description
+            status (str): ``"solved"`` or ``"failed"``
+            result (Any): JSON-representable result
+            error (str, optional): Failure message
+            solve_time (float, optional): Wall time of the solve in seconds
+            clock (str, optional): Clock chip name
+            fpga (str, optional): FPGA class name
+            dev_kit (str, optional): FPGA dev kit name
+            solver (str, optional): Solver used
+            converters (List[Dict], optional): Indexed converter rows with
+                ``device``, ``converter``, ``sample_rate``, ``lane_rate``,
+                ``jesd_class``, ``jesd_mode``, ``M`` and ``L``
+
+        Returns:
+            int: Record id
+
+        Raises:
+            ValueError: Unknown kind
+        """
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {KINDS}, got {kind!r}")
+        key = description_key(description)
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM solutions WHERE kind = ? AND key = ?", (kind, key)
+            )
+            cursor = self._conn.execute(
+                "INSERT INTO solutions (kind, key, status, clock, fpga, "
+                "dev_kit, solver, solve_time, created, description, result, "
+                "error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    key,
+                    status,
+                    clock,
+                    fpga,
+                    dev_kit,
+                    solver,
+                    solve_time,
+                    datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    _canonical(description),
+                    None if result is None else _canonical(result),
+                    error,
+                ),
+            )
+            solution_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO converters (solution_id, device, converter, "
+                "sample_rate, lane_rate, jesd_class, jesd_mode, M, L) "
+                "VALUES (:solution_id, :device, :converter, :sample_rate, "
+                ":lane_rate, :jesd_class, :jesd_mode, :M, :L)",
+                [
+                    {"solution_id": solution_id, **row}
+                    for row in converters or []
+                ],
+            )
+        return solution_id
+
+    def lookup(
+        self, kind: str, description: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Find the stored record of a problem.
+
+        Args:
+            kind (str): One of ``KINDS``
+            description (Dict[str, Any]): Canonical problem description
+
+        Returns:
+            Optional[Dict[str, Any]]: Record, or None when not stored
+        """
+        row = self._conn.execute(
+            "SELECT * FROM solutions WHERE kind = ? AND key = ?",
+            (kind, description_key(description)),
+        ).fetchone()
+        return self._record_dict(row) if row else None
+
+    def query(
+        self,
+        *,
+        kind: Optional[str] = None,
+        status: Optional[str] = "solved",
+        converter: Optional[str] = None,
+        clock: Optional[str] = None,
+        fpga: Optional[str] = None,
+        dev_kit: Optional[str] = None,
+        jesd_class: Optional[str] = None,
+        jesd_mode: Optional[str] = None,
+        sample_rate_min: Optional[float] = None,
+        sample_rate_max: Optional[float] = None,
+        lane_rate_min: Optional[float] = None,
+        lane_rate_max: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find stored records.
+
+        Names match case-insensitively. ``converter`` matches either the
+        device (``"AD9081"``) or one of its sides (``"AD9081_RX"``). All
+        converter filters must hold for the same converter of a record.
+        Rates are in hertz and bits per second, with inclusive bounds.
+
+        Args:
+            kind (str, optional): One of ``KINDS``
+            status (str, optional): ``"solved"`` (default), ``"failed"`` or
+                None for both
+            converter (str, optional): Converter device or side name
+            clock (str, optional): Clock chip name
+            fpga (str, optional): FPGA class name, e.g. ``"xilinx"``
+            dev_kit (str, optional): FPGA dev kit, e.g. ``"vcu118"``
+            jesd_class (str, optional): ``"jesd204b"`` or ``"jesd204c"``
+            jesd_mode (str, optional): Quick configuration mode
+            sample_rate_min (float, optional): Lowest sample rate
+            sample_rate_max (float, optional): Highest sample rate
+            lane_rate_min (float, optional): Lowest lane rate
+            lane_rate_max (float, optional): Highest lane rate
+            limit (int, optional): Maximum number of records
+
+        Returns:
+            List[Dict[str, Any]]: Matching records, newest first
+        """
+        where, params = [], []
+        for column, value in (
+            ("kind", kind),
+            ("status", status),
+            ("clock", clock),
+            ("fpga", fpga),
+            ("dev_kit", dev_kit),
+        ):
+            if value is not None:
+                where.append(f"s.{column} = ?")
+                params.append(value)
+
+        conv_where, conv_params = [], []
+        if converter is not None:
+            conv_where.append("(c.device = ? OR c.converter = ?)")
+            conv_params += [converter, converter]
+        for clause, value in (
+            ("c.jesd_class = ?", jesd_class),
+            ("c.jesd_mode = ?", jesd_mode),
+            ("c.sample_rate >= ?", sample_rate_min),
+            ("c.sample_rate <= ?", sample_rate_max),
+            ("c.lane_rate >= ?", lane_rate_min),
+            ("c.lane_rate <= ?", lane_rate_max),
+        ):
+            if value is not None:
+                conv_where.append(clause)
+                conv_params.append(value)
+        if conv_where:
+            # Only fixed clauses are joined, values are bound parameters
+            clauses = " AND ".join(["c.solution_id = s.id", *conv_where])
+            subquery = "SELECT 1 FROM converters c WHERE "  # noqa: S608
+            where.append(f"EXISTS ({subquery}{clauses})")
+            params += conv_params
+
+        sql = "SELECT s.* FROM solutions s"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY s.created DESC, s.id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = self._conn.execute(sql, params).fetchall()
+        return [self._record_dict(row) for row in rows]
+
+    def _record_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Expand a stored row with its converters."""
+        record = dict(row)
+        record["description"] = json.loads(record["description"])
+        if record["result"] is not None:
+            record["result"] = json.loads(record["result"])
+        record["converters"] = [
+            dict(conv)
+            for conv in self._conn.execute(
+                "SELECT device, converter, sample_rate, lane_rate, "
+                "jesd_class, jesd_mode, M, L FROM converters "
+                "WHERE solution_id = ?",
+                (record["id"],),
+            )
+        ]
+        return record
+
+    def _cached(
+        self,
+        kind: str,
+        description: Dict[str, Any],
+        refresh: bool,
+        run: Callable[[], Any],
+        rows: Callable[[Any], List[Dict[str, Any]]],
+        stored_failure: Callable[[Exception], bool] = _problem_error,
+        **fields: Any,
+    ) -> Any:
+        """Return a stored result, or run, store and return a new one.
+
+        Stored failures are raised again without running. A failure is only
+        stored when ``stored_failure`` accepts its exception.
+        """
+        if not refresh:
+            stored = self.lookup(kind, description)
+            if stored is not None:
+                if stored["status"] != "solved":
+                    raise Exception(stored["error"])
+                return stored["result"]
+
+        start = time.perf_counter()
+        try:
+            result = run()
+        except Exception as exc:
+            if stored_failure(exc):
+                self.record(
+                    kind,
+                    description,
+                    status="failed",
+                    error=str(exc),
+                    solve_time=time.perf_counter() - start,
+                    **fields,
+                )
+            raise
+        solve_time = time.perf_counter() - start
+        result = json.loads(_canonical(result))
+        self.record(
+            kind,
+            description,
+            status="solved",
+            result=result,
+            solve_time=solve_time,
+            converters=rows(result),
+            **fields,
+        )
+        return result
+
+    def solve(
+        self, sys_obj: "system", *, refresh: bool = False, **kwargs: Any
+    ) -> Dict:
+        """Solve a system, or return the stored solution of the same system.
+
+        The system is keyed by :func:`describe_system` before it is solved.
+        A stored solution is returned without touching ``sys_obj``, so its
+        parts are not updated with the solution.
+
+        Args:
+            sys_obj (system): System to solve
+            refresh (bool): Solve and store again even if already stored
+            **kwargs: Passed to :meth:`adijif.system.solve`
+
+        Returns:
+            Dict: Solved configuration, as JSON
+
+        Raises:
+            Exception: No solution was found now or when first solved
+        """
+        description = describe_system(sys_obj)
+        if kwargs:
+            description["solve_arguments"] = {
+                k: v if k != "constrain" else repr(v) for k, v in kwargs.items()
+            }
+        previous = sys_obj._solution
+
+        def infeasible(exc: Exception) -> bool:
+            # A CPLEX search that ran must have proven infeasibility, not
+            # stopped at a time limit or abort
+            solution = sys_obj._solution
+            if solution is previous or not hasattr(
+                solution, "get_solve_status"
+            ):
+                return _problem_error(exc)
+            return solution.get_solve_status() == "Infeasible"
+
+        return self._cached(
+            "system",
+            description,
+            refresh,
+            lambda: sys_obj.solve(**kwargs),
+            lambda _: _system_converter_rows(sys_obj),
+            infeasible,
+            clock=sys_obj.clock.name,
+            fpga=type(sys_obj.fpga).__name__,
+            dev_kit=_dev_kit(sys_obj.fpga),
+            solver=sys_obj.solver,
+        )
+
+    def find_extreme_rate(
+        self, conv: Any, *, refresh: bool = False, **kwargs: Any
+    ) -> Dict:
+        """Cached :func:`adijif.utils.find_extreme_rate`.
+
+        Args:
+            conv (Any): Converter object to evaluate
+            refresh (bool): Solve and store again even if already stored
+            **kwargs: Passed to :func:`adijif.utils.find_extreme_rate`
+
+        Returns:
+            Dict: Resulting configuration, as JSON
+        """
+        from adijif.utils import find_extreme_rate
+
+        fpga, clock = kwargs.get("fpga"), kwargs.get("clock")
+        description = {
+            "converter": describe_part(conv),
+            "fpga": describe_part(fpga),
+            "clock": describe_part(clock),
+            "arguments": {
+                k: v for k, v in kwargs.items() if k not in ("fpga", "clock")
+            },
+        }
+
+        def rows(result: Dict) -> List[Dict[str, Any]]:
+            return [
+                {
+                    "device": conv.name,
+                    "converter": conv.name,
+                    "sample_rate": result["sample_clock"],
+                    "lane_rate": result["bit_clock"],
+                    "jesd_class": result["jesd_class"],
+                    "jesd_mode": result["mode"],
+                    "M": result["M"],
+                    "L": result["L"],
+                }
+            ]
+
+        return self._cached(
+            "find_extreme_rate",
+            description,
+            refresh,
+            lambda: find_extreme_rate(conv, **kwargs),
+            rows,
+            clock=getattr(clock, "name", None),
+            fpga=None if fpga is None else type(fpga).__name__,
+            dev_kit=_dev_kit(fpga),
+            solver=kwargs.get("solver", "CPLEX"),
+        )
+
+    def get_max_sample_rates(
+        self,
+        conv: Any,
+        fpga: Any = None,
+        limits: Optional[dict] = None,
+        *,
+        refresh: bool = False,
+    ) -> List[Dict]:
+        """Cached :func:`adijif.utils.get_max_sample_rates`.
+
+        Args:
+            conv (Any): Converter object of desired device
+            fpga (Any): FPGA object of desired fpga device
+            limits (dict, optional): Limits to apply to the device and JESD
+                mode
+            refresh (bool): Compute and store again even if already stored
+
+        Returns:
+            List[Dict]: Maximum sample rates per M, as JSON
+        """
+        from adijif.utils import get_max_sample_rates
+
+        description = {
+            "converter": describe_part(conv),
+            "fpga": describe_part(fpga),
+            "limits": limits,
+        }
+
+        def rows(result: List[Dict]) -> List[Dict[str, Any]]:
+            return [
+                {
+                    "device": conv.name,
+                    "converter": conv.name,
+                    "sample_rate": entry["sample_clock"],
+                    "lane_rate": entry["bit_clock"],
+                    "jesd_class": entry["jesd_class"],
+                    "jesd_mode": entry["quick_configuration_mode"],
+                    "M": entry["M"],
+                    "L": entry["L"],
+                }
+                for entry in result
+            ]
+
+        return self._cached(
+            "get_max_sample_rates",
+            description,
+            refresh,
+            lambda: get_max_sample_rates(conv, fpga, limits),
+            rows,
+            fpga=None if fpga is None else type(fpga).__name__,
+            dev_kit=_dev_kit(fpga),
+        )
@@ -11,13 +11,17 @@ if find_spec("docplex"):
     from docplex.cp.expression import CpoIntVar  # type: ignore
     from docplex.cp.model import binary_var  # type: ignore
     from docplex.cp.model import CpoModel, integer_var, interval_var  # type: ignore
+    from docplex.cp.modeler import allowed_assignments  # type: ignore
     from docplex.cp.solution import CpoSolveResult  # type: ignore
+    from docplex.cp.solver.solver_listener import CpoSolverListener  # type: ignore
 
     cplex_solver = True
 else:
     cplex_solver = False
     CpoExpr = None
     CpoFunctionCall = None
+    CpoSolverListener = None
+    allowed_assignments = None
     binary_var = None
     integer_var = None
     continuous_var = None
@@ -0,0 +1,392 @@
+"""Grid sweeps of system solves, sharded across machines.
+
+A grid specification names a ``base`` system request in the
+``solve_system`` JSON schema and a set of ``axes``. Each axis maps a dotted
+path into the request (``"converter_properties.sample_clock"``,
+``"vcxo.value"``, ``"fpga_properties.dev_kit"``, ...) to a list of values or
+to a ``{"start", "stop", "step"}`` range (``stop`` excluded, as in
+``adijif.types.range``). Points are the cartesian product of the axes in the
+order they are listed, numbered from 0.
+
+Point ``k`` belongs to shard ``k % n + 1`` of ``n``, so any host can run its
+share of one sweep from the grid file alone. Each shard is written as JSON
+lines: a header identifying the grid and shard, then one record per point
+carrying a SHA-256 checksum of its content. :func:`merge_shards` verifies
+the checksums and that every point of the grid is present exactly once.
+"""
+
+import contextlib
+import copy
+import hashlib
+import io
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from adijif.agent_api import json_default, solve_system
+
+SWEEP_FORMAT = "adi.jif-sweep"
+SWEEP_VERSION = 1
+# Float tolerance when counting the values of a range axis
+_RANGE_TOL = 1e-9
+
+
+def load_grid(path: str) -> Dict[str, Any]:
+    """Read a grid specification from a JSON or YAML file.
+
+    YAML files (``.yaml``/``.yml``) require PyYAML.
+
+    Args:
+        path (str): Grid file
+
+    Returns:
+        Dict[str, Any]: Grid with ``base`` and ``axes``
+
+    Raises:
+        ValueError: File is not a valid grid
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as exc:
+            raise ValueError(
+                "YAML grids require PyYAML: pip install pyyaml"
+            ) from exc
+        grid = yaml.safe_load(text)
+    else:
+        grid = json.loads(text)
+    validate_grid(grid)
+    return grid
+
+
+def validate_grid(grid: Any) -> None:
+    """Check the structure of a grid specification.
+
+    Args:
+        grid (Any): Parsed grid
+
+    Raises:
+        ValueError: Grid is malformed
+    """
+    if not isinstance(grid, dict):
+        raise ValueError("Grid must be an object")
+    if not isinstance(grid.get("base", {}), dict):
+        raise ValueError("Grid 'base' must be an object")
+    axes = grid.get("axes")
+    if not isinstance(axes, dict) or not axes:
+        raise ValueError("Grid 'axes' must be a non-empty object")
+    for name, values in axes.items():
+        _axis_values(name, values)
+
+
+def _axis_values(name: str, values: Any) -> List[Any]:
+    """Expand one axis to its list of values.
+
+    Args:
+        name (str): Dotted request path of the axis
+        values (Any): List of values or a start/stop/step range
+
+    Returns:
+        List[Any]: Axis values in order
+
+    Raises:
+        ValueError: Axis is empty or malformed
+    """
+    if isinstance(values, dict):
+        try:
+            start, stop, step = values["start"], values["stop"], values["step"]
+        except KeyError as exc:
+            raise ValueError(
+                f"Range axis '{name}' requires 'start', 'stop' and 'step'"
+            ) from exc
+        if step <= 0:
+            raise ValueError(f"Range axis '{name}' needs a positive step")
+        count = max(0, math.ceil((stop - start) / step - _RANGE_TOL))
+        values = [start + step * k for k in range(count)]
+    if not isinstance(values, list) or not values:
+        raise ValueError(f"Axis '{name}' must be a non-empty list or range")
+    return values
+
+
+def grid_hash(grid: Dict[str, Any]) -> str:
+    """Identify a grid specification.
+
+    Args:
+        grid (Dict[str, Any]): Grid specification
+
+    Returns:
+        str: SHA-256 hex digest of the canonical grid JSON
+    """
+    return hashlib.sha256(_canonical(grid).encode()).hexdigest()
+
+
+def grid_size(grid: Dict[str, Any]) -> int:
+    """Number of points in a grid.
+
+    Args:
+        grid (Dict[str, Any]): Grid specification
+
+    Returns:
+        int: Product of the axis lengths
+    """
+    return math.prod(len(_axis_values(k, v)) for k, v in grid["axes"].items())
+
+
+def iter_points(
+    grid: Dict[str, Any], shard: Tuple[int, int] = (1, 1)
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield the points of one shard of a grid.
+
+    Args:
+        grid (Dict[str, Any]): Grid specification
+        shard (Tuple[int, int]): ``(i, n)``, shard ``i`` of ``n`` from 1
+
+    Yields:
+        Tuple[int, Dict[str, Any]]: Point index and axis values
+    """
+    i, n = shard
+    names = list(grid["axes"])
+    values = [_axis_values(k, grid["axes"][k]) for k in names]
+    for index, combo in enumerate(itertools.product(*values)):
+        if index % n == i - 1:
+            yield index, dict(zip(names, combo, strict=True))
+
+
+def point_config(base: Dict[str, Any], point: Dict[str, Any]) -> Dict:
+    """Build the system request of one grid point.
+
+    Args:
+        base (Dict[str, Any]): Base ``solve_system`` request
+        point (Dict[str, Any]): Axis values keyed by dotted path
+
+    Returns:
+        Dict: Request with the point's values set
+
+    Raises:
+        ValueError: A path crosses a non-object value
+    """
+    config = copy.deepcopy(base)
+    for path, value in point.items():
+        keys = path.split(".")
+        node = config
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+            if not isinstance(node, dict):
+                raise ValueError(f"Axis '{path}' crosses a non-object value")
+        node[keys[-1]] = copy.deepcopy(value)
+    return config
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """Parse an ``i/n`` shard selector.
+
+    Args:
+        text (str): Shard as ``i/n`` with ``1 <= i <= n``
+
+    Returns:
+        Tuple[int, int]: ``(i, n)``
+
+    Raises:
+        ValueError: Selector is malformed or out of range
+    """
+    try:
+        i, n = (int(part) for part in text.split("/"))
+    except ValueError as exc:
+        raise ValueError(f"Shard must be i/n, got {text!r}") from exc
+    if not 1 <= i <= n:
+        raise ValueError(f"Shard index must be within 1..{n}, got {i}")
+    return i, n
+
+
+def _canonical(value: Any) -> str:
+    """Serialize JSON deterministically for hashing."""
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), default=json_default
+    )
+
+
+def _checksum(record: Dict[str, Any]) -> str:
+    """Checksum a record, excluding its checksum field."""
+    body = {k: v for k, v in record.items() if k != "checksum"}
+    return hashlib.sha256(_canonical(body).encode()).hexdigest()
+
+
+def _solve_point(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Solve one request with solver chatter kept off stdout."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return solve_system(json.dumps(config, default=json_default))
+
+
+def _record(index: int, point: Dict, result: Dict) -> Dict[str, Any]:
+    """Build the checksummed JSON-lines record of one point."""
+    record: Dict[str, Any] = {"type": "result", "index": index, "point": point}
+    if "error" in result:
+        record.update(status="error", error=result["error"])
+    else:
+        record.update(status=result["status"], solution=result["solution"])
+    # Round-trip so the checksum covers exactly what is written
+    record = json.loads(_canonical(record))
+    record["checksum"] = _checksum(record)
+    return record
+
+
+def run_shard(
+    grid: Dict[str, Any],
+    output: str,
+    shard: Tuple[int, int] = (1, 1),
+    jobs: int = 1,
+) -> Dict[str, Any]:
+    """Solve one shard of a grid and write its JSON-lines results.
+
+    Args:
+        grid (Dict[str, Any]): Grid specification
+        output (str): Results file
+        shard (Tuple[int, int]): ``(i, n)``, shard ``i`` of ``n`` from 1
+        jobs (int): Worker processes. 1 solves in this process.
+
+    Returns:
+        Dict[str, Any]: Summary with counts of solved and failed points
+    """
+    validate_grid(grid)
+    base = grid.get("base", {})
+    points = list(iter_points(grid, shard))
+    configs = [point_config(base, point) for _, point in points]
+    header = {
+        "type": "header",
+        "format": SWEEP_FORMAT,
+        "version": SWEEP_VERSION,
+        "grid": grid_hash(grid),
+        "points": grid_size(grid),
+        "shard": shard[0],
+        "shards": shard[1],
+    }
+
+    counts = {"solved": 0, "failed": 0}
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        results = (
+            pool.map(_solve_point, configs)
+            if pool
+            else map(_solve_point, configs)
+        )
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(_canonical(header) + "\n")
+            for (index, point), result in zip(points, results, strict=True):
+                record = _record(index, point, result)
+                counts["failed" if "error" in record else "solved"] += 1
+                f.write(_canonical(record) + "\n")
+                f.flush()
+    finally:
+        if pool:
+            pool.shutdown()
+
+    return {
+        "output": output,
+        "grid": header["grid"],
+        "shard": f"{shard[0]}/{shard[1]}",
+        "points": len(points),
+        **counts,
+    }
+
+
+def _read_shard(path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Read and verify one shard file.
+
+    Args:
+        path (str): Shard results file
+
+    Returns:
+        Tuple: Header and result records
+
+    Raises:
+        ValueError: File is not a sweep shard or a checksum does not match
+    """
+    with open(path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get("format") != SWEEP_FORMAT:
+        raise ValueError(f"{path} is not a sweep results file")
+    header, records = lines[0], lines[1:]
+    if header.get("version") != SWEEP_VERSION:
+        raise ValueError(
+            f"{path} has sweep format version {header.get('version')}, "
+            f"expected {SWEEP_VERSION}"
+        )
+    for record in records:
+        if record.get("checksum") != _checksum(record):
+            raise ValueError(
+                f"Checksum mismatch for point {record.get('index')} in {path}"
+            )
+    return header, records
+
+
+def merge_shards(paths: List[str], output: Optional[str] = None) -> Dict:
+    """Verify shard results and combine them into one ordered file.
+
+    Every shard of the sweep must be given once, all from the same grid, and
+    together they must hold every point exactly once.
+
+    Args:
+        paths (List[str]): Shard results files
+        output (str, optional): Merged JSON-lines file. Only verified when
+            omitted.
+
+    Returns:
+        Dict: Summary with counts of solved and failed points
+
+    Raises:
+        ValueError: Shards are corrupt, mismatched, duplicated or incomplete
+    """
+    if not paths:
+        raise ValueError("No shard files given")
+    headers, records = [], []
+    for path in paths:
+        header, shard_records = _read_shard(path)
+        headers.append(header)
+        records.extend(shard_records)
+
+    first = headers[0]
+    for header in headers[1:]:
+        for key in ("grid", "points", "shards"):
+            if header[key] != first[key]:
+                raise ValueError(
+                    f"Shards come from different sweeps ({key} "
+                    f"{header[key]} != {first[key]})"
+                )
+    shards = sorted(header["shard"] for header in headers)
+    if shards != list(range(1, first["shards"] + 1)):
+        raise ValueError(
+            f"Expected shards 1..{first['shards']} once each, got {shards}"
+        )
+    records.sort(key=lambda record: record["index"])
+    indexes = [record["index"] for record in records]
+    if indexes != list(range(first["points"])):
+        seen = set(indexes)
+        missing = [k for k in range(first["points"]) if k not in seen]
+        raise ValueError(
+            f"Sweep is incomplete or has duplicates: {len(records)} records "
+            f"for {first['points']} points, missing {missing[:10]}"
+        )
+
+    if output:
+        header = {k: first[k] for k in ("type", "format", "version", "grid")}
+        header["points"] = first["points"]
+        header["shards"] = first["shards"]
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(_canonical(header) + "\n")
+            for record in records:
+                f.write(_canonical(record) + "\n")
+
+    failed = sum(record["status"] == "error" for record in records)
+    return {
+        "output": output,
+        "grid": first["grid"],
+        "shards": first["shards"],
+        "points": len(records),
+        "solved": len(records) - failed,
+        "failed": failed,
+    }
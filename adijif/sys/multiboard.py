@@ -0,0 +1,379 @@
+"""Multi-board clock planning for SYSREF-synchronized converter arrays.
+
+Large arrays are built from Unit Boards that each carry their own clock
+chip, FPGA and converters, with SYSREF (and optionally BSYNC) distributed by
+ADF4030 devices. Modelling the whole array as one ``adijif.system`` does not
+scale, so each board is solved as an independent subsystem in a worker
+process and a coordinating master loop reconciles the clocks the boards
+must share: the reference frequency, the SYSREF rate and the BSYNC rate.
+
+The master proposes shared values, every board solves with them pinned,
+and proposals any board rejects are cut until all boards agree.
+"""
+
+import copy
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+BoardBuilder = Callable[..., Any]
+_BoardKey = Tuple[str, str]
+_Shared = Tuple[Any, Any, Any]
+
+_SYSREF_SUFFIX = "_sysref"
+_BSYNC_SUFFIX = "_bsync_reference"
+
+
+def _pin(value: Fraction) -> Any:  # noqa: ANN401
+    """Convert a rational rate to the number type the solver accepts."""
+    return int(value) if value.denominator == 1 else float(value)
+
+
+def _rational(value: float) -> Fraction:
+    """Rational approximation of a rate in Hz, exact to 1 uHz."""
+    return Fraction(value).limit_denominator(10**6)
+
+
+def _rational_gcd(values: List[Fraction]) -> Fraction:
+    """Greatest rate that divides every rate in ``values`` an integer times.
+
+    Args:
+        values (List[Fraction]): Positive rates
+
+    Returns:
+        Fraction: Greatest common divisor of the rates
+    """
+    denominator = math.lcm(*(v.denominator for v in values))
+    numerator = math.gcd(*(int(v * denominator) for v in values))
+    return Fraction(numerator, denominator)
+
+
+def _converters(sys: Any) -> Iterator[Any]:  # noqa: ANN401
+    """Yield every JESD link endpoint converter of a system."""
+    convs = (
+        sys.converter if isinstance(sys.converter, list) else [sys.converter]
+    )
+    for conv in convs:
+        if conv._nested:
+            for name in conv._nested:
+                yield getattr(conv, name)
+        else:
+            yield conv
+
+
+def _output_rates(cfg: Dict) -> Dict[str, float]:
+    """Collect the rate of every named output clock of a solved system."""
+    rates = {}
+    for part in cfg.values():
+        if isinstance(part, dict) and isinstance(
+            part.get("output_clocks"), dict
+        ):
+            for name, clock in part["output_clocks"].items():
+                rates[name] = clock["rate"]
+    return rates
+
+
+def _solve_board(job: Tuple) -> Tuple[Optional[Dict], Optional[str], Dict]:
+    """Build and solve one Unit Board with the shared clocks pinned.
+
+    Runs in a worker process.
+
+    Args:
+        job (Tuple): ``(builder, kwargs, vcxo, sysref, bsync)``. ``sysref``
+            and ``bsync`` are None when not pinned.
+
+    Returns:
+        Tuple: (config or None, error or None, info). ``info`` holds the
+        board's ``lmfc`` rates and the solved ``sysref`` and ``bsync`` rates
+        keyed by clock name.
+    """
+    builder, kwargs, vcxo, sysref, bsync = job
+    info: Dict[str, Any] = {"lmfc": [], "sysref": {}, "bsync": {}}
+    try:
+        sys = builder(vcxo, **kwargs)
+        info["lmfc"] = [conv.multiframe_clock for conv in _converters(sys)]
+        clocks = sys.initialize()
+        pins = {}
+        for name in clocks:
+            if sysref is not None and name.endswith(_SYSREF_SUFFIX):
+                pins[name] = sysref
+            elif bsync is not None and name.endswith(_BSYNC_SUFFIX):
+                pins[name] = bsync
+        if pins:
+            sys.initialize(pins)
+        cfg = sys.do_solve()
+    except Exception as e:  # noqa: BLE001 -- solver raises bare Exception
+        return None, str(e), info
+    rates = _output_rates(cfg)
+    for name in clocks:
+        if name.endswith(_SYSREF_SUFFIX) and name in rates:
+            info["sysref"][name] = rates[name]
+        elif name.endswith(_BSYNC_SUFFIX) and name in rates:
+            info["bsync"][name] = rates[name]
+    return cfg, None, info
+
+
+class MultiBoardSystem:
+    """Array of Unit Boards solved as coordinated subsystems.
+
+    Each board is described by a builder, a picklable module-level function
+    ``builder(vcxo, **kwargs)`` returning an uninitialized ``adijif.system``
+    (parts selected, converters configured and PLLs such as
+    ``add_pll_sysref("adf4030", ...)`` added). Boards with the same builder
+    and arguments are solved once, so an array of identical boards costs a
+    single solve per round.
+
+    Example:
+        mb = MultiBoardSystem([100_000_000, 125_000_000])
+        mb.add_boards(16, build_unit_board, sample_clock=500e6)
+        cfg = mb.solve()
+    """
+
+    def __init__(
+        self,
+        vcxo: Any,  # noqa: ANN401
+        processes: Optional[int] = None,
+        max_rounds: int = 16,
+        sysref_max_div: int = 64,
+    ) -> None:
+        """Create an empty array.
+
+        Args:
+            vcxo (int, float, list): Reference frequency shared by all
+                boards, or candidate references in order of preference
+            processes (int): Worker processes. None uses the CPU count, 1
+                solves in the calling process.
+            max_rounds (int): Proposals of shared clocks the master tries
+                before giving up
+            sysref_max_div (int): Largest divider of the common LMFC
+                considered for the shared SYSREF rate
+
+        Raises:
+            Exception: No reference or invalid limits
+        """
+        refs = list(vcxo) if isinstance(vcxo, (list, tuple)) else [vcxo]
+        if not refs:
+            raise Exception("At least one reference frequency is required")
+        if max_rounds < 1:
+            raise Exception("max_rounds must be at least 1")
+        if sysref_max_div < 1:
+            raise Exception("sysref_max_div must be at least 1")
+        self.references = refs
+        self.processes = processes
+        self.max_rounds = max_rounds
+        self.sysref_max_div = sysref_max_div
+        self._boards: Dict[str, _BoardKey] = {}
+        self._builds: Dict[_BoardKey, Tuple[BoardBuilder, Dict]] = {}
+
+    @property
+    def boards(self) -> List[str]:
+        """Names of the boards in the array, in the order added."""
+        return list(self._boards)
+
+    def add_board(
+        self,
+        name: str,
+        builder: BoardBuilder,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Add a Unit Board to the array.
+
+        Args:
+            name (str): Unique board name
+            builder (Callable): Module-level function called as
+                ``builder(vcxo, **kwargs)`` that returns the board's
+                uninitialized system
+            **kwargs: Board-specific builder arguments. Must be picklable.
+
+        Raises:
+            Exception: Duplicate board name
+        """
+        if name in self._boards:
+            raise Exception(f"Board {name} already added")
+        key = (
+            f"{builder.__module__}.{builder.__qualname__}",
+            repr(sorted(kwargs.items())),
+        )
+        self._builds.setdefault(key, (builder, kwargs))
+        self._boards[name] = key
+
+    def add_boards(
+        self,
+        count: int,
+        builder: BoardBuilder,
+        prefix: str = "UnitBoard",
+        **kwargs: Any,  # noqa: ANN401
+    ) -> List[str]:
+        """Add ``count`` identical Unit Boards named ``<prefix>_<i>``.
+
+        Args:
+            count (int): Number of boards, e.g. ``N_UB`` of an
+                ``Adf4030Architecture`` partition
+            builder (Callable): Board builder, see :meth:`add_board`
+            prefix (str): Board name prefix
+            **kwargs: Builder arguments shared by the boards
+
+        Returns:
+            List[str]: Names of the added boards
+        """
+        start = len(self._boards)
+        names = [f"{prefix}_{i}" for i in range(start, start + count)]
+        for name in names:
+            self.add_board(name, builder, **kwargs)
+        return names
+
+    def _sysref_candidates(self, lmfcs: List[float]) -> List[Fraction]:
+        """SYSREF rates that divide every board's LMFC, fastest first."""
+        common = _rational_gcd([_rational(rate) for rate in lmfcs])
+        return [common / div for div in range(1, self.sysref_max_div + 1)]
+
+    @staticmethod
+    def _rates(results: Dict[_BoardKey, Tuple], kind: str) -> Dict[float, int]:
+        """Count how many board clocks of a kind run at each rate."""
+        counts: Dict[float, int] = {}
+        for _, _, info in results.values():
+            for rate in info[kind].values():
+                counts[rate] = counts.get(rate, 0) + 1
+        return counts
+
+    def _proposals(
+        self,
+        ref: Any,  # noqa: ANN401
+        results: Dict[_BoardKey, Tuple],
+    ) -> Iterator[_Shared]:
+        """Shared clock proposals for one reference, most preferred first.
+
+        BSYNC often follows from the SYSREF rate, so each SYSREF proposal is
+        first tried with BSYNC left free.
+
+        Args:
+            ref (Any): Reference frequency
+            results (Dict): Unpinned solve of every unique board
+
+        Yields:
+            Tuple: (reference, SYSREF rate, BSYNC rate). A rate is None when
+            it is not pinned.
+        """
+        sysref_options: List[Any] = [None]
+        if not self._agree(results, "sysref"):
+            lmfcs = [r for _, _, info in results.values() for r in info["lmfc"]]
+            sysref_options = [_pin(r) for r in self._sysref_candidates(lmfcs)]
+        bsyncs = self._rates(results, "bsync")
+        for sysref in sysref_options:
+            if sysref is not None:
+                yield ref, sysref, None
+            if len(bsyncs) > 1:
+                for bsync in sorted(bsyncs, key=lambda r: (-bsyncs[r], -r)):
+                    yield ref, sysref, bsync
+
+    @classmethod
+    def _agree(cls, results: Dict[_BoardKey, Tuple], kind: str) -> bool:
+        """Check that all board clocks of a kind run at one rate."""
+        return len(cls._rates(results, kind)) <= 1
+
+    def _solve_all(
+        self, shared: _Shared, pool: Optional[Executor]
+    ) -> Dict[_BoardKey, Tuple]:
+        """Solve every unique board with the shared clocks pinned."""
+        keys = list(self._builds)
+        jobs = [(*self._builds[key], *shared) for key in keys]
+        if pool is None:
+            solved = [_solve_board(job) for job in jobs]
+        else:
+            solved = list(pool.map(_solve_board, jobs))
+        return dict(zip(keys, solved, strict=True))
+
+    def _errors(self, results: Dict[_BoardKey, Tuple]) -> Dict[str, str]:
+        """Map the first board of every failed build to its error."""
+        names = {}
+        for name, key in self._boards.items():
+            names.setdefault(key, name)
+        return {
+            names[key]: error
+            for key, (_, error, _) in results.items()
+            if error is not None
+        }
+
+    def _coordinate(self, pool: Optional[Executor]) -> Dict:
+        """Run the master loop over references and shared-clock proposals.
+
+        Raises:
+            Exception: No proposal is accepted by every board
+        """
+        rounds = 0
+        errors: Dict[str, str] = {}
+        for ref in self.references:
+            # Round one at each reference solves the boards unpinned.
+            proposals: Iterator[_Shared] = iter([(ref, None, None)])
+            unpinned = None
+            while rounds < self.max_rounds:
+                shared = next(proposals, None)
+                if shared is None:
+                    break
+                rounds += 1
+                results = self._solve_all(shared, pool)
+                failed = self._errors(results)
+                if failed:
+                    errors.update(failed)
+                    if unpinned is None:
+                        # Some board cannot be planned at this reference.
+                        break
+                    continue
+                if self._agree(results, "sysref") and self._agree(
+                    results, "bsync"
+                ):
+                    return self._collect(shared, results, rounds)
+                if unpinned is None:
+                    unpinned = results
+                    proposals = self._proposals(ref, results)
+        raise Exception(
+            "No shared reference, SYSREF and BSYNC rates accepted by every "
+            f"board within {rounds} rounds. Last errors: {errors}"
+        )
+
+    def _collect(
+        self, shared: _Shared, results: Dict[_BoardKey, Tuple], rounds: int
+    ) -> Dict:
+        """Assemble the array configuration from per-board solutions."""
+        infos = [info for _, _, info in results.values()]
+        sysrefs = {r for info in infos for r in info["sysref"].values()}
+        bsyncs = {r for info in infos for r in info["bsync"].values()}
+        return {
+            "vcxo": shared[0],
+            "sysref": sysrefs.pop() if len(sysrefs) == 1 else None,
+            "bsync_reference": bsyncs.pop() if len(bsyncs) == 1 else None,
+            "rounds": rounds,
+            "unique_boards": len(results),
+            "boards": {
+                name: copy.deepcopy(results[key][0])
+                for name, key in self._boards.items()
+            },
+        }
+
+    def solve(self) -> Dict:
+        """Plan the clocks of every board with shared clocks reconciled.
+
+        Every unique board is first solved on its own at the preferred
+        reference. When the boards disagree on SYSREF or BSYNC rates, the
+        master proposes common rates -- SYSREF rates dividing every board's
+        LMFC, fastest first, and the BSYNC rates the boards chose, most
+        common first -- and re-solves all boards with them pinned until
+        every board accepts one. References are tried in order when a board
+        cannot be planned at one.
+
+        Returns:
+            Dict: ``vcxo``, ``sysref`` and ``bsync_reference`` shared by all
+            boards (None when no board has such a clock), ``rounds`` of
+            master proposals, ``unique_boards`` solved per round, and
+            ``boards`` mapping each board name to its system configuration
+
+        Raises:
+            Exception: No boards, or no shared clocks accepted by all boards
+        """
+        if not self._boards:
+            raise Exception("No boards added")
+        if self.processes == 1 or len(self._builds) < 2:
+            return self._coordinate(None)
+        with ProcessPoolExecutor(max_workers=self.processes) as pool:
+            return self._coordinate(pool)
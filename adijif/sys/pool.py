@@ -0,0 +1,322 @@
+"""Bounded pool of reusable ``adijif.system`` objects for long-running servers."""
+
+import contextlib
+import copy
+import sys as _sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from adijif.common import _clone_value, core
+from adijif.system import system
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+PoolKey = Tuple[Any, str, str, str]
+_COMPONENT_ATTRS = ("clock", "fpga", "converter", "model")
+
+
+class _PooledSystem:
+    """System built by a pool plus unconfigured copies of its components."""
+
+    def __init__(self, key: PoolKey) -> None:
+        """Construct the system and remember its freshly built state.
+
+        Args:
+            key (PoolKey): (conv, clk, fpga, solver) the system is built for
+        """
+        conv, clk, fpga, solver = key
+        conv = list(conv) if isinstance(conv, tuple) else conv
+        self.key = key
+        self.system = system(conv, clk, fpga, 100_000_000, solver=solver)
+        sys_obj = self.system
+        self.templates = {
+            "clock": sys_obj.clock.clone(),
+            "fpga": sys_obj.fpga.clone(),
+            "converter": (
+                [c.clone() for c in sys_obj.converter]
+                if isinstance(sys_obj.converter, list)
+                else sys_obj.converter.clone()
+            ),
+        }
+        self.settings = {
+            name: copy.deepcopy(value)
+            for name, value in vars(sys_obj).items()
+            if not name.startswith("_") and name not in _COMPONENT_ATTRS
+        }
+        self.last_used = time.monotonic()
+
+    def reset(self) -> None:
+        """Return the system to its freshly constructed configuration.
+
+        Component attributes that differ from the unconfigured templates
+        are restored, PLLs and user objectives are dropped, and
+        ``_model_reset`` rebinds everything to a new solver model.
+        """
+        sys_obj = self.system
+        pairs = [(sys_obj.clock, self.templates["clock"])]
+        pairs.append((sys_obj.fpga, self.templates["fpga"]))
+        converter = self.templates["converter"]
+        if isinstance(converter, list):
+            pairs.extend(zip(sys_obj.converter, converter, strict=True))
+        else:
+            pairs.append((sys_obj.converter, converter))
+        for component, template in pairs:
+            _restore_component(component, template, sys_obj.model)
+        sys_obj._plls = []
+        sys_obj._plls_sysref = []
+        sys_obj._user_objectives = []
+        for name in list(vars(sys_obj)):
+            if name.startswith("_") or name in _COMPONENT_ATTRS:
+                continue
+            if name not in self.settings:
+                delattr(sys_obj, name)
+        for name, value in self.settings.items():
+            setattr(sys_obj, name, copy.deepcopy(value))
+        sys_obj._model_reset()
+
+
+def _unchanged(value: Any, template: Any) -> bool:
+    """Check if an attribute still equals its unconfigured value."""
+    if type(value) is not type(template):
+        return False
+    try:
+        return bool(value == template)
+    except Exception:
+        return False
+
+
+def _restore_component(component: core, template: core, model: Any) -> None:
+    """Restore a component's attributes from its unconfigured template.
+
+    Only attributes that were changed are copied back, so large divider
+    tables left untouched by a request are not copied again.
+
+    Args:
+        component (core): Component of a pooled system
+        template (core): Clone of the component taken after construction
+        model (Any): Solver model nested components are cloned onto
+    """
+    state = component.__dict__
+    for name in [n for n in state if n not in template.__dict__]:
+        if name not in core._clone_reset_attrs:
+            del state[name]
+    for name, value in template.__dict__.items():
+        if name in core._clone_reset_attrs:
+            continue
+        current = state.get(name)
+        if isinstance(value, core) and type(current) is type(value):
+            _restore_component(current, value, model)
+        elif not _unchanged(current, value):
+            state[name] = _clone_value(value, model)
+    component._objectives = []
+    if hasattr(component, "_init_diagram"):
+        component._init_diagram()
+
+
+class SystemPool:
+    """Reuse constructed systems across requests.
+
+    Systems are keyed by ``(conv, clk, fpga, solver)``. A checked-out system
+    is exclusively owned by the caller; when returned it is reset to its
+    freshly constructed configuration and kept for the next request with
+    the same key. At most ``max_size`` idle systems are kept, the least
+    recently used beyond that are dropped, and systems idle for longer than
+    ``max_idle`` seconds are evicted.
+
+    Example:
+        pool = SystemPool(max_size=4)
+        with pool.checkout("ad9680", "hmc7044", "xilinx", 125e6) as sys:
+            sys.fpga.setup_by_dev_kit_name("zc706")
+            cfg = sys.solve()
+    """
+
+    def __init__(self, max_size: int = 8, max_idle: float = 300.0) -> None:
+        """Create an empty pool.
+
+        Args:
+            max_size (int): Maximum number of idle systems kept
+            max_idle (float): Seconds an idle system is kept before eviction
+
+        Raises:
+            Exception: Invalid size or idle limit
+        """
+        if max_size < 0:
+            raise Exception("max_size must be non-negative")
+        if max_idle <= 0:
+            raise Exception("max_idle must be positive")
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self._idle: "OrderedDict[int, _PooledSystem]" = OrderedDict()
+        self._in_use: Dict[int, _PooledSystem] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "discarded": 0,
+            "high_water": 0,
+        }
+
+    @staticmethod
+    def _key(conv: Any, clk: str, fpga: str, solver: str) -> PoolKey:
+        """Normalize the request into a hashable pool key."""
+        if isinstance(conv, list):
+            conv = tuple(c.lower() for c in conv)
+        else:
+            conv = conv.lower()
+        return (conv, clk.lower(), fpga.lower(), solver)
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop expired and surplus idle systems. Lock must be held."""
+        for ident in [
+            i
+            for i, entry in self._idle.items()
+            if now - entry.last_used > self.max_idle
+        ]:
+            del self._idle[ident]
+            self._stats["evictions"] += 1
+        while len(self._idle) > self.max_size:
+            self._idle.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def acquire(
+        self,
+        conv: Any,
+        clk: str,
+        fpga: str,
+        vcxo: Any,
+        solver: str = "CPLEX",
+    ) -> system:
+        """Check out a system, reusing an idle one with the same parts.
+
+        Args:
+            conv (str, List[str]): Converter name(s)
+            clk (str): Clock chip name
+            fpga (str): FPGA name
+            vcxo (int, float, range, arb_source): Reference for this request
+            solver (str): Solver name
+
+        Returns:
+            system: Unconfigured system owned by the caller until
+            :meth:`release` is called
+
+        Raises:
+            Exception: arb_source reference requested with gekko
+        """
+        from adijif.types import arb_source
+
+        if isinstance(vcxo, arb_source) and solver == "gekko":
+            raise Exception(
+                "arb_source type requires CPLEX solver. "
+                "Either use solver='CPLEX' or use adijif.types.range "
+                "for discrete values."
+            )
+        key = self._key(conv, clk, fpga, solver)
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            entry = None
+            for ident, candidate in reversed(self._idle.items()):
+                if candidate.key == key:
+                    entry = self._idle.pop(ident)
+                    break
+            self._stats["hits" if entry else "misses"] += 1
+        if entry is None:
+            entry = _PooledSystem(key)
+        entry.system.vcxo = vcxo
+        with self._lock:
+            self._in_use[id(entry.system)] = entry
+            self._stats["high_water"] = max(
+                self._stats["high_water"], len(self._idle) + len(self._in_use)
+            )
+        return entry.system
+
+    def release(self, sys_obj: system) -> None:
+        """Return a checked-out system to the pool.
+
+        The system is reset before it becomes available again. Systems
+        whose reset fails are discarded.
+
+        Args:
+            sys_obj (system): System returned by :meth:`acquire`
+
+        Raises:
+            Exception: System was not checked out from this pool
+        """
+        with self._lock:
+            entry = self._in_use.pop(id(sys_obj), None)
+        if entry is None:
+            raise Exception("System was not checked out from this pool")
+        try:
+            entry.reset()
+        except Exception:
+            with self._lock:
+                self._stats["discarded"] += 1
+            return
+        with self._lock:
+            entry.last_used = time.monotonic()
+            self._idle[id(sys_obj)] = entry
+            self._evict_idle(entry.last_used)
+
+    @contextlib.contextmanager
+    def checkout(
+        self,
+        conv: Any,
+        clk: str,
+        fpga: str,
+        vcxo: Any,
+        solver: str = "CPLEX",
+    ) -> Iterator[system]:
+        """Context manager around :meth:`acquire` and :meth:`release`.
+
+        Args:
+            conv (str, List[str]): Converter name(s)
+            clk (str): Clock chip name
+            fpga (str): FPGA name
+            vcxo (int, float, range, arb_source): Reference for this request
+            solver (str): Solver name
+
+        Yields:
+            system: Unconfigured system owned by the caller
+        """
+        sys_obj = self.acquire(conv, clk, fpga, vcxo, solver)
+        try:
+            yield sys_obj
+        finally:
+            self.release(sys_obj)
+
+    def clear(self) -> None:
+        """Drop all idle systems."""
+        with self._lock:
+            self._idle.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Report pool usage and process memory high-water mark.
+
+        Returns:
+            Dict[str, Any]: ``hits``, ``misses``, ``evictions``, ``discarded``
+            (failed resets), ``idle`` and ``in_use`` counts, ``high_water``
+            (most systems alive at once), ``keys`` of idle systems and
+            ``peak_rss_bytes`` (None where the platform cannot report it)
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["idle"] = len(self._idle)
+            stats["in_use"] = len(self._in_use)
+            keys: List[PoolKey] = [e.key for e in self._idle.values()]
+        stats["keys"] = sorted({str(k) for k in keys})
+        stats["peak_rss_bytes"] = _peak_rss_bytes()
+        return stats
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if _sys.platform == "darwin" else peak * 1024
@@ -2,6 +2,7 @@
 
 import os
 import shutil  # noqa: F401
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -19,9 +20,17 @@ if TYPE_CHECKING:
 import numpy as np
 
 import adijif.solvers as solvers
+from adijif import gekko_rundir
 from adijif.clocks.clock import clock as clockc
 from adijif.converters.converter import converter as convc
-from adijif.optimization import Objective, apply_objectives, collect_objectives
+from adijif.gekko_trans import SolutionSnapshot
+from adijif.optimization import (
+    Objective,
+    StageResult,
+    apply_objectives,
+    collect_objectives,
+    solve_staged,
+)
 from adijif.plls.pll import pll as pllc
 from adijif.registry import get_component_class
 from adijif.sys.clocks_bundle import ClocksBundle
@@ -30,6 +39,21 @@ from adijif.system_draw import system_draw as system_draw
 from adijif.types import arb_source as arb_sourcec
 from adijif.types import range as rangec
 
+_solving = threading.local()
+
+
+class _TrackSolver(solvers.CpoSolverListener or object):
+    """Expose the CPLEX solver of the current thread to abort_solve."""
+
+    def solver_created(self, solver: Any) -> None:  # noqa: ANN401
+        owner = getattr(_solving, "system", None)
+        if owner is not None:
+            owner._cpo_solver = solver
+
+
+class SysrefConfigurationError(Exception):
+    """Raised when no clock chip output can provide the required SYSREF."""
+
 
 class system(SystemPLL, system_draw):
     """System Manager Class.
@@ -46,9 +70,39 @@ class system(SystemPLL, system_draw):
     enable_converter_clocks = True
     enable_fpga_clocks = True
 
+    """Check fixed-rate converter reference clocks and numeric
+    out_clock_constraints against a precomputed reachable-frequency index
+    before objectives are applied and the solver runs"""
+    use_reachability_index = False
+    """Directory to persist reachable-frequency indexes across sessions"""
+    reachability_cache_dir: Optional[str] = None
+
+    """Component kinds whose configurations solve() can extract"""
+    CONFIG_COMPONENTS = (
+        "clock",
+        "converter",
+        "fpga",
+        "jesd",
+        "datapath",
+        "plls",
+    )
+
+    """How objectives spanning several tiers are optimized with CPLEX:
+    "static" adds one static lexicographic objective, "staged" solves each
+    tier in turn and fixes its optimum before the next. Set before
+    initialize()"""
+    lex_strategy = "static"
+    """Seconds per stage of a staged solve, a list with one limit per tier,
+    or None for no limit"""
+    lex_stage_time_limit: Union[None, float, List[Optional[float]]] = None
+    """Per-tier outcome of the last staged solve"""
+    lex_stage_report: List[StageResult]
+
     Debug_Solver = False
     solver = "CPLEX"
     _solution = None
+    _cpo_solver = None
+    _lex_stages = None
 
     _plls = []
     _initialized = False
@@ -128,7 +182,7 @@ class system(SystemPLL, system_draw):
         if self.solver == "gekko":
             if not solvers.gekko_solver:
                 raise Exception("GEKKO Solver not installed")
-            return solvers.GEKKO(remote=False)
+            return gekko_rundir.new_model(self._run_key)
         elif self.solver == "CPLEX":
             if not solvers.cplex_solver:
                 raise Exception("CPLEX Solver not installed")
@@ -163,6 +217,8 @@ class system(SystemPLL, system_draw):
         self._solution = None
         self._initialized = False
         self._last_clocks = None
+        self._lex_stages = None
+        self.lex_stage_report = []
 
     def __init__(
         self,
@@ -188,12 +244,19 @@ class system(SystemPLL, system_draw):
         """
         if solver:
             self.solver = solver
+        # Names the GEKKO run directory; each model still gets its own one,
+        # recycled for later systems of the same topology
+        self._run_key = "_".join(
+            [*(conv if isinstance(conv, list) else [conv]), clk, fpga]
+        )
         self.model = self._new_solver_model()
         self.vcxo = vcxo
         self._plls = []
         self._plls_sysref = []
         self._initialized = False
         self._last_clocks = None
+        self._lex_stages = None
+        self.lex_stage_report = []
         self._user_objectives: List[Objective] = []
 
         # Validate arb_source compatibility with solver
@@ -263,13 +326,44 @@ class system(SystemPLL, system_draw):
         self.converter = []
         self.clock = []
 
-    def _get_configs(self) -> Dict:
+    def _get_configs(self, components: Optional[List[str]] = None) -> Dict:
         """Collect extracted configurations from all components in system from solver.
 
+        For CPLEX, all solved values are read into a
+        :class:`adijif.gekko_trans.SolutionSnapshot` once and every component
+        extracts its configuration from that snapshot.
+
+        Args:
+            components (List[str]): Component kinds to extract, any of
+                ``CONFIG_COMPONENTS``. All are extracted when None.
+
         Returns:
             Dict: Dictionary containing all clocking configurations of all components
+
+        Raises:
+            Exception: Unknown component kind requested
         """
-        cfg = {"clock": self.clock.get_config(self._solution), "converter": []}
+        if components is None:
+            wanted = set(self.CONFIG_COMPONENTS)
+        else:
+            wanted = set(components)
+            unknown = wanted - set(self.CONFIG_COMPONENTS)
+            if unknown:
+                raise Exception(
+                    f"Unknown components {sorted(unknown)}. "
+                    + f"Options: {self.CONFIG_COMPONENTS}"
+                )
+
+        solution = self._solution
+        if self.solver == "CPLEX" and solution is not None:
+            solution = SolutionSnapshot(solution)
+
+        cfg: Dict = {}
+        # FPGA configs need the reference rates from the clock chip
+        if wanted & {"clock", "fpga"}:
+            cfg["clock"] = self.clock.get_config(solution)
+        if "converter" in wanted:
+            cfg["converter"] = []
 
         c = (
             self.converter
@@ -280,41 +374,50 @@ class system(SystemPLL, system_draw):
             if conv._nested:
                 names = conv._nested
                 for name in names:
-                    clk_ref = cfg["clock"]["output_clocks"][
-                        f"{self.fpga.name}_{name}_ref_clk"
-                    ]["rate"]
-                    cfg["fpga_" + name] = self.fpga.get_config(
-                        solution=self._solution,
-                        converter=getattr(conv, name),
-                        fpga_ref=clk_ref,
-                    )
-                    cfg["converter"] = conv.get_config(self._solution)  # type: ignore
-                    cfg["jesd_" + name] = getattr(conv, name).get_jesd_config(
-                        self._solution
-                    )
-                    if getattr(conv, name).datapath:
+                    if "fpga" in wanted:
+                        clk_ref = cfg["clock"]["output_clocks"][
+                            f"{self.fpga.name}_{name}_ref_clk"
+                        ]["rate"]
+                        cfg["fpga_" + name] = self.fpga.get_config(
+                            solution=solution,
+                            converter=getattr(conv, name),
+                            fpga_ref=clk_ref,
+                        )
+                    if "converter" in wanted:
+                        cfg["converter"] = conv.get_config(solution)  # type: ignore
+                    if "jesd" in wanted:
+                        cfg["jesd_" + name] = getattr(
+                            conv, name
+                        ).get_jesd_config(solution)
+                    if "datapath" in wanted and getattr(conv, name).datapath:
                         cfg["datapath_" + name] = getattr(
                             conv, name
                         ).datapath.get_config()
             else:
-                clk_ref = cfg["clock"]["output_clocks"][
-                    f"{self.fpga.name}_{conv.name}_ref_clk"
-                ]["rate"]
-                cfg["fpga_" + conv.name] = self.fpga.get_config(
-                    solution=self._solution, converter=conv, fpga_ref=clk_ref
-                )
-                cfg["converter_" + conv.name] = conv.get_config(self._solution)
-                cfg["jesd_" + conv.name] = conv.get_jesd_config(self._solution)
+                if "fpga" in wanted:
+                    clk_ref = cfg["clock"]["output_clocks"][
+                        f"{self.fpga.name}_{conv.name}_ref_clk"
+                    ]["rate"]
+                    cfg["fpga_" + conv.name] = self.fpga.get_config(
+                        solution=solution, converter=conv, fpga_ref=clk_ref
+                    )
+                if "converter" in wanted:
+                    cfg["converter_" + conv.name] = conv.get_config(solution)
+                if "jesd" in wanted:
+                    cfg["jesd_" + conv.name] = conv.get_jesd_config(solution)
 
-        # Collect PLLs driving converter sampling clock configs
-        for pll in self._plls:
-            cfg["clock_ext_pll_" + pll.name] = pll.get_config(self._solution)
+        if "plls" in wanted:
+            # Collect PLLs driving converter sampling clock configs
+            for pll in self._plls:
+                cfg["clock_ext_pll_" + pll.name] = pll.get_config(solution)
 
-        # Collect PLLs driving sysref clocks configurations.
-        for pll in self._plls_sysref:
-            cfg["clock_ext_pll_sysref_" + pll.name] = pll.get_config(
-                self._solution
-            )
+            # Collect PLLs driving sysref clocks configurations.
+            for pll in self._plls_sysref:
+                cfg["clock_ext_pll_sysref_" + pll.name] = pll.get_config(
+                    solution
+                )
+        if "clock" not in wanted:
+            cfg.pop("clock", None)
         return cfg
 
     def _filter_sysref(
@@ -364,18 +467,14 @@ class system(SystemPLL, system_draw):
         # Set up solver
         self.model.solver_options = self.solver_options
         self.model.options.SOLVER = 1  # APOPT solver
-        folder = self.model._path
         # self.model.options.SOLVER = 3  # 1 APOPT, 2 BPOPT, 3 IPOPT
         # self.model.options.IMODE = 5   # simultaneous estimation
-        try:
-            self.model.solve(disp=self.Debug_Solver, debug=True)
-            self.model.cleanup()
-        finally:
-            if os.path.isdir(folder) and os.path.isfile(
-                os.path.join(folder, "apopt.opt")
-            ):
-                print("DELETE: " + folder)
-                # shutil.rmtree(folder)
+        gekko_rundir.solve(
+            self.model,
+            keep_files=self.Debug_Solver,
+            disp=self.Debug_Solver,
+            debug=True,
+        )
 
     def _solve_cplex(self) -> None:
         """Call CPLEX solver API."""
@@ -383,15 +482,48 @@ class system(SystemPLL, system_draw):
         ll = "Normal" if self.Debug_Solver else "Quiet"
         wl = 0  # WarningLevel 0-off 3-all warnings
         # self.model.export_model()
-        self._solution = self.model.solve(LogVerbosity=ll, WarningLevel=wl)
+        _solving.system = self
+        try:
+            if self._lex_stages:
+                self._solution, self.lex_stage_report = solve_staged(
+                    self.model,
+                    self._lex_stages,
+                    self.lex_stage_time_limit,
+                    LogVerbosity=ll,
+                    WarningLevel=wl,
+                    listeners=[_TrackSolver],
+                )
+            else:
+                self._solution = self.model.solve(
+                    LogVerbosity=ll, WarningLevel=wl, listeners=[_TrackSolver]
+                )
+        finally:
+            _solving.system = None
+            self._cpo_solver = None
         # self._solution.print_solution()
         if not self._solution.is_solution():
             raise Exception("No solution found")
 
+    def abort_solve(self) -> bool:
+        """Abort a CPLEX solve running in another thread.
+
+        The interrupted :meth:`do_solve` raises unless a solution was
+        already found.
+
+        Returns:
+            bool: True if a running solve was asked to stop
+        """
+        solver = getattr(self, "_cpo_solver", None)
+        if solver is None:
+            return False
+        solver.abort_search()
+        return True
+
     def solve(
         self,
         out_clock_constraints: dict = None,
         constrain: Optional[Callable[[ClocksBundle], None]] = None,
+        components: Optional[List[str]] = None,
     ) -> Dict:
         """Define clocking requirements and run the active solver.
 
@@ -410,6 +542,9 @@ class system(SystemPLL, system_draw):
                 before the solver runs. Use it to add custom range / equality
                 / OR constraints via ``clocks.constrain(...)`` or by passing
                 solver expressions directly to ``self.model``.
+            components: Optional component kinds to extract configurations
+                for, any of ``CONFIG_COMPONENTS``. Skipping unneeded kinds
+                shortens extraction in sweeps. All are extracted when None.
 
         Returns:
             Dict: Dictionary containing all clocking configuration for all components
@@ -422,7 +557,7 @@ class system(SystemPLL, system_draw):
                 self._apply_out_clock_constraints(clocks, out_clock_constraints)
         if constrain is not None:
             constrain(clocks)
-        return self.do_solve()
+        return self.do_solve(components)
 
     def export_config(
         self, *, format: str, solution: Optional[Dict] = None
@@ -444,6 +579,22 @@ class system(SystemPLL, system_draw):
         solved = self.solve() if solution is None else solution
         return JifDtContract.from_system_solution(self, solved)
 
+    def capture(self, path: str) -> Dict:
+        """Write the wired solver model and a settings manifest to disk.
+
+        The model is initialized first if needed. Captures can be re-solved
+        with :func:`adijif.capture.replay_capture` or ``jifagent replay``.
+
+        Args:
+            path (str): Capture prefix. ``.cpo`` and ``.json`` are appended.
+
+        Returns:
+            Dict: Manifest that was written
+        """
+        from adijif.capture import capture_system
+
+        return capture_system(self, path)
+
     def _apply_out_clock_constraints(
         self, clocks: ClocksBundle, out_clock_constraints: dict
     ) -> None:
@@ -542,6 +693,7 @@ class system(SystemPLL, system_draw):
             self.fpga.configs = []  # reset
             serdes_used_tx: int = 0
             serdes_used_rx: int = 0
+            fixed_rates = []
             sys_refs = []  # DEBUG ONLY
             sys_ref_names = []  # DEBUG ONLY
 
@@ -653,6 +805,7 @@ class system(SystemPLL, system_draw):
                     self.clock._add_equation(
                         config[conv.name + "_ref_clk"] == clks[0]
                     )
+                    fixed_rates.append(clks[0])
 
                 # Setup sysref clocks (clock-chip or external sysref PLL).
                 # Must run regardless of whether converter ref clk uses an external PLL.
@@ -705,7 +858,20 @@ class system(SystemPLL, system_draw):
             # if self.plls_sysref:
             #     self._plls_sysref[0]._clk_names = sys_ref_names
 
-            apply_objectives(self.model, self.solver, collect_objectives(self))
+            if self.use_reachability_index:
+                for occ, value in (out_clock_constraints or {}).items():
+                    if occ in clock_names:
+                        if isinstance(value, dict):
+                            value = value.get("rate")
+                        fixed_rates.append(value)
+                self._check_reachable_rates(fixed_rates)
+
+            self._lex_stages = apply_objectives(
+                self.model,
+                self.solver,
+                collect_objectives(self),
+                lex_strategy=self.lex_strategy,
+            )
 
         clocks = ClocksBundle(config, owner=self)
 
@@ -717,9 +883,53 @@ class system(SystemPLL, system_draw):
         self._initialized = True
         return clocks
 
-    def do_solve(self) -> Dict:
+    def _check_reachable_rates(self, rates: List) -> None:
+        """Reject fixed clock chip rates that cannot be generated together.
+
+        Called from initialize once the part constraints are built, with the
+        converter reference clocks taken directly from the clock chip and
+        the numeric out_clock_constraints. Only integer-valued rates with a
+        fixed VCXO are checked; SYSREF, FPGA and PLL reference outputs and
+        anything else the index cannot reason about exactly are left to the
+        solver.
+
+        Args:
+            rates (List): Rates requested from the clock chip. Solver
+                expressions are ignored.
+
+        Raises:
+            Exception: Clock chip cannot produce all rates simultaneously
+        """
+        from adijif.clocks.reachability import get_reachable_index
+
+        if not isinstance(self.vcxo, (int, float)):
+            return
+        fixed = [
+            r
+            for r in rates
+            if isinstance(r, (int, float)) and float(r).is_integer()
+        ]
+        if not fixed:
+            return
+        try:
+            index = get_reachable_index(
+                self.clock, self.vcxo, self.reachability_cache_dir
+            )
+        except (NotImplementedError, ValueError):
+            return
+        if not index.can_produce(fixed):
+            raise Exception(
+                f"{self.clock.name} cannot generate {fixed} simultaneously "
+                f"from {self.vcxo} Hz reference"
+            )
+
+    def do_solve(self, components: Optional[List[str]] = None) -> Dict:
         """Solve actual solver on model which has been fully configured.
 
+        Args:
+            components (List[str]): Component kinds to extract configurations
+                for, any of ``CONFIG_COMPONENTS``. All are extracted when None.
+
         Returns:
             Dict: Dictionary containing all clocking configuration for all components
 
@@ -735,7 +945,7 @@ class system(SystemPLL, system_draw):
             raise Exception("Unknown solver {}".format(self.solver))
 
         # Organize data
-        return self._get_configs()
+        return self._get_configs(components)
 
     def determine_clocks(self) -> List:
         """Defined clocking requirements and search over all possible dividers.
@@ -749,6 +959,12 @@ class system(SystemPLL, system_draw):
         # Extract dependent rates from converter
         rates = self.converter.device_clock_available()  # type: ignore
 
+        # The PLL divider search is exact integer arithmetic, so fractional
+        # lane rates and references have no PLL configuration
+        bit_clock = self.converter.bit_clock  # type: ignore
+        if not float(bit_clock).is_integer():
+            rates = []
+
         out = []
         for rate in rates:
             rate = np.array(rate, dtype=int)
@@ -762,21 +978,24 @@ class system(SystemPLL, system_draw):
             # requirements based on available reference clocks
             valid_clock_configs = []
             for clk_config in clk_configs:
-                refs = self.clock.list_available_references(clk_config)
+                refs = [
+                    int(ref)
+                    for ref in self.clock.list_available_references(clk_config)
+                    if float(ref).is_integer()
+                ]
+                if not refs:
+                    continue
+                # Evaluate every candidate reference in one vectorized pass
+                pll_configs = self.fpga.determine_pll_batch(  # type: ignore
+                    bit_clock, refs
+                )
                 for ref in refs:
-                    try:
-                        info = self.fpga.determine_pll(
-                            self.converter.bit_clock,
-                            ref,  # type: ignore
-                        )
+                    if (bit_clock, ref) in pll_configs:
+                        info = dict(pll_configs[(bit_clock, ref)])
+                        del info["bit_clock"], info["fpga_ref_clock"]
+                        clk_config["fpga_pll_config"] = info
+                        valid_clock_configs.append(clk_config)
                         break
-                    except:  # noqa: B036, B001
-                        ref = False
-                        continue
-
-                if ref:
-                    clk_config["fpga_pll_config"] = info
-                    valid_clock_configs.append(clk_config)
 
             if not valid_clock_configs:
                 continue
@@ -790,7 +1009,7 @@ class system(SystemPLL, system_draw):
                     sysref_rate = self._determine_sysref(refs)
                     clk_config["sysref_rate"] = sysref_rate
                     complete_clock_configs.append(clk_config)
-                except:  # noqa: B036, B001, S112
+                except SysrefConfigurationError:
                     continue
 
             if not complete_clock_configs:
@@ -814,7 +1033,7 @@ class system(SystemPLL, system_draw):
             refs (List[int],List[float]): List of system device clocks
 
         Raises:
-            Exception: No valid configurations found
+            SysrefConfigurationError: No valid configurations found
 
         Returns:
             int/float: Sysref rate in samples per second
@@ -833,6 +1052,6 @@ class system(SystemPLL, system_draw):
             div *= 2
 
         if not sysref_rate:
-            raise Exception("No possible sysref found")
+            raise SysrefConfigurationError("No possible sysref found")
 
         return sysref_rate
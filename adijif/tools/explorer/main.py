@@ -8,6 +8,8 @@ import streamlit as st
 from src.pages import PAGE_MAP
 from src.utils import add_custom_css, render_sidebar_logo
 
+from adijif.draw import Layout
+
 # from src.state import provide_state
 
 
@@ -26,6 +28,9 @@ st.set_page_config(
 # Apply custom CSS to main page and sidebar
 add_custom_css()
 
+# Reruns redraw the same solved configurations; reuse their renders
+Layout.use_render_cache = True
+
 
 # @provide_state()
 def main(state: Optional[object] = None) -> None:
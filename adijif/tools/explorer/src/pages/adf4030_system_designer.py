@@ -4,7 +4,11 @@ from typing import Optional
 
 import streamlit as st
 
-from adijif.plls.utils.adf4030_arch import ARCHITECTURES, Adf4030Architecture
+from adijif.plls.utils.adf4030_arch import (
+    ARCHITECTURES,
+    Adf4030Architecture,
+    find_architecture_frontier,
+)
 
 from ..utils import Page, get_diagram_theme
 
@@ -26,8 +30,10 @@ class Adf4030SystemDesigner(Page):
         "Aion, how many Unit Boards) for the chosen architecture and "
         "renders a topology diagram.\n\n"
         "Use the **Diagram scope** radio to switch between a single "
-        "Unit Board view and the full system. At large N the system "
-        "view can take a while to render."
+        "Unit Board view and the full system. Large systems are "
+        "summarized: one Unit Board is drawn in full and the others as "
+        "collapsed replicas. Use **Diagram detail** to force full or "
+        "summarized drawing and pick which Unit Boards to expand."
     )
 
     def __init__(self, state: Optional[object]) -> None:
@@ -81,6 +87,14 @@ class Adf4030SystemDesigner(Page):
                 ("ub", "system"),
                 key="adf4030_scope",
             )
+            detail = "auto"
+            if scope == "system":
+                detail = st.radio(
+                    "Diagram detail",
+                    ("auto", "full", "summary"),
+                    key="adf4030_detail",
+                    horizontal=True,
+                )
 
         try:
             arch = Adf4030Architecture(
@@ -96,6 +110,42 @@ class Adf4030SystemDesigner(Page):
 
         self.section("Partition summary")
         st.text(arch.summary)
+        self.section("Pareto-optimal architectures")
+        st.caption(
+            "Architecture and branch choices for this system size that no "
+            "other choice beats on total Aions, Aions per FPGA and cascade "
+            "depth (all lower is better)."
+        )
+        frontier = find_architecture_frontier(
+            int(N), int(N_Apollo), int(N_FPGA)
+        )
+        st.table(
+            [
+                {
+                    "Architectures (N_branch)": ", ".join(
+                        a if b is None else f"{a} ({b})"
+                        for a, b in point["candidates"]
+                    ),
+                    "Total Aions": point["N_Aion_system"],
+                    "Max Aions per FPGA": point["Max_Aion_per_FPGA"],
+                    "Cascade depth": point["cascade_depth"],
+                }
+                for point in frontier
+            ]
+        )
         self.section("Diagram")
-        svg = arch.draw(scope=scope, theme=get_diagram_theme())
+        expand = None
+        if scope == "system" and detail != "full":
+            expand = st.multiselect(
+                "Unit Boards drawn in full when summarized",
+                list(range(arch.partition["N_UB"])),
+                default=[0],
+                key="adf4030_expand",
+            )
+        svg = arch.draw(
+            scope=scope,
+            theme=get_diagram_theme(),
+            detail=detail,
+            expand=expand,
+        )
         st.components.v1.html(svg, height=600, scrolling=True)
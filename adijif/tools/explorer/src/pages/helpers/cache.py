@@ -0,0 +1,146 @@
+"""Cached converter templates and JESD mode tables for explorer pages.
+
+Streamlit reruns a page script on every widget change. Building converter
+objects, scanning every supported part and rebuilding JESD option lists on
+each rerun makes large parts such as AD9084/AD9088 sluggish, so these are
+computed once per process and shared between sessions.
+
+Objects from ``cache_resource`` helpers are shared and must be treated as
+read-only. Use :func:`get_converter` for a converter that can be configured.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import streamlit as st
+
+from adijif.converters import supported_parts
+from adijif.registry import get_component_class
+
+from .jesd import get_jesd_controls, get_valid_jesd_modes
+
+
+@st.cache_resource(show_spinner=False)
+def converter_template(part: str) -> object:
+    """Get the shared, unconfigured converter of a part.
+
+    Args:
+        part: Converter part name
+
+    Returns:
+        Shared converter object. Do not modify it.
+    """
+    return get_component_class("converter", part)()
+
+
+def get_converter(part: str) -> object:
+    """Get a converter of a part that the caller may configure.
+
+    Args:
+        part: Converter part name
+
+    Returns:
+        Clone of the cached converter template
+    """
+    return converter_template(part).clone()
+
+
+@st.cache_data(show_spinner=False)
+def supported_converter_parts() -> List[str]:
+    """List converter parts that provide JESD quick configuration modes.
+
+    Returns:
+        Part names in ``adijif.converters.supported_parts`` order
+    """
+    parts = []
+    for part in supported_parts:
+        try:
+            converter_template(part).quick_configuration_modes  # noqa: B018
+        except Exception:  # noqa: S112
+            continue
+        parts.append(part)
+    return parts
+
+
+@st.cache_resource(show_spinner=False)
+def jesd_controls(
+    part: str,
+) -> Tuple[Dict[str, List[Any]], Dict[str, Any]]:
+    """Get the JESD control options and mode table of a part.
+
+    Args:
+        part: Converter part name
+
+    Returns:
+        Shared (options dict, all_modes dict) as returned by
+        ``get_jesd_controls``. Do not modify them.
+    """
+    return get_jesd_controls(converter_template(part))
+
+
+def _setting(obj: object, name: str) -> Any:
+    """Read an optional converter setting, None when unavailable."""
+    try:
+        return getattr(obj, name, None)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _datapath_key(converter: object) -> str:
+    """Summarize the rate-changing settings of a converter for cache keys.
+
+    Covers ``decimation``/``interpolation``, which parts without a datapath
+    set directly, and every public and private datapath attribute.
+    """
+    state = [
+        (name, _setting(converter, name))
+        for name in ("decimation", "interpolation")
+    ]
+    datapath = getattr(converter, "datapath", None)
+    if datapath is not None:
+        state.append(("datapath", sorted(vars(datapath).items())))
+    return repr(state)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _valid_jesd_modes(
+    part: str,
+    sample_clock: float,
+    selections: Dict[str, Any],
+    datapath_key: str,
+    _converter: object,
+) -> Tuple[List[Dict[str, Any]], Any]:
+    """Cached body of :func:`valid_jesd_modes`.
+
+    ``_converter`` is not hashed; its state is captured by the other
+    arguments.
+    """
+    _, all_modes = jesd_controls(part)
+    return get_valid_jesd_modes(_converter, all_modes, selections)
+
+
+def valid_jesd_modes(
+    converter: object, part: str, selections: Dict[str, Any]
+) -> Tuple[List[Dict[str, Any]], Any]:
+    """Get the valid JESD mode table of a configured converter.
+
+    Results are keyed by part, sample rate, decimation, interpolation,
+    datapath state and the JESD parameter selections, which include the JESD
+    class when it is filtered on.
+
+    Args:
+        converter: Converter of ``part`` with its sample rate and datapath
+            configured. Its state is restored afterwards.
+        part: Converter part name
+        selections: User selections for filtering
+
+    Returns:
+        Tuple of (modes info list, found modes list or None) as returned by
+        ``get_valid_jesd_modes``
+    """
+    return _valid_jesd_modes(
+        part,
+        converter.sample_clock,
+        selections,
+        _datapath_key(converter),
+        converter,
+    )
@@ -0,0 +1,225 @@
+"""Background solving of System Configurator configurations.
+
+Solving a system and rendering its diagram can take seconds, and Streamlit
+restarts the page script on every widget change. Jobs run on a small
+process-wide worker pool instead, keyed by a fingerprint of the wired solver
+model, so the page stays interactive, a solve can be cancelled, and
+returning to an already-submitted configuration reuses its job.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+QUEUED = "queued"
+SOLVING = "solving"
+DRAWING = "drawing"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+def system_fingerprint(sys: Any, *extra: Any) -> str:
+    """Fingerprint an initialized system for job lookup.
+
+    The wired CPLEX model captures parts, modes, rates and user
+    constraints; user objectives added after initialization are hashed
+    separately. Generated comment lines (timestamps, source files) are
+    ignored.
+
+    Args:
+        sys: Initialized ``adijif.system``
+        *extra: Additional values that change the result, e.g. the
+            diagram theme
+
+    Returns:
+        str: Hex digest identifying the configuration
+    """
+    cpo = sys.model.get_cpo_string(add_source_location=False)
+    digest = hashlib.sha256()
+    for line in cpo.splitlines():
+        if not line.startswith("//"):
+            digest.update(line.encode())
+    for obj in sys.list_objectives():
+        digest.update(
+            repr(
+                (obj.name, obj.sense, obj.tier, obj.weight, str(obj.expr))
+            ).encode()
+        )
+    digest.update(repr(extra).encode())
+    return digest.hexdigest()
+
+
+class SolveJob:
+    """Solve and diagram render of one configuration."""
+
+    def __init__(self, fingerprint: str, sys: Any, theme: str) -> None:
+        """Create a queued job.
+
+        Args:
+            fingerprint: Configuration fingerprint
+            sys: Initialized system owned by the job
+            theme: Diagram theme
+        """
+        self.fingerprint = fingerprint
+        self.sys = sys
+        self.theme = theme
+        self.stage = QUEUED
+        self.config: Optional[Dict] = None
+        self.diagram: Any = None
+        self.error: Optional[str] = None
+        self.draw_error: Optional[str] = None
+        self.submitted = time.monotonic()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the job is queued or in progress."""
+        return self.stage in (QUEUED, SOLVING, DRAWING)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job started, or since submission if queued."""
+        start = self.started or self.submitted
+        return (self.finished or time.monotonic()) - start
+
+    def _advance(self, stage: str) -> bool:
+        """Move a running job to another stage.
+
+        Args:
+            stage: New stage
+
+        Returns:
+            bool: False if the job already finished or was cancelled
+        """
+        with self._lock:
+            if not self.running:
+                return False
+            self.stage = stage
+            if stage == SOLVING:
+                self.started = time.monotonic()
+            elif stage in (DONE, FAILED, CANCELLED):
+                self.finished = time.monotonic()
+            return True
+
+    def cancel(self) -> None:
+        """Stop the job. A running CPLEX search is aborted."""
+        if not self._advance(CANCELLED):
+            return
+        if self.future is not None:
+            self.future.cancel()
+        self.sys.abort_solve()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for the job to leave the running stages.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            bool: True if the job is no longer running
+        """
+        deadline = time.monotonic() + timeout
+        while self.running and time.monotonic() < deadline:
+            time.sleep(0.02)
+        return not self.running
+
+    def run(self) -> None:
+        """Solve the system, then render its diagram."""
+        if not self._advance(SOLVING):
+            return
+        try:
+            config = self.sys.do_solve()
+        except Exception as e:  # noqa: BLE001 -- solver raises bare Exception
+            self.error = str(e)
+            self._advance(FAILED)
+            return
+        self.config = config
+        if not self._advance(DRAWING):
+            return
+        try:
+            self.diagram = self.sys.draw(config, theme=self.theme)
+        except Exception as e:  # noqa: BLE001 -- diagram is optional
+            self.draw_error = str(e)
+        self._advance(DONE)
+
+
+class SolveJobManager:
+    """Run solve jobs on a bounded worker pool and keep recent results."""
+
+    def __init__(self, max_workers: int = 2, max_jobs: int = 16) -> None:
+        """Create the worker pool.
+
+        Args:
+            max_workers: Solves run at the same time
+            max_jobs: Jobs remembered for reuse. The oldest beyond this
+                are forgotten, and cancelled if still running.
+        """
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="jif-solve"
+        )
+        self._jobs: "OrderedDict[str, SolveJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fingerprint: str) -> Optional[SolveJob]:
+        """Look up the job of a configuration.
+
+        Args:
+            fingerprint: Configuration fingerprint
+
+        Returns:
+            SolveJob or None if the configuration was not submitted
+        """
+        with self._lock:
+            return self._jobs.get(fingerprint)
+
+    def submit(
+        self, fingerprint: str, sys: Any, theme: str, retry: bool = False
+    ) -> SolveJob:
+        """Start solving a configuration unless it already has a job.
+
+        Failures are kept, as solving the same model again fails the same
+        way. Cancelled jobs stay cancelled until ``retry`` is set.
+
+        Args:
+            fingerprint: Configuration fingerprint
+            sys: Initialized system. The job takes ownership of it.
+            theme: Diagram theme
+            retry: Replace a cancelled job with a new one
+
+        Returns:
+            SolveJob: New or reused job
+        """
+        with self._lock:
+            job = self._jobs.get(fingerprint)
+            if job is not None and not (retry and job.stage == CANCELLED):
+                self._jobs.move_to_end(fingerprint)
+                return job
+            job = SolveJob(fingerprint, sys, theme)
+            self._jobs[fingerprint] = job
+            evicted = []
+            while len(self._jobs) > self.max_jobs:
+                evicted.append(self._jobs.popitem(last=False)[1])
+            job.future = self._executor.submit(job.run)
+        for old in evicted:
+            old.cancel()
+        return job
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_manager() -> SolveJobManager:
+    """Get the process-wide solve job manager.
+
+    Returns:
+        SolveJobManager: Shared manager
+    """
+    return SolveJobManager()
@@ -5,13 +5,15 @@ from typing import Optional
 import pandas as pd
 import streamlit as st
 
-from adijif.converters import supported_parts as sp
-from adijif.registry import get_component_class
-
 from ..utils import Page, get_diagram_theme
+from .helpers.cache import (
+    get_converter,
+    jesd_controls,
+    supported_converter_parts,
+    valid_jesd_modes,
+)
 from .helpers.datapath import gen_datapath
 from .helpers.drawers import draw_adc, draw_dac
-from .helpers.jesd import get_jesd_controls, get_valid_jesd_modes
 
 # options_to_skip = ["global_index", "decimations"]
 
@@ -47,16 +49,8 @@ class JESDModeSelector(Page):
 
     def write(self) -> None:
         """Render the JESD mode selector page."""
-        # Get supported parts that have quick_configuration_modes
-        supported_parts_filtered = []
-        for part in sp:
-            try:
-                converter = get_component_class("converter", part)()
-                qsm = converter.quick_configuration_modes  # noqa: F841
-                supported_parts_filtered.append(part)
-            except Exception:  # noqa: S110
-                pass
-        supported_parts = supported_parts_filtered
+        # Supported parts that have quick_configuration_modes
+        supported_parts = supported_converter_parts()
 
         self.header()
 
@@ -67,7 +61,7 @@ class JESDModeSelector(Page):
             key="converter_part_select",
         )
 
-        converter = get_component_class("converter", sb)()
+        converter = get_converter(sb)
 
         # Show diagram
         self.section("Diagram")
@@ -147,7 +141,7 @@ class JESDModeSelector(Page):
         cols = st.columns(2, border=True)
 
         # JESD204 Configuration Inputs
-        options, all_modes = get_jesd_controls(converter)
+        options, _ = jesd_controls(sb)
         selections = {}
 
         with cols[0]:
@@ -162,8 +156,8 @@ class JESDModeSelector(Page):
 
         # Output table of valid modes and calculate clocks
         selections = {k: v for k, v in selections.items() if v != []}
-        modes_all_info, found_modes = get_valid_jesd_modes(
-            converter, all_modes, selections
+        modes_all_info, found_modes = valid_jesd_modes(
+            converter, sb, selections
         )
 
         with cols[1]:
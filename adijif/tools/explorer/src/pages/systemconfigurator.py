@@ -13,6 +13,15 @@ from adijif.converters import supported_parts as xsp
 from ..utils import Page, get_diagram_theme
 from .helpers.datapath import gen_datapath
 from .helpers.optimization import gen_clock_constraints, gen_clock_objectives
+from .helpers.solve_jobs import (
+    CANCELLED,
+    DRAWING,
+    FAILED,
+    QUEUED,
+    SolveJob,
+    get_job_manager,
+    system_fingerprint,
+)
 
 # Clocks
 options_to_skip = ["list_references_available", "d_syspulse"]
@@ -22,6 +31,9 @@ sp = [p for p in csp if p not in parts_to_ignore]
 sp = [p for p in sp if p != "hmc7044"]
 sp.insert(0, "hmc7044")
 
+# Solves finishing within this many seconds render without a progress view
+_FOREGROUND_WAIT = 2.0
+
 # Converters
 
 
@@ -334,11 +346,17 @@ class SystemConfigurator(Page):
         if clocks is None:
             st.write("System not initialized.")
         else:
+            job = self._submit_solve(sys)
             cfg = None
-            try:
-                cfg = sys.do_solve()
-            except Exception as e:  # noqa: BLE001 -- solver raises bare Exception
-                st.error(f"Error solving system configuration: {e}")
+            if job.running:
+                self._show_progress(job)
+            elif job.stage == CANCELLED:
+                st.warning("Solve cancelled.")
+                st.button("Solve again", key="system_solve_retry")
+            elif job.stage == FAILED:
+                st.error(f"Error solving system configuration: {job.error}")
+            else:
+                cfg = job.config
 
             if cfg is not None:
                 st.subheader("Clock Configuration")
@@ -353,10 +371,52 @@ class SystemConfigurator(Page):
                 st.subheader("Converter JESD Configuration")
                 st.write(cfg["jesd_" + sys.converter.name.upper()])
 
-                diagram = sys.draw(cfg, theme=get_diagram_theme())
+                if job.draw_error:
+                    st.warning(f"Error drawing system: {job.draw_error}")
+                diagram = job.diagram
 
         self.section("Diagram")
         if diagram:
             st.image(diagram, width="stretch")
         else:
             st.write("No diagram available.")
+
+    def _submit_solve(self, sys: adijif.system) -> SolveJob:
+        """Hand the configured system to a background solve job.
+
+        Jobs are keyed by the configuration fingerprint, so returning to a
+        configuration that was already submitted reuses its job. Quick
+        solves are waited for briefly to avoid flashing a progress view.
+
+        Args:
+            sys: Initialized system
+
+        Returns:
+            SolveJob: Job of the current configuration
+        """
+        theme = get_diagram_theme()
+        fingerprint = system_fingerprint(sys, theme)
+        retry = bool(st.session_state.get("system_solve_retry"))
+        job = get_job_manager().submit(fingerprint, sys, theme, retry=retry)
+        job.wait(_FOREGROUND_WAIT)
+        return job
+
+    @st.fragment(run_every=0.5)
+    def _show_progress(self, job: SolveJob) -> None:
+        """Show progress of a running job and rerun the page once it ends.
+
+        Args:
+            job: Running solve job
+        """
+        if not job.running:
+            st.rerun()
+        stage = "Rendering diagram" if job.stage == DRAWING else "Solving"
+        if job.stage == QUEUED:
+            stage = "Waiting for a solver"
+        cols = st.columns([0.8, 0.2])
+        with cols[0]:
+            st.info(f"{stage}... {job.elapsed:.1f} s")
+        with cols[1]:
+            if st.button("Cancel", key="system_solve_cancel"):
+                job.cancel()
+                st.rerun()
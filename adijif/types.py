@@ -1,10 +1,9 @@
 """ADI JIF utility types and functions."""
 
-from typing import Dict, Union
+from fractions import Fraction
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-import numpy as np
-
-from adijif.solvers import GEKKO, CpoModel, integer_var  # type: ignore
+from adijif.solvers import GEKKO, CpoModel, allowed_assignments, integer_var  # type: ignore
 
 
 class range:
@@ -32,15 +31,24 @@ class range:
         assert isinstance(stop, int), "stop must be an int"
         assert isinstance(step, int), "step must be an int"
         assert isinstance(name, str), "name must be a string"
+        assert step > 0, "step must be positive"
 
         self.start = start
         self.stop = stop
         self.step = step
         self.name = name
 
+    def __len__(self) -> int:
+        """Number of values in the range."""
+        return max(0, -(-(self.stop - self.start) // self.step))
+
     def __call__(self, model: Union[GEKKO, CpoModel]) -> Dict:
         """Generate range for parameter solver.
 
+        Values are modeled as ``start + step * k`` with an integer index
+        ``k`` rather than as an enumerated list, so model size does not grow
+        with the number of values.
+
         Args:
             model (GEKKO, CpoModel): Model of JESD system or part to solve
 
@@ -61,11 +69,17 @@ class range:
             )
 
         config = {}
+        count = len(self)
+        last = self.start + self.step * (count - 1)
         if isinstance(model, CpoModel):
-            o_array = np.arange(self.start, self.stop, self.step)
             config["range"] = integer_var(
-                domain=o_array, name=self.name + "_Var"
+                self.start, last, name=self.name + "_Var"
             )
+            if self.step != 1:
+                # value = start + step * k keeps both domains as intervals
+                index = integer_var(0, count - 1, name=self.name + "_k")
+                model.add(config["range"] == self.start + self.step * index)
+                config["index"] = index
             return config
 
         if self.step == 1:
@@ -77,15 +91,16 @@ class range:
                 name=self.name + "_Var",
             )
         else:
-            # Create piecewise problem with binary values (DO NOT USE SOS1!)
-            o_array = np.arange(self.start, self.stop, self.step)
-            o_array = list(map(int, o_array))
-
-            options = model.Array(
-                model.Var, len(o_array), lb=0, ub=1, integer=True
+            # Scaled integer index instead of one binary per value
+            index = model.Var(
+                integer=True,
+                lb=0,
+                ub=count - 1,
+                value=0,
+                name=self.name + "_k",
             )
-            model.Equation(model.sum(options) == 1)  # only select one
-            config["range"] = model.Intermediate(model.sum(o_array * options))
+            config["range"] = model.Intermediate(self.start + self.step * index)
+            config["index"] = index
 
         return config
 
@@ -111,6 +126,9 @@ class arb_source:
 
         # Use with system (requires CPLEX)
         sys = adijif.system("ad9081", "hmc7044", "xilinx", vcxo, solver="CPLEX")
+
+        # Optionally shrink the search to references the clock chip can use
+        vcxo.presolve(sys.clock, [1e9, 7.8125e6])
     """
 
     _max_scalar = int(1e11)
@@ -142,9 +160,88 @@ class arb_source:
         if b_max is None:
             b_max = self._max_scalar
 
+        self._bounds = (a_min, b_min, a_max, b_max)
+        self._pairs: Optional[List[Tuple[int, int]]] = None
+        self.candidates: Optional[List[float]] = None
+        """Reference values kept by :meth:`presolve`, simplest first"""
+
         self._a = integer_var(a_min, a_max, name=name + "_a")
         self._b = integer_var(b_min, b_max, name=name + "_b")
 
+    def _pair(self, ref: Fraction) -> Optional[Tuple[int, int]]:
+        """Smallest numerator and denominator in bounds representing ref.
+
+        Args:
+            ref (Fraction): Reference frequency
+
+        Returns:
+            Tuple[int, int]: ``(a, b)`` with ``a / b == ref``, or None when
+            no multiple of the reduced fraction fits the bounds
+        """
+        a_min, b_min, a_max, b_max = self._bounds
+        a, b = ref.numerator, ref.denominator
+        k = max(1, -(-b_min // b), -(-a_min // a) if a else 1)
+        if k * b > b_max or k * a > a_max:
+            return None
+        return k * a, k * b
+
+    def presolve(
+        self,
+        clk: Any,
+        output_rates: Union[float, List[float]],
+        max_candidates: int = 32,
+    ) -> List[float]:
+        """Restrict the source to references a clock chip can divide down.
+
+        Candidate references are enumerated from the chip's divider sets
+        with :func:`adijif.clocks.reachability.rational_references`, and the
+        numerator and denominator are limited to those pairs instead of
+        the two wide integer domains. The restriction only considers
+        ``output_rates``, so pass every rate the chip must generate
+        exactly. Each of :attr:`candidates` can also be used as a fixed
+        reference in its own solve.
+
+        Must be called before the source is handed to a model.
+
+        Args:
+            clk (clock): Clock chip model the source feeds
+            output_rates (float, List[float]): Rates the chip must generate
+            max_candidates (int): Number of references kept at most
+
+        Returns:
+            List[float]: Candidate reference frequencies in hertz
+
+        Raises:
+            Exception: No reference within the bounds generates the rates
+        """
+        from adijif.clocks.reachability import rational_references
+
+        a_min, b_min, a_max, b_max = self._bounds
+        refs = rational_references(
+            clk,
+            output_rates,
+            ref_min=Fraction(a_min, b_max) if b_max else 0,
+            ref_max=Fraction(a_max, max(b_min, 1)),
+            max_denominator=b_max,
+            max_candidates=max_candidates,
+            accept=lambda ref: self._pair(ref) is not None,
+        )
+        if not refs:
+            raise Exception(
+                f"No {self.name} reference within bounds lets {clk.name} "
+                f"generate {output_rates}"
+            )
+        pairs = [self._pair(ref) for ref in refs]
+        self._pairs = pairs
+        self._a = integer_var(
+            domain=sorted({a for a, _ in pairs}), name=self.name + "_a"
+        )
+        self._b = integer_var(
+            domain=sorted({b for _, b in pairs}), name=self.name + "_b"
+        )
+        self.candidates = [float(ref) for ref in refs]
+        return self.candidates
+
     def __call__(self, model: Union[GEKKO, CpoModel]) -> Dict:
         """Generate arbitrary source for solver.
 
@@ -174,6 +271,8 @@ class arb_source:
         if isinstance(model, CpoModel):
             # config[self.name] = self._a / self._b
             # return config
+            if self._pairs:
+                model.add(allowed_assignments([self._a, self._b], self._pairs))
             return self._a / self._b
 
         raise NotImplementedError(
@@ -11,6 +11,7 @@ import adijif.fpgas.xilinx.sevenseries as xp
 import adijif.fpgas.xilinx.ultrascaleplus as us
 from adijif.converters.converter import converter
 from adijif.fpgas.fpga import fpga
+from adijif.pareto import pareto_mask
 from adijif.solvers import CpoModel, cplex_solver, integer_var  # type: ignore
 
 
@@ -295,7 +296,8 @@ def _solve_one_mode(
     satisfy the requested constraints (lane count, empty bound range, or no
     solver solution).
     """
-    conv = copy.deepcopy(conv_template)
+    model = CpoModel()
+    conv = conv_template.clone(model)
     try:
         conv.set_quick_configuration_mode(mode, jesd_class)
     except Exception as e:
@@ -324,7 +326,6 @@ def _solve_one_mode(
     if sc_min > sc_max:
         raise _InfeasibleMode()
 
-    model = CpoModel()
     sc_var = integer_var(int(sc_min), int(sc_max), name="sample_clock")
     conv._sample_clock = sc_var
 
@@ -387,33 +388,30 @@ def _solve_one_mode_with_clock(
     if conv_template.L > fpga_template.max_serdes_lanes:
         raise _InfeasibleMode()
 
-    conv_local = copy.deepcopy(conv_template)
-    clock_local = copy.deepcopy(clock_template)
-    fpga_local = copy.deepcopy(fpga_template)
+    sys_obj = adijif.system(
+        type(conv_template).__name__,
+        type(clock_template).__name__,
+        type(fpga_template).__name__,
+        vcxo,
+        solver="CPLEX",
+    )
+    # Override the system's freshly-constructed components with clones of
+    # the user's templates, bound to the system's shared solver model.
+    conv_local = conv_template.clone(sys_obj.model)
 
     try:
         conv_local.set_quick_configuration_mode(mode, jesd_class)
     except Exception as e:
         raise _InfeasibleMode() from e
 
-    if conv_local.L > fpga_local.max_serdes_lanes:
+    if conv_local.L > fpga_template.max_serdes_lanes:
         raise _InfeasibleMode()
 
-    sys_obj = adijif.system(
-        type(conv_local).__name__,
-        type(clock_local).__name__,
-        type(fpga_local).__name__,
-        vcxo,
-        solver="CPLEX",
-    )
-    # Override the system's freshly-constructed components with the user's
-    # deep-copies, rebinding each to the system's shared solver model.
     sys_obj.converter = conv_local
-    sys_obj.converter.model = sys_obj.model
+    clock_local = clock_template.clone(sys_obj.model)
     sys_obj.clock = clock_local
-    sys_obj.clock.model = sys_obj.model
+    fpga_local = fpga_template.clone(sys_obj.model)
     sys_obj.fpga = fpga_local
-    sys_obj.fpga.model = sys_obj.model
 
     bc_min = conv_local.bit_clock_min_available[jesd_class]
     bc_max = conv_local.bit_clock_max_available[jesd_class]
@@ -521,7 +519,7 @@ def find_extreme_rate(
     When ``mode`` is omitted, every mode in
     ``conv.quick_configuration_modes`` is tried and the best result is
     returned. The input ``conv`` (and ``clock``, ``fpga``) is not
-    mutated; each attempt runs on a deep copy.
+    mutated; each attempt runs on a :meth:`~adijif.common.core.clone`.
 
     Args:
         conv: Converter object to evaluate. Nested converters (MxFE /
@@ -628,3 +626,369 @@ def find_extreme_rate(
     if best is None:
         raise Exception(f"No feasible JESD configuration found for {conv.name}")
     return best
+
+
+_FRONTIER_COLUMNS = ("sample_clock", "bit_clock", "L", "M", "Np")
+
+
+def find_rate_frontier(
+    conv: converter,
+    *,
+    objectives: Optional[dict] = None,
+    fpga: Optional[fpga] = None,
+    clock: Optional[object] = None,
+    vcxo: Optional[float] = None,
+    jesd_class: Optional[str] = None,
+) -> List[dict]:
+    """Find the Pareto frontier of JESD modes for a converter.
+
+    Every mode in ``conv.quick_configuration_modes`` is rated in one
+    vectorized pass without a solver. A mode's ``sample_clock`` is the
+    highest integer sample rate allowed by the JESD class lane-rate limits,
+    the FPGA QPLL lane-rate cap (when ``fpga`` is given) and the device
+    sample-rate limits, matching the constraint-only result of
+    :func:`find_extreme_rate` with ``target="sample"``. ``bit_clock`` is the
+    lane rate at that sample rate. Modes needing more lanes than the FPGA
+    provides are dropped. Modes that are not dominated on ``objectives``
+    form the frontier.
+
+    When ``clock`` and ``vcxo`` are supplied, only the frontier points are
+    re-solved through the full clock chain, as :func:`find_extreme_rate`
+    does for a single mode.
+
+    Args:
+        conv: Converter object to evaluate. Nested converters are not
+            supported -- pass the rx or tx side directly. It is not
+            modified.
+        objectives: Columns to trade off and their sense, any of
+            ``sample_clock``, ``bit_clock``, ``L``, ``M`` and ``Np`` mapped
+            to ``"max"`` or ``"min"``. Defaults to
+            ``{"sample_clock": "max", "L": "min"}``.
+        fpga: Optional FPGA object bounding lane count and lane rate.
+            Required when ``clock`` is supplied.
+        clock: Optional clock chip used to verify frontier points.
+        vcxo: VCXO frequency in Hz. Required when ``clock`` is supplied.
+        jesd_class: Restrict to ``"jesd204b"`` or ``"jesd204c"``.
+
+    Returns:
+        List[dict]: Frontier points sorted by decreasing ``sample_clock``.
+        Each holds ``sample_clock``, ``bit_clock``, ``L``, ``M``, ``Np``,
+        ``mode`` and ``jesd_class``, plus ``modes`` listing every
+        (jesd_class, mode) pair with identical objective values. With
+        ``clock`` supplied, ``verified`` and the clock-chain solution
+        under ``clock_chain`` (None when the clock chain cannot realize
+        the mode) are added.
+
+    Raises:
+        ValueError: Invalid objectives, or ``clock`` without ``fpga`` or
+            ``vcxo``
+        Exception: Converter is nested or no mode is feasible
+    """
+    if objectives is None:
+        objectives = {"sample_clock": "max", "L": "min"}
+    if not objectives:
+        raise ValueError("objectives must not be empty")
+    for column, sense in objectives.items():
+        if column not in _FRONTIER_COLUMNS:
+            raise ValueError(
+                f"Unknown objective {column!r}. Options: {_FRONTIER_COLUMNS}"
+            )
+        if sense not in ("max", "min"):
+            raise ValueError(f"sense must be 'max' or 'min', got {sense!r}")
+    if clock is not None and (fpga is None or vcxo is None):
+        raise ValueError("fpga and vcxo are required when clock is supplied")
+    if clock is None and vcxo is not None:
+        raise ValueError("vcxo is only meaningful when clock is supplied")
+    if getattr(conv, "_nested", False):
+        raise Exception(
+            f"{conv.name} is a nested device; pass the rx or tx side "
+            "(e.g. ad9081_rx) directly."
+        )
+
+    pairs = [
+        (jc, m)
+        for jc in conv.quick_configuration_modes
+        if jesd_class is None or jc == jesd_class
+        for m in conv.quick_configuration_modes[jc]
+    ]
+    if not pairs:
+        raise Exception(f"No JESD modes to evaluate for {conv.name}")
+    table = conv.quick_configuration_modes
+    M = np.array([table[jc][m]["M"] for jc, m in pairs], dtype=float)
+    L = np.array([table[jc][m]["L"] for jc, m in pairs], dtype=float)
+    Np = np.array([table[jc][m]["Np"] for jc, m in pairs], dtype=float)
+    encodings = ["8b10b" if jc == "jesd204b" else "64b66b" for jc, _ in pairs]
+    enc_n = np.array([conv.encodings_n[e] for e in encodings], dtype=float)
+    enc_d = np.array([conv.encodings_d[e] for e in encodings], dtype=float)
+    bc_min = np.array([conv.bit_clock_min_available[jc] for jc, _ in pairs])
+    bc_max = np.array([conv.bit_clock_max_available[jc] for jc, _ in pairs])
+
+    feasible = np.ones(len(pairs), dtype=bool)
+    if fpga is not None:
+        bc_max = np.minimum(bc_max, _fpga_max_lane_rate(fpga))
+        feasible &= fpga.max_serdes_lanes >= L
+
+    # sample_clock = bit_clock * L * encoding_n / (encoding_d * M * Np)
+    factor = (L * enc_n) / (enc_d * M * Np)
+    sc_min = bc_min * factor
+    sc_max = bc_max * factor
+    dev_sc_min = getattr(conv, "sample_clock_min", None)
+    if dev_sc_min is not None:
+        sc_min = np.maximum(sc_min, dev_sc_min)
+    dev_sc_max = getattr(conv, "sample_clock_max", None)
+    if dev_sc_max is not None:
+        sc_max = np.minimum(sc_max, dev_sc_max)
+    sample = np.floor(sc_max)
+    feasible &= (sc_min <= sc_max) & (sample >= np.ceil(sc_min))
+    lane = sample * (enc_d * M * Np) / (L * enc_n)
+
+    columns = {"sample_clock": sample, "bit_clock": lane, "L": L, "M": M}
+    columns["Np"] = Np
+    score = np.stack(
+        [
+            columns[c] if sense == "max" else -columns[c]
+            for c, sense in objectives.items()
+        ],
+        axis=1,
+    )
+    idx = np.nonzero(feasible)[0]
+    if not len(idx):
+        raise Exception(f"No feasible JESD configuration found for {conv.name}")
+    front = idx[pareto_mask(score[idx])]
+
+    points: dict = {}
+    for i in front:
+        key = tuple(score[i])
+        jc, m = pairs[i]
+        if key in points:
+            points[key]["modes"].append((jc, m))
+            continue
+        points[key] = {
+            "sample_clock": float(sample[i]),
+            "bit_clock": float(lane[i]),
+            "L": int(L[i]),
+            "M": int(M[i]),
+            "Np": int(Np[i]),
+            "mode": m,
+            "jesd_class": jc,
+            "modes": [(jc, m)],
+        }
+    frontier = sorted(
+        points.values(), key=lambda p: (-p["sample_clock"], p["L"], p["M"])
+    )
+
+    if clock is not None:
+        for point in frontier:
+            try:
+                result = _solve_one_mode_with_clock(
+                    conv,
+                    clock,
+                    fpga,
+                    vcxo,
+                    point["jesd_class"],
+                    point["mode"],
+                    "sample",
+                    "max",
+                )
+            except _InfeasibleMode:
+                result = None
+            point["verified"] = result is not None
+            point["clock_chain"] = result
+    return frontier
+
+
+# (coarse, fine) available-factor attribute names of supported datapaths
+_DATAPATH_STAGES = {
+    "adc": [("cddc_decimations_available", "fddc_decimations_available")],
+    "dac": [
+        ("cduc_interpolations_available", "fduc_interpolations_available"),
+        ("cduc_interpolation_available", "fduc_interpolation_available"),
+    ],
+}
+
+
+def _datapath_candidates(conv: converter, jesd_class: str) -> dict:
+    """Flatten every (JESD mode, coarse, fine) option into column arrays.
+
+    AD9081/AD9082 mode tables list the CDDC/FDDC (or CDUC/FDUC) pairs each
+    mode supports, with the converter-clock and lane-rate windows from the
+    datasheet. Parts without per-mode lists (AD9084/AD9088) pair every mode
+    with the full coarse x fine product of their datapath.
+
+    Args:
+        conv (converter): AD9081/AD9082/AD9084/AD9088 RX or TX model
+        jesd_class (str): JESD class whose mode table is used
+
+    Raises:
+        Exception: Converter has no coarse/fine datapath
+
+    Returns:
+        dict: Column arrays, one entry per candidate
+    """
+    ctype = conv.converter_type.lower()
+    product = None
+    for coarse_attr, fine_attr in _DATAPATH_STAGES.get(ctype, []):
+        if hasattr(conv.datapath, coarse_attr):
+            product = [
+                (c, f)
+                for c in getattr(conv.datapath, coarse_attr)
+                for f in getattr(conv.datapath, fine_attr)
+            ]
+            break
+    if product is None:
+        raise Exception(f"{conv.name} has no coarse/fine datapath to plan")
+
+    encoding = "8b10b" if jesd_class == "jesd204b" else "64b66b"
+    rows = []
+    for mode, cfg in conv.quick_configuration_modes[jesd_class].items():
+        if "decimations" in cfg:
+            # Window limits are in GSPS/Gbps; -1 marks no limit
+            options = [
+                (
+                    d["coarse"],
+                    d["fine"],
+                    d["conv_min"] * 1e9 if d["conv_min"] > 0 else -np.inf,
+                    d["conv_max"] * 1e9 if d["conv_max"] > 0 else np.inf,
+                    d["lane_min"] * 1e9 if d["lane_min"] > 0 else -np.inf,
+                    d["lane_max"] * 1e9 if d["lane_max"] > 0 else np.inf,
+                )
+                for d in cfg["decimations"]
+            ]
+        else:
+            options = [
+                (c, f, -np.inf, np.inf, -np.inf, np.inf) for c, f in product
+            ]
+        for option in dict.fromkeys(options):
+            rows.append((mode, cfg["M"], cfg["L"], cfg["Np"], *option))
+
+    columns = list(zip(*rows, strict=True)) if rows else [()] * 10
+    table = {"mode": np.array(columns[0], dtype=object)}
+    for name, values in zip(
+        [
+            "M",
+            "L",
+            "Np",
+            "coarse",
+            "fine",
+            "conv_min",
+            "conv_max",
+            "lane_min",
+            "lane_max",
+        ],
+        columns[1:],
+        strict=True,
+    ):
+        table[name] = np.array(values, dtype=float)
+    # bit_clock = sample_clock * lane_factor
+    table["lane_factor"] = (
+        table["M"]
+        * table["Np"]
+        * conv.encodings_d[encoding]
+        / (table["L"] * conv.encodings_n[encoding])
+    )
+    return table
+
+
+def plan_datapath_rates(
+    conv: converter,
+    sample_clock: Any,
+    converter_clocks: Optional[Any] = None,
+    jesd_class: Optional[str] = None,
+    max_lanes: Optional[int] = None,
+) -> List[dict]:
+    """Enumerate datapath and JESD mode combinations reaching a sample rate.
+
+    Every (converter clock, coarse x fine factor, JESD mode) combination is
+    evaluated in one vectorized pass. A combination is kept when the
+    converter clock divided (RX) or multiplied (TX) by the datapath factor
+    gives ``sample_clock`` exactly, the converter clock is within the part's
+    limits and the mode's datasheet window, and the lane rate is within the
+    part's limits for the JESD class. Only these candidates need to be
+    handed to the solver.
+
+    Args:
+        conv (converter): AD9081/AD9082/AD9084/AD9088 RX or TX model. Its
+            configuration is not modified.
+        sample_clock: Target baseband sample rate(s) in samples per second
+        converter_clocks: Candidate converter clock(s) in hertz. When
+            omitted, each datapath factor implies its own converter clock.
+        jesd_class (str): Restrict to ``"jesd204b"`` or ``"jesd204c"``.
+            All available classes are planned when omitted.
+        max_lanes (int): Drop modes using more lanes, e.g. the FPGA's
+            ``max_serdes_lanes``.
+
+    Raises:
+        Exception: Nested converter models are not supported
+
+    Returns:
+        List[dict]: Candidates sorted by sample rate, converter clock and
+        lane rate. Each holds ``sample_clock``, ``converter_clock``,
+        ``jesd_class``, ``mode``, ``coarse``, ``fine``, ``datapath_factor``,
+        ``bit_clock``, ``M``, ``L`` and ``Np``.
+    """
+    if getattr(conv, "_nested", False):
+        raise Exception(
+            "Nested converters are not supported; plan the rx or tx side"
+        )
+    rates = np.atleast_1d(np.asarray(sample_clock, dtype=float))
+    classes = [jesd_class] if jesd_class else list(conv.available_jesd_modes)
+
+    candidates = []
+    for jc in classes:
+        table = _datapath_candidates(conv, jc)
+        factor = table["coarse"] * table["fine"]
+        # Axes: (sample rate, candidate)
+        if converter_clocks is None:
+            conv_clk = rates[:, None] * factor[None, :]
+            valid = np.ones(conv_clk.shape, dtype=bool)
+        else:
+            clocks = np.atleast_1d(np.asarray(converter_clocks, dtype=float))
+            # Axes: (sample rate, converter clock, candidate)
+            conv_clk = np.broadcast_to(
+                clocks[None, :, None], (len(rates), len(clocks), len(factor))
+            )
+            valid = conv_clk == rates[:, None, None] * factor
+        shape = conv_clk.shape
+        lane_rate = (
+            rates.reshape((-1,) + (1,) * (len(shape) - 1))
+            * table["lane_factor"]
+        )
+        lane_rate = np.broadcast_to(lane_rate, shape)
+
+        valid &= (conv_clk >= conv.converter_clock_min) & (
+            conv_clk <= conv.converter_clock_max
+        )
+        valid &= (conv_clk >= table["conv_min"]) & (
+            conv_clk <= table["conv_max"]
+        )
+        valid &= (lane_rate >= conv.bit_clock_min_available[jc]) & (
+            lane_rate <= conv.bit_clock_max_available[jc]
+        )
+        valid &= (lane_rate >= table["lane_min"]) & (
+            lane_rate <= table["lane_max"]
+        )
+        if max_lanes is not None:
+            valid &= table["L"] <= max_lanes
+
+        for idx in zip(*np.nonzero(valid), strict=True):
+            i = idx[-1]
+            candidates.append(
+                {
+                    "sample_clock": float(rates[idx[0]]),
+                    "converter_clock": float(conv_clk[idx]),
+                    "jesd_class": jc,
+                    "mode": table["mode"][i],
+                    "coarse": int(table["coarse"][i]),
+                    "fine": int(table["fine"][i]),
+                    "datapath_factor": int(factor[i]),
+                    "bit_clock": float(lane_rate[idx]),
+                    "M": int(table["M"][i]),
+                    "L": int(table["L"][i]),
+                    "Np": int(table["Np"][i]),
+                }
+            )
+
+    candidates.sort(
+        key=lambda c: (c["sample_clock"], c["converter_clock"], c["bit_clock"])
+    )
+    return candidates
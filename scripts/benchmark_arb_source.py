@@ -0,0 +1,92 @@
+"""Compare open and presolved ``arb_source`` reference formulations.
+
+``adijif.types.arb_source`` models a reference as the ratio of two integer
+variables. ``arb_source.presolve`` replaces those domains with a short
+table of references the clock chip can divide down to the required
+outputs. This script times both formulations, including the pre-solve
+itself, for a few clock chip and system configurations.
+
+Run from the repository root:
+
+    python scripts/benchmark_arb_source.py
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+import adijif
+
+REPEAT = 3
+
+
+def _clock(chip: str, rates: list, bounds: dict, presolve: bool) -> float:
+    """Solve one clock chip for integer output rates."""
+    vcxo = adijif.types.arb_source("vcxo", **bounds)
+    clk = getattr(adijif, chip)(solver="CPLEX")
+    if presolve:
+        vcxo.presolve(clk, rates)
+    names = [f"OUT{i}" for i in range(len(rates))]
+    clk.set_requested_clocks(vcxo, [int(r) for r in rates], names)
+    clk.solve()
+    return clk.get_config()["vcxo"]
+
+
+def _daq2(rates: list, bounds: dict, presolve: bool) -> float:
+    """Solve an AD9680 + HMC7044 + ZC706 system."""
+    vcxo = adijif.types.arb_source("vcxo", **bounds)
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", vcxo)
+    sys.converter.sample_clock = rates[0]
+    sys.converter.decimation = 1
+    sys.converter.set_quick_configuration_mode(str(0x88))
+    sys.converter.K = 32
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.fpga.force_qpll = 1
+    if presolve:
+        vcxo.presolve(sys.clock, rates)
+    return sys.solve()["clock"]["vcxo"]
+
+
+def _time(fn: Callable, *args: Any) -> tuple:
+    """Return the best runtime in milliseconds and the solved reference."""
+    best, ref = float("inf"), None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        ref = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3, ref
+
+
+def main() -> None:
+    """Print a comparison table."""
+    integer = {
+        "a_min": 100_000_000,
+        "a_max": 150_000_000,
+        "b_min": 1,
+        "b_max": 1,
+    }
+    wide = {"a_min": 1, "a_max": int(1e11), "b_min": 1, "b_max": int(1e11)}
+    cases = [
+        ("hmc7044 245.76M", _clock, ("hmc7044", [245.76e6], integer)),
+        ("hmc7044 1G+SYSREF wide", _clock, ("hmc7044", [1e9, 7.8125e6], wide)),
+        (
+            "ad9523_1 3 outputs",
+            _clock,
+            ("ad9523_1", [1e9, 500e6, 7.8125e6], integer),
+        ),
+        ("ad9528 245.76M", _clock, ("ad9528", [245.76e6], integer)),
+        ("daq2 system wide", _daq2, ([1e9], wide)),
+    ]
+    print(f"{'case':<26}{'open (ms)':>11}{'presolved (ms)':>16}  references")
+    for name, fn, args in cases:
+        before, ref_open = _time(fn, *args, False)
+        after, ref_pre = _time(fn, *args, True)
+        print(
+            f"{name:<26}{before:>11.0f}{after:>16.0f}  "
+            f"{ref_open / 1e6:.4f}M / {ref_pre / 1e6:.4f}M"
+        )
+
+
+if __name__ == "__main__":
+    main()
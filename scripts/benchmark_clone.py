@@ -0,0 +1,64 @@
+"""Compare per-mode template copy overhead of deepcopy and clone().
+
+``find_extreme_rate`` copies the converter, clock and FPGA templates once
+for every JESD mode it tries. This script times both copy strategies for
+each registered component and for one full per-mode template set.
+
+Run from the repository root:
+
+    python scripts/benchmark_clone.py
+"""
+
+from __future__ import annotations
+
+import copy
+import timeit
+
+import adijif
+from adijif.registry import COMPONENT_REGISTRY
+from adijif.solvers import CpoModel
+
+REPEAT = 20
+
+
+def _time(fn) -> float:
+    """Return the mean runtime of ``fn`` in microseconds."""
+    return timeit.timeit(fn, number=REPEAT) / REPEAT * 1e6
+
+
+def main() -> None:
+    """Print a per-component and per-mode comparison table."""
+    model = CpoModel()
+    print(f"{'component':<22}{'deepcopy (us)':>15}{'clone (us)':>13}")
+    for kind, registry in COMPONENT_REGISTRY.items():
+        for name, cls in sorted(registry.items()):
+            obj = cls()
+            before = _time(lambda obj=obj: copy.deepcopy(obj))
+            after = _time(lambda obj=obj: obj.clone(model))
+            print(f"{kind + ':' + name:<22}{before:>15.0f}{after:>13.0f}")
+
+    conv = adijif.ad9081_rx()
+    clk = adijif.hmc7044()
+    fpga = adijif.xilinx()
+    fpga.setup_by_dev_kit_name("vcu118")
+
+    def deepcopy_mode() -> None:
+        copy.deepcopy(conv)
+        copy.deepcopy(clk)
+        copy.deepcopy(fpga)
+
+    def clone_mode() -> None:
+        conv.clone()
+        clk.clone(model)
+        fpga.clone(model)
+
+    before = _time(deepcopy_mode)
+    after = _time(clone_mode)
+    print(
+        f"\nPer-mode templates (ad9081_rx + hmc7044 + xilinx): "
+        f"{before:.0f} us -> {after:.0f} us ({before / after:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
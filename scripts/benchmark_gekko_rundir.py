@@ -0,0 +1,91 @@
+"""Measure GEKKO run-directory overhead with and without managed directories.
+
+Every GEKKO model used to get its own ``mkdtemp`` folder, created when the
+model is built and removed with ``rmtree`` after a successful solve (or
+never, when the solve fails or the model is not solved). Managed run
+directories are reused per topology and only emptied after each solve.
+
+This script times the directory handling alone and a small standalone
+HMC7044 solve under both strategies. Pass a base directory (for example
+``/dev/shm``) to also time the managed strategy on that filesystem.
+
+Run from the repository root:
+
+    python scripts/benchmark_gekko_rundir.py [BASE_DIR]
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import adijif
+from adijif import gekko_rundir
+from adijif.solvers import GEKKO
+
+REPEAT = 20
+
+
+def _time(fn) -> float:
+    """Return the mean runtime of ``fn`` in milliseconds."""
+    return timeit.timeit(fn, number=REPEAT) / REPEAT * 1e3
+
+
+def _legacy_dirs() -> None:
+    """Per-model temporary folder removed after use."""
+    model = GEKKO(remote=False)
+    with open(os.path.join(model._path, "gk_model.apm"), "w") as fh:
+        fh.write("Model\nEnd Model\n")
+    shutil.rmtree(model._path)
+
+
+def _managed_dirs() -> None:
+    """Shared run directory emptied after use."""
+    model = gekko_rundir.new_model("benchmark")
+    with open(os.path.join(model._path, "gk_model.apm"), "w") as fh:
+        fh.write("Model\nEnd Model\n")
+    gekko_rundir.clear_run_dir(model)
+
+
+def _solve(managed: bool) -> None:
+    """Solve a small standalone HMC7044 problem with gekko."""
+    clk = adijif.hmc7044(solver="gekko")
+    if not managed:
+        clk.model = GEKKO(remote=False)
+    clk.n2 = 24
+    clk.set_requested_clocks(125e6, [1e9, 500e6], ["a", "b"])
+    if managed:
+        clk.solve()
+    else:
+        clk.model.options.SOLVER = 1
+        clk.model.solve(disp=False)
+        clk.model.cleanup()
+
+
+def main() -> None:
+    """Print a comparison table."""
+    rows = [
+        ("directories only, legacy", _time(_legacy_dirs)),
+        ("directories only, managed", _time(_managed_dirs)),
+        ("hmc7044 solve, legacy", _time(lambda: _solve(False))),
+        ("hmc7044 solve, managed", _time(lambda: _solve(True))),
+    ]
+    if len(sys.argv) > 1:
+        gekko_rundir.set_run_dir_base(sys.argv[1])
+        rows.append(
+            (
+                f"hmc7044 solve, managed in {sys.argv[1]}",
+                _time(lambda: _solve(True)),
+            )
+        )
+    for label, ms in rows:
+        print(f"{label:<45}{ms:>9.2f} ms")
+    print(f"\nRun directory operations: {gekko_rundir.run_dir_stats()}")
+    print(f"Temporary directory: {tempfile.gettempdir()}")
+
+
+if __name__ == "__main__":
+    main()
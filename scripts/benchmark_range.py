@@ -0,0 +1,89 @@
+"""Compare enumerated and indexed ``adijif.types.range`` domains.
+
+``adijif.types.range`` used to hand the solver every value of the range:
+an explicit CPLEX domain, or one binary per value for GEKKO. It now models
+``start + step * k`` with a bounded integer index. This script builds an
+AD9523-1 model with a 100-200 MHz VCXO range at several steps and reports
+the model size and solve time of both formulations.
+
+Run from the repository root:
+
+    python scripts/benchmark_range.py
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+import adijif
+from adijif.solvers import CpoModel, integer_var
+
+START, STOP = 100_000_000, 200_000_000
+STEPS = [1_000_000, 100_000, 10_000, 1_000]
+GEKKO_MAX_BINARIES = 100
+
+
+class _EnumeratedRange(adijif.types.range):
+    """Previous formulation listing every value of the range."""
+
+    def __call__(self, model: Any) -> Dict:
+        """Build the enumerated domain."""
+        values = list(map(int, np.arange(self.start, self.stop, self.step)))
+        if isinstance(model, CpoModel):
+            return {
+                "range": integer_var(domain=values, name=self.name + "_Var")
+            }
+        options = model.Array(model.Var, len(values), lb=0, ub=1, integer=True)
+        model.Equation(model.sum(options) == 1)
+        return {"range": model.Intermediate(model.sum(values * options))}
+
+
+def _solve(cls: type, step: int, solver: str) -> tuple:
+    """Return model size, solve time in milliseconds and the VCXO found."""
+    vcxo = cls(START, STOP, step, "vcxo")
+    clk = adijif.ad9523_1(solver=solver)
+    clk.n2 = 24
+    clk.use_vcxo_double = False
+    clk.set_requested_clocks(vcxo, [1e9, 500e6], ["ADC", "FPGA"])
+    if solver == "CPLEX":
+        size = len(clk.model.get_cpo_string())
+    else:
+        size = len(clk.model._variables) + len(clk.model._intermediates)
+    start = time.perf_counter()
+    clk.solve()
+    elapsed = (time.perf_counter() - start) * 1e3
+    return size, elapsed, clk.get_config()["vcxo"]
+
+
+def main() -> None:
+    """Print size and time per step for each solver and formulation."""
+    print(
+        f"{'solver':<8}{'step':>10}{'values':>9}"
+        f"{'size old':>11}{'size new':>10}{'old (ms)':>10}{'new (ms)':>10}"
+    )
+    for solver in ["CPLEX", "gekko"]:
+        for step in STEPS:
+            count = len(adijif.types.range(START, STOP, step, "vcxo"))
+            new_size, new_time, _ = _solve(adijif.types.range, step, solver)
+            if solver == "gekko" and count > GEKKO_MAX_BINARIES:
+                old = "-"
+                old_size = "-"
+            else:
+                old_size, old_time, _ = _solve(_EnumeratedRange, step, solver)
+                old = f"{old_time:.0f}"
+            print(
+                f"{solver:<8}{step:>10}{count:>9}{old_size:>11}"
+                f"{new_size:>10}{old:>10}{new_time:>10.0f}"
+            )
+    print(
+        f"\nsize is the CPO model text length (CPLEX) or the number of "
+        f"GEKKO variables and intermediates. GEKKO enumerations above "
+        f"{GEKKO_MAX_BINARIES} binaries are skipped."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Tests for bulk and cached AD9084 Apollo profile loading."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import adijif
+from adijif.converters import ad9084_util
+from adijif.converters.ad9084_util import (
+    clear_profile_cache,
+    load_profile,
+    load_profiles,
+    parse_json_config,
+)
+
+PROFILE = (
+    Path(__file__).parent
+    / "apollo_profiles"
+    / "ad9084_profiles"
+    / "id00_stock_mode.json"
+)
+TRITON = (
+    Path(__file__).parent.parent
+    / "examples"
+    / "triton"
+    / "id00_triton_M4_L2_RX13p2.json"
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_profile_cache()
+    yield
+    clear_profile_cache()
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    shutil.copy(PROFILE, tmp_path / "stock.json")
+    shutil.copy(TRITON, tmp_path / "triton.json")
+    (tmp_path / "broken.json").write_text(json.dumps({"profile_cfg": {}}))
+    return tmp_path
+
+
+def test_load_profile_matches_parser_and_caches(monkeypatch):
+    """Cached loads return the parser output without reparsing."""
+    expected = parse_json_config(str(PROFILE))
+    assert load_profile(str(PROFILE)) == expected
+
+    def _no_parse(*args, **kwargs):
+        raise AssertionError("profile must come from the cache")
+
+    monkeypatch.setattr(ad9084_util, "parse_json_config", _no_parse)
+    cached = load_profile(str(PROFILE))
+    assert cached == expected
+    # Callers get a private copy
+    cached["datapath"]["cddc_decimation"] = 99
+    assert load_profile(str(PROFILE)) == expected
+
+
+def test_load_profile_invalidated_by_file_change(tmp_path):
+    """Rewriting a profile yields its new settings."""
+    path = tmp_path / "profile.json"
+    data = json.loads(PROFILE.read_text())
+    path.write_text(json.dumps(data))
+    before = load_profile(str(path))
+
+    data["clk_cfg"]["dev_clk_freq_kHz"] *= 2
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(0, 0))
+    after = load_profile(str(path))
+
+    assert after["device_clock_Hz"] == 2 * before["device_clock_Hz"]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_load_profiles_table(corpus, processes):
+    """Directory scans produce one row per valid profile."""
+    table = load_profiles(str(corpus), processes=processes)
+
+    assert list(table["profile_name"]) == ["stock", "triton"]
+    stock = table.iloc[0]
+    settings = parse_json_config(str(corpus / "stock.json"))
+    assert stock["device_clock_Hz"] == settings["device_clock_Hz"]
+    assert stock["rx_L"] == settings["jesd_settings"]["jtx"]["L"]
+    assert stock["tx_M"] == settings["jesd_settings"]["jrx"]["M"]
+    assert stock["rx_sample_rate_Hz"] == settings["device_clock_Hz"] / (
+        settings["datapath"]["cddc_decimation"]
+        * settings["datapath"]["fddc_decimation"]
+    )
+    assert stock["settings"] == settings
+
+    # Second scan is served from the cache
+    assert load_profiles(str(corpus), processes=1).equals(table)
+
+
+def test_load_profiles_failed_rows(corpus):
+    """Unparseable profiles are reported only when requested."""
+    table = load_profiles(str(corpus), processes=1, include_failed=True)
+    failed = table[table["error"].notna()]
+    assert len(failed) == 1
+    assert failed.iloc[0]["path"].endswith("broken.json")
+    assert "KeyError" in failed.iloc[0]["error"]
+
+
+def test_load_profiles_missing_directory():
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        load_profiles("no-such-profile-directory")
+
+
+def test_table_settings_apply_to_converter(corpus):
+    """Filtered rows can be applied directly to a converter model."""
+    table = load_profiles(str(corpus), processes=1)
+    row = table[table["profile_name"] == "stock"].iloc[0]
+    conv = adijif.ad9084_rx()
+    ad9084_util.apply_settings(conv, row["settings"])
+    assert conv.sample_clock == row["rx_sample_rate_Hz"]
+
+
+def test_profile_cache_is_bounded(corpus, monkeypatch):
+    """Least recently used profiles are evicted beyond the cache size."""
+    monkeypatch.setattr(ad9084_util, "PROFILE_CACHE_SIZE", 1)
+    stock, triton = str(corpus / "stock.json"), str(corpus / "triton.json")
+    load_profile(stock)
+    load_profile(triton)
+
+    assert len(ad9084_util._PROFILE_CACHE) == 1
+    (key,) = ad9084_util._PROFILE_CACHE
+    assert key[0] == os.path.abspath(triton)
@@ -2,6 +2,7 @@
 
 from math import ceil
 
+import numpy as np
 import pytest
 
 from adijif.draw import Node
@@ -11,10 +12,12 @@ from adijif.plls.utils.adf4030_arch import (
     Aion_per_FPGA_tree,
     Apollo_per_Aion_cascade,
     Apollo_per_Aion_tree,
+    _cascade_depths,
     _connect_aions_cascade,
     _connect_aions_hybrid,
     _connect_aions_hybrid2,
     _connect_aions_tree,
+    find_architecture_frontier,
 )
 
 
@@ -267,3 +270,171 @@ def test_draw_writes_svg_to_path(tmp_path, monkeypatch):
     svg = arch.draw(scope="ub", path=str(out))
     assert out.read_text() == "<svg>fake</svg>"
     assert svg == "<svg>fake</svg>"
+
+
+def _capture_layouts(monkeypatch):
+    from adijif.draw import Layout
+
+    layouts = []
+
+    def fake_draw(self):
+        layouts.append(self)
+        return f"<svg>{len(layouts)}</svg>"
+
+    monkeypatch.setattr(Layout, "draw", fake_draw)
+    return layouts
+
+
+def test_draw_system_auto_summarizes_large_arrays(monkeypatch):
+    layouts = _capture_layouts(monkeypatch)
+    arch = Adf4030Architecture(
+        N=4096, N_Apollo=40, N_FPGA=2, architecture="cascade"
+    )
+    n_ub = arch.partition["N_UB"]
+    arch.draw(scope="system")
+    system = layouts[0].nodes[0]
+    names = [ub.name for ub in system.children]
+    # Boards 0..6 and the last one, with the rest merged into one node.
+    assert names == [f"UnitBoard_{i}" for i in range(7)] + [
+        f"UnitBoard_7_to_{n_ub - 2}",
+        f"UnitBoard_{n_ub - 1}",
+    ]
+    assert "Unit Boards" in system.children[7].value
+    # The first board is the full template, the others are collapsed.
+    template, replica = system.children[0], system.children[1]
+    assert (
+        sum(len(f.children) for f in template.children)
+        == (arch.partition["N_Aion_UB"])
+    )
+    aion_groups = [f.children[0] for f in replica.children]
+    assert [g.name for g in aion_groups] == [
+        f"Aion_x{n}" for n in arch.partition["N_Aion_per_FPGA"]
+    ]
+    assert sum(int(g.children[0].name.split("_x")[1]) for g in aion_groups) == (
+        arch.N_Apollo
+    )
+    # Consecutive entries are chained.
+    assert len(system.connections) == len(system.children) - 1
+    assert system.connections[7]["from"] is system.children[7]
+
+
+def test_draw_system_summary_expands_requested_boards(monkeypatch):
+    layouts = _capture_layouts(monkeypatch)
+    arch = Adf4030Architecture(
+        N=64, N_Apollo=8, N_FPGA=1, architecture="tree", N_branch=2
+    )
+    arch.draw(scope="system", detail="summary", expand=[5], max_boards=2)
+    names = [ub.name for ub in layouts[0].nodes[0].children]
+    assert names == [
+        "UnitBoard_0",
+        "UnitBoard_1_to_4",
+        "UnitBoard_5",
+        "UnitBoard_6",
+        "UnitBoard_7",
+    ]
+    children = layouts[0].nodes[0].children
+    assert children[0].children[0].children[0].name == "Aion_x1"
+    assert children[2].children[0].children[0].name == "Aion_0"
+
+
+def test_draw_reuses_rendered_diagrams(monkeypatch, tmp_path):
+    layouts = _capture_layouts(monkeypatch)
+    arch = Adf4030Architecture(
+        N=64, N_Apollo=8, N_FPGA=1, architecture="cascade"
+    )
+    first = arch.draw(scope="system")
+    assert arch.draw(scope="system", detail="full") == first
+    out = tmp_path / "sys.svg"
+    assert arch.draw(scope="system", path=str(out)) == first
+    assert out.read_text() == first
+    assert len(layouts) == 1
+    arch.draw(scope="system", theme="light")
+    arch.draw(scope="system", detail="summary")
+    assert len(layouts) == 3
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"detail": "tiny"}, {"expand": [8]}, {"max_boards": 1}],
+)
+def test_draw_rejects_invalid_detail_options(kwargs):
+    arch = Adf4030Architecture(
+        N=64, N_Apollo=8, N_FPGA=1, architecture="cascade"
+    )
+    with pytest.raises(ValueError):
+        arch.draw(scope="system", **kwargs)
+
+
+def _longest_chain(conns, aions):
+    children = {}
+    for c in conns:
+        children.setdefault(id(c["from"]), []).append(c["to"])
+    depth, level = 0, [aions[0]]
+    while level:
+        depth += 1
+        level = [n for a in level for n in children.get(id(a), [])]
+    return depth
+
+
+@pytest.mark.parametrize("architecture", ["tree", "hybrid", "hybrid2"])
+def test_cascade_depths_match_connection_helpers(architecture):
+    helper = {
+        "tree": _connect_aions_tree,
+        "hybrid": _connect_aions_hybrid,
+        "hybrid2": _connect_aions_hybrid2,
+    }[architecture]
+    branches = np.arange(1, 13)
+    for n in range(1, 13):
+        aions = [Node(f"Aion_{i}") for i in range(n)]
+        expected = [
+            _longest_chain(helper(aions, N_branch=int(b)), aions)
+            for b in branches
+        ]
+        depths = _cascade_depths(architecture, n, branches)
+        assert depths.tolist() == expected
+
+
+def test_architecture_frontier_prefers_shallow_trees():
+    frontier = find_architecture_frontier(512, 40, 1)
+    assert len(frontier) == 1
+    best = frontier[0]
+    tree = Adf4030Architecture(512, 40, 1, "tree", N_branch=4).partition
+    assert best["N_Aion_system"] == tree["N_Aion_system"]
+    assert best["Max_Aion_per_FPGA"] == tree["Max_Aion_per_FPGA"] == 5
+    assert best["cascade_depth"] == 2
+    # tree and hybrid2 wire the same topology.
+    assert sorted(best["candidates"]) == [("hybrid2", 4), ("tree", 4)]
+
+
+def test_architecture_frontier_trades_depth_for_branches():
+    frontier = find_architecture_frontier(
+        512, 40, 1, architectures=("cascade", "hybrid"), max_branch=2
+    )
+    cascade = Adf4030Architecture(512, 40, 1, "cascade").partition
+    hybrid = Adf4030Architecture(512, 40, 1, "hybrid", N_branch=2).partition
+    assert hybrid["N_Aion_system"] < cascade["N_Aion_system"]
+    assert [(r["architecture"], r["N_branch"]) for r in frontier] == [
+        ("hybrid", 2)
+    ]
+    assert frontier[0]["cascade_depth"] == 3
+
+    by_count = find_architecture_frontier(
+        512, 40, 1, objectives=("N_Aion_system",)
+    )
+    assert len(by_count) == 1
+    assert ("cascade", None) not in by_count[0]["candidates"]
+    assert len(by_count[0]["candidates"]) == 4 + 5 + 4
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"architectures": ("banana",)},
+        {"objectives": ("speed",)},
+        {"objectives": ()},
+        {"max_branch": 0},
+    ],
+)
+def test_architecture_frontier_rejects_invalid_options(kwargs):
+    with pytest.raises(ValueError):
+        find_architecture_frontier(64, 8, 1, **kwargs)
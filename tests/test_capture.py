@@ -0,0 +1,99 @@
+"""Tests for model capture and offline replay."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+import adijif
+from adijif.capture import load_capture, replay_capture
+from adijif.cli import main
+
+
+def _ad9680_system():
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", 125000000)
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.converter.sample_clock = 1e9 / 2
+    sys.converter.datapath_decimation = 1
+    sys.converter.L = 4
+    sys.converter.M = 2
+    sys.converter.N = 14
+    sys.converter.Np = 16
+    sys.converter.K = 32
+    sys.converter.F = 1
+    sys.converter.HD = 1
+    return sys
+
+
+@pytest.fixture
+def captured(tmp_path):
+    sys = _ad9680_system()
+    manifest = sys.capture(str(tmp_path / "case"))
+    return sys, manifest, tmp_path / "case"
+
+
+def test_capture_writes_model_and_manifest(captured):
+    sys, manifest, prefix = captured
+
+    assert prefix.with_suffix(".cpo").is_file()
+    on_disk = json.loads(prefix.with_suffix(".json").read_text())
+    assert on_disk == manifest
+    assert manifest["format"] == "adi.jif-capture"
+    assert manifest["clock"]["name"] == "HMC7044"
+    conv = manifest["converters"][0]
+    assert conv["name"] == "AD9680"
+    assert conv["jesd_mode"]["L"] == 4
+    assert conv["sample_clock"] == 500e6
+    assert manifest["model"]["variables"] > 0
+    assert manifest["objectives"]
+
+
+def test_replay_reproduces_system_objective(captured):
+    sys, _, prefix = captured
+    expected = sys.model.solve(LogVerbosity="Quiet").get_objective_values()
+
+    report = replay_capture(str(prefix), {"Workers": 1}, repeat=2)
+
+    assert report["parts"]["converters"] == ["AD9680"]
+    assert report["parameters"] == {"Workers": 1}
+    assert len(report["runs"]) == 2
+    for run in report["runs"]:
+        assert run["status"] == "Optimal"
+        assert run["objective_values"] == list(expected)
+    assert report["wall_time"]["min"] <= report["wall_time"]["max"]
+
+
+def test_load_capture_rejects_foreign_manifest(tmp_path):
+    (tmp_path / "other.json").write_text('{"format": "something-else"}')
+    with pytest.raises(Exception, match="not a model capture"):
+        load_capture(str(tmp_path / "other.json"))
+
+
+def test_cli_replay_reports_json(captured):
+    _, _, prefix = captured
+    result = CliRunner().invoke(
+        main,
+        [
+            "--compact",
+            "replay",
+            str(prefix.with_suffix(".json")),
+            "--param",
+            "Workers=1",
+            "--param",
+            "SearchType=DepthFirst",
+        ],
+    )
+
+    assert result.exit_code == 0
+    report = json.loads(result.output)
+    assert report["parameters"] == {"Workers": 1, "SearchType": "DepthFirst"}
+    assert report["runs"][0]["status"] == "Optimal"
+
+
+def test_cli_replay_missing_capture(tmp_path):
+    result = CliRunner().invoke(
+        main, ["--compact", "replay", str(tmp_path / "missing")]
+    )
+
+    assert result.exit_code == 1
+    assert "not found" in json.loads(result.output)["error"]
@@ -0,0 +1,193 @@
+# flake8: noqa
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import adijif
+from adijif.clocks.reachability import (
+    ReachableIndex,
+    clear_reachable_index_cache,
+    get_reachable_index,
+    integer_pll_outputs,
+    rational_lcm,
+    rational_references,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_reachable_index_cache()
+    yield
+    clear_reachable_index_cache()
+
+
+def test_integer_pll_outputs_matches_brute_force():
+    ref = 100_000_000
+    r_values = list(range(1, 8))
+    n_values = list(range(20, 40))
+    vco, r, n = integer_pll_outputs(ref, r_values, n_values, 2e9, 3e9, 60e6)
+
+    expected = {}
+    for rr in r_values:
+        if ref / rr > 60e6:
+            continue
+        for nn in n_values:
+            if (ref * nn) % rr:
+                continue
+            f = ref * nn // rr
+            if 2e9 <= f <= 3e9 and f not in expected:
+                expected[f] = (rr, nn)
+
+    assert vco.tolist() == sorted(expected)
+    for f, rr, nn in zip(vco, r, n):
+        assert ref * nn == f * rr
+        assert expected[int(f)][0] == rr
+
+
+@pytest.mark.parametrize(
+    "part, vcxo",
+    [
+        ("hmc7044", 125e6),
+        ("ltc6952", 125e6),
+        ("ad9523_1", 125e6),
+        ("ad9528", 122.88e6),
+        ("ltc6953", 3e9),
+    ],
+)
+def test_index_configs_respect_chip_limits(part, vcxo):
+    clk = getattr(adijif, part)()
+    index = get_reachable_index(clk, vcxo)
+    assert len(index) > 0
+    assert np.all(np.diff(index.sources) > 0)
+
+    rates = index.output_rates(len(index) // 2)[[0, 1]]
+    cfg = index.find(rates)[0]
+    assert np.all(np.isin(cfg["required_output_divs"], index.output_dividers))
+    assert np.allclose(cfg["source"] / cfg["required_output_divs"], rates)
+
+
+def test_hmc7044_index_queries():
+    clk = adijif.hmc7044()
+    index = get_reachable_index(clk, 125e6)
+
+    assert index.can_produce([1e9, 500e6, 7.8125e6])
+    # 3 GHz VCO would need divider 9, which the HMC7044 does not have
+    assert not index.can_produce([1e9, 1e9 / 3])
+    assert not index.can_produce([1e9 + 7])
+
+    cfg = index.find([1e9, 500e6])[0]
+    assert cfg["source"] == 125e6 * cfg["vcxo_doubler"] * cfg["n2"] / cfg["r2"]
+
+
+def test_index_honors_divider_restrictions():
+    clk = adijif.hmc7044()
+    full = get_reachable_index(clk, 125e6)
+    clk.d = [2, 4, 6]
+    restricted = get_reachable_index(clk, 125e6)
+
+    assert restricted.key != full.key
+    assert full.can_produce([100e6])
+    assert not restricted.can_produce([100e6])
+
+
+def test_index_persisted_to_cache_dir(tmp_path):
+    clk = adijif.ltc6952()
+    index = get_reachable_index(clk, 125e6, cache_dir=str(tmp_path))
+    files = list(tmp_path.glob("ltc6952_*.npz"))
+    assert len(files) == 1
+
+    loaded = ReachableIndex.load(str(files[0]))
+    assert loaded.key == index.key
+    assert np.array_equal(loaded.sources, index.sources)
+    assert loaded.dividers.keys() == index.dividers.keys()
+
+    clear_reachable_index_cache()
+    assert get_reachable_index(clk, 125e6, cache_dir=str(tmp_path)).key == (
+        index.key
+    )
+
+
+def test_index_requires_integer_reference():
+    with pytest.raises(ValueError, match="integer reference"):
+        get_reachable_index(adijif.hmc7044(), 125e6 + 0.5)
+
+
+def test_rational_lcm():
+    assert rational_lcm([1e9, 7.8125e6]) == 1e9
+    assert rational_lcm([Fraction(1, 2), Fraction(1, 3)]) == 1
+    assert rational_lcm([1e9 / 3, 250e6]) == 1e9
+
+
+def test_rational_references_match_brute_force():
+    clk = adijif.hmc7044()
+    clk.vcxo_doubler = 1
+    clk.r2 = [1, 2, 3, 4]
+    clk.n2 = list(range(8, 40))
+    rates = [1e9, 250e6]
+    refs = rational_references(clk, rates, 50e6, 300e6, max_candidates=10_000)
+
+    expected = set()
+    for d in clk.d_available:
+        vco = 1_000_000_000 * d
+        if not clk.vco_min <= vco <= clk.vco_max or (vco / 250e6) not in (
+            clk.d_available
+        ):
+            continue
+        for r in clk.r2:
+            for n in clk.n2:
+                ref = Fraction(vco * r, n)
+                if 50e6 <= ref <= 300e6 and vco / n <= clk.pfd_max:
+                    expected.add(ref)
+
+    assert set(refs) == expected
+    assert [f.denominator for f in refs] == sorted(f.denominator for f in refs)
+
+
+def test_rational_references_limits():
+    clk = adijif.hmc7044()
+    refs = rational_references(
+        clk, [1e9], 100e6, 150e6, max_denominator=1, max_candidates=5
+    )
+    assert len(refs) == 5
+    assert all(f.denominator == 1 for f in refs)
+
+    assert rational_references(adijif.ltc6953(), [1e9, 500e6], 1e9, 2e9) == [
+        1_000_000_000,
+        2_000_000_000,
+    ]
+    with pytest.raises(ValueError, match="positive"):
+        rational_references(clk, [0])
+
+
+def _ad9680_system(sample_clock):
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", 125000000)
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.converter.sample_clock = sample_clock
+    sys.converter.datapath_decimation = 1
+    sys.converter.L = 4
+    sys.converter.M = 2
+    sys.converter.N = 14
+    sys.converter.Np = 16
+    sys.converter.K = 32
+    sys.converter.F = 1
+    sys.converter.HD = 1
+    sys.use_reachability_index = True
+    return sys
+
+
+def test_system_reachability_rejects_before_solve(monkeypatch):
+    sys = _ad9680_system(1e9 / 2)
+
+    def _no_solve():
+        raise AssertionError("solver must not run")
+
+    monkeypatch.setattr(sys, "_solve_cplex", _no_solve)
+    with pytest.raises(Exception, match="cannot generate"):
+        sys.solve({"AD9680_ref_clk": 500e6 + 1})
+
+
+def test_system_reachability_allows_feasible_solve():
+    sys = _ad9680_system(1e9 / 2)
+    cfg = sys.solve()
+    assert cfg["clock"]["output_clocks"]["AD9680_ref_clk"]["rate"] == 500e6
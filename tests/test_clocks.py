@@ -167,6 +167,38 @@ def test_ad9523_1_daq2_validate_fail(solver):
         assert o["n2"] == n2
 
 
+def test_range_domain_size_independent_of_step():
+    """Fine ranges are modeled by an index, not an enumerated domain."""
+    from adijif.solvers import CpoModel
+
+    sizes = []
+    for step in [1, 1000, 1000000]:
+        model = CpoModel()
+        vcxo = adijif.types.range(100000000, 200000000, step, "vcxo")
+        model.add(vcxo(model)["range"] >= 0)
+        sizes.append(len(model.get_cpo_string()))
+    assert len(adijif.types.range(100000000, 200000000, 1000, "v")) == 100000
+    assert max(sizes) < 2 * min(sizes)
+
+
+@pytest.mark.parametrize("solver", ["gekko", "CPLEX"])
+def test_ad9523_1_fine_range_vcxo(solver):
+    """A 1 kHz step VCXO range over 50 MHz stays on the grid."""
+    skip_solver(solver)
+    vcxo = adijif.types.range(100000000, 150000000, 1000, "vcxo")
+
+    clk = adijif.ad9523_1(solver=solver)
+    clk.n2 = 24
+    clk.use_vcxo_double = False
+
+    clk.set_requested_clocks(vcxo, [1e9, 500e6], ["ADC", "FPGA"])
+    clk.solve()
+    o = clk.get_config()
+
+    assert o["vcxo"] == 125000000
+    assert o["output_clocks"]["ADC"]["rate"] == 1e9
+
+
 @pytest.mark.parametrize("solver", ["gekko", "CPLEX"])
 def test_ad9523_1_daq2_variable_vcxo_validate(solver):
     skip_solver(solver)
@@ -346,6 +378,45 @@ def test_ad9523_1_arb_source_vcxo():
     assert o["vcxo"] == 125000000  # Should find optimal vcxo
 
 
+def test_arb_source_presolve_restricts_reference():
+    """Presolved arb_source only takes references from its candidates."""
+    vcxo = adijif.types.arb_source(
+        "vcxo", a_min=100000000, a_max=150000000, b_min=1, b_max=1
+    )
+    clk = adijif.ad9523_1(solver="CPLEX")
+    clk.use_vcxo_double = False
+
+    output_clocks = [1e9, 500e6, 7.8125e6]
+    candidates = vcxo.presolve(clk, output_clocks, max_candidates=4)
+    assert len(candidates) == 4
+    assert all(c.is_integer() and 100e6 <= c <= 150e6 for c in candidates)
+
+    clk.set_requested_clocks(vcxo, output_clocks, ["ADC", "FPGA", "SYSREF"])
+    clk.solve()
+    o = clk.get_config()
+
+    assert o["vcxo"] in candidates
+    assert [c["rate"] for c in o["output_clocks"].values()] == output_clocks
+
+
+def test_arb_source_presolve_fractional_and_infeasible():
+    """Fractional candidates fit the bounds; impossible requests raise."""
+    vcxo = adijif.types.arb_source(
+        "vcxo", a_min=100000000, a_max=1000000000, b_min=1, b_max=3
+    )
+    clk = adijif.hmc7044()
+    clk.r2 = 3
+    clk.n2 = [27, 30]
+    candidates = vcxo.presolve(clk, [1e9])
+    assert any(not c.is_integer() for c in candidates)
+    for (a, b), c in zip(vcxo._pairs, candidates):
+        assert 100000000 <= a <= 1000000000 and 1 <= b <= 3
+        assert a / b == c
+
+    with pytest.raises(Exception, match="No vcxo reference"):
+        vcxo.presolve(adijif.ltc6953(), [1e9, 3e8 + 1])
+
+
 def test_ad9528_arb_source_vcxo():
     """Test AD9528 with arb_source vcxo."""
     vcxo = adijif.types.arb_source(
@@ -0,0 +1,75 @@
+"""Tests for lightweight component cloning."""
+
+import pytest
+
+import adijif
+from adijif.solvers import CpoModel
+
+
+def test_converter_clone_copies_configuration_only():
+    conv = adijif.ad9680()
+    conv.sample_clock = 500e6
+    conv.set_quick_configuration_mode(str(0x88))
+    conv.K = 32
+    conv._last_config = {"solved": True}
+    conv.disable_objective("some.objective")
+
+    new = conv.clone()
+
+    assert type(new) is adijif.ad9680
+    assert new.sample_clock == conv.sample_clock
+    assert new._check_valid_jesd_mode() == conv._check_valid_jesd_mode()
+    assert new._last_config is None
+    assert new._objectives == []
+    assert new._disabled_objectives == {"some.objective"}
+    assert new._disabled_objectives is not conv._disabled_objectives
+    assert new.model is not conv.model
+    # Class-level mode tables are shared, not copied
+    assert new.quick_configuration_modes is conv.quick_configuration_modes
+    assert new.ic_diagram_node is not conv.ic_diagram_node
+
+
+def test_clock_clone_isolates_divider_selections():
+    clk = adijif.hmc7044()
+    clk.d = [1, 2, 4]
+    model = CpoModel()
+
+    new = clk.clone(model)
+    new.d.append(8)
+
+    assert clk.d == [1, 2, 4]
+    assert new.model is model
+
+
+def test_nested_clone_shares_model():
+    conv = adijif.adrv9009()
+    model = CpoModel()
+    new = conv.clone(model)
+    assert new.adc is not conv.adc
+    assert new.adc.model is model
+    assert new.dac.model is model
+
+
+def test_cloned_system_components_solve():
+    conv = adijif.ad9680()
+    conv.sample_clock = 1e9
+    conv.set_quick_configuration_mode(str(0x88))
+    conv.K = 32
+    clk = adijif.hmc7044()
+    fpga = adijif.xilinx()
+    fpga.setup_by_dev_kit_name("zc706")
+
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", 125e6)
+    sys.converter = conv.clone(sys.model)
+    sys.clock = clk.clone(sys.model)
+    sys.fpga = fpga.clone(sys.model)
+    cfg = sys.solve()
+
+    assert cfg["clock"]["output_clocks"]["AD9680_ref_clk"]["rate"] == 1e9
+    assert conv._last_config is None
+
+
+@pytest.mark.parametrize("solver", ["CPLEX", "gekko"])
+def test_clone_creates_model_for_solver(solver):
+    clk = adijif.ad9523_1(solver=solver)
+    assert isinstance(clk.clone().model, type(clk.model))
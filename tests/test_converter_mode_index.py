@@ -0,0 +1,52 @@
+"""Tests for the reverse index used to identify the current JESD mode."""
+
+import pytest
+
+import adijif
+
+
+@pytest.mark.parametrize(
+    "part", ["ad9081_rx", "ad9081_tx", "ad9084_rx", "ad9680", "ad9144"]
+)
+def test_every_mode_is_identified(part):
+    """Each table mode maps back to itself or an identical earlier mode."""
+    conv = getattr(adijif, part)()
+    skip = conv._jesd_params_to_skip_check
+    max_rate = 32e9 if "jesd204c" in conv.available_jesd_modes else 12.5e9
+    for jesd_class in conv.available_jesd_modes:
+        modes = conv.quick_configuration_modes[jesd_class]
+        for mode in modes:
+            conv.set_quick_configuration_mode(mode, jesd_class)
+            if conv.bit_clock > max_rate:
+                # Mode rejected by lane rate checks at default rates
+                with pytest.raises(Exception, match="too high for JESD"):
+                    conv._check_valid_jesd_mode()
+                continue
+            found = conv._check_valid_jesd_mode()
+            expected = {k: v for k, v in modes[mode].items() if k not in skip}
+            first = next(
+                m
+                for m, cfg in modes.items()
+                if {k: v for k, v in cfg.items() if k not in skip} == expected
+            )
+            assert found == first
+
+
+def test_index_follows_table_edits(monkeypatch):
+    """Editing a mode table in place must not leave a stale index."""
+    conv = adijif.ad9680()
+    assert conv._check_valid_jesd_mode() == str(0x88)
+
+    modes = {
+        name: dict(cfg)
+        for name, cfg in conv.quick_configuration_modes["jesd204b"].items()
+    }
+    monkeypatch.setattr(conv, "quick_configuration_modes", {"jesd204b": modes})
+    assert conv._check_valid_jesd_mode() == str(0x88)
+
+    modes["renamed"] = modes.pop(str(0x88))
+    assert conv._check_valid_jesd_mode() == "renamed"
+
+    modes["renamed"]["L"] = 99
+    with pytest.raises(Exception, match="Invalid JESD configuration"):
+        conv._check_valid_jesd_mode()
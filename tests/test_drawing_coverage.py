@@ -234,3 +234,159 @@ def test_system_draw_is_repeatable_across_light_and_dark_themes():
 
     assert "#E9F8F1" in light
     assert "#102B29" in dark
+
+
+@pytest.fixture
+def render_cache(monkeypatch, tmp_path):
+    """Enable the render cache for one test with a clean store."""
+    from adijif.draw import clear_render_cache
+
+    clear_render_cache()
+    monkeypatch.setattr(Layout, "use_render_cache", True)
+    yield tmp_path
+    clear_render_cache()
+
+
+def _cached_layout(theme="dark"):
+    lo = Layout("Cached", theme=theme)
+    a = Node("A", ntype="input")
+    b = Node("B")
+    lo.add_node(a)
+    lo.add_node(b)
+    lo.add_connection({"from": a, "to": b, "rate": 125e6})
+    return lo
+
+
+def test_render_cache_reuses_identical_diagrams(render_cache):
+    """Identical D2 source and theme only compile once."""
+    with mock.patch("d2.compile", return_value="<svg/>") as compile_mock:
+        assert _cached_layout().draw() == "<svg/>"
+        assert _cached_layout().draw() == "<svg/>"
+        assert compile_mock.call_count == 1
+
+        _cached_layout(theme="light").draw()
+        changed = _cached_layout()
+        changed.connections[0]["rate"] = 250e6
+        changed.draw()
+        assert compile_mock.call_count == 3
+
+
+def test_render_cache_evicts_least_recently_used(render_cache, monkeypatch):
+    """The in-process cache is bounded."""
+    monkeypatch.setattr(Layout, "render_cache_size", 1)
+    with mock.patch("d2.compile", return_value="<svg/>") as compile_mock:
+        _cached_layout().draw()
+        _cached_layout(theme="light").draw()
+        _cached_layout().draw()
+        assert compile_mock.call_count == 3
+
+
+def test_render_cache_persists_to_disk(render_cache, monkeypatch):
+    """Renders stored on disk survive clearing the in-process cache."""
+    from adijif.draw import clear_render_cache
+
+    monkeypatch.setattr(Layout, "render_cache_dir", str(render_cache))
+    with mock.patch("d2.compile", return_value="<svg/>") as compile_mock:
+        _cached_layout().draw()
+        assert len(list(render_cache.glob("*.svg"))) == 1
+        clear_render_cache()
+        assert _cached_layout().draw() == "<svg/>"
+        assert compile_mock.call_count == 1
+
+
+def test_render_cache_disabled_by_default():
+    """Layouts render on every call unless the cache is enabled."""
+    with mock.patch("d2.compile", return_value="<svg/>") as compile_mock:
+        _cached_layout().draw()
+        _cached_layout().draw()
+        assert compile_mock.call_count == 2
+
+
+def test_layout_lookups_follow_direct_list_changes():
+    """Name indexes stay correct when the public lists are edited directly."""
+    lo = Layout("Test")
+    a, b, c = Node("A"), Node("B"), Node("C")
+    lo.add_node(a)
+    lo.add_node(b)
+    assert lo.get_node("B") is b
+    lo.nodes.append(c)
+    assert lo.get_node("C") is c
+    lo.nodes = [a]
+    with pytest.raises(ValueError, match="Node with name B not found"):
+        lo.get_node("B")
+
+    lo.add_connection({"from": a, "to": c})
+    lo.connections.append({"from": c, "to": a})
+    assert lo.get_connection(from_s="C", to="A")["to"] is a
+    assert lo.get_connection(to="A") == [lo.connections[1]]
+
+
+def test_layout_duplicate_names_and_removal():
+    """First match wins on lookup; removal drops every match."""
+    lo = Layout("Test")
+    first, second, other = Node("X"), Node("X"), Node("Y")
+    for node in (first, second, other):
+        lo.add_node(node)
+    e1 = {"from": first, "to": other, "rate": 1e6}
+    e2 = {"from": other, "to": second}
+    e3 = {"from": other, "to": other}
+    for conn in (e1, e2, e3):
+        lo.add_connection(conn)
+
+    assert lo.get_node("X") is first
+    assert lo.get_connection(from_s="X", to="Y") is e1
+    assert lo.get_connection(from_s="Y") == [e2, e3]
+    assert lo.get_connection(from_s="Y", to="Z") is None
+
+    lo.remove_node("X")
+    assert lo.nodes == [other]
+    assert lo.connections == [e3]
+    assert lo.get_connection(to="X") == []
+    assert lo.get_connection(to="Y") == [e3]
+    lo.remove_node("Y")
+    assert lo.nodes == [] and lo.connections == []
+    assert lo.get_connection(from_s="Y") == []
+
+
+def test_node_child_and_connection_indexes():
+    parent = Node("P")
+    a, b = Node("A"), Node("B")
+    parent.add_child([a, b])
+    parent.add_connection({"from": a, "to": b, "rate": 2e9})
+    assert parent.get_child("B") is b
+    assert parent.get_connection("A", "B")["rate"] == "2.00 GHz"
+
+    parent.update_connection("A", "B", 5e6)
+    assert parent.get_connection("A", "B")["rate"] == "5.00 MHz"
+    parent.remove_connection("A", "B")
+    with pytest.raises(ValueError, match="Connection from A to B not found"):
+        parent.get_connection("A", "B")
+    with pytest.raises(ValueError, match="not found"):
+        parent.update_connection("A", "B", 1)
+
+    parent.add_connection({"from": a, "to": b})
+    parent.remove_child("A")
+    assert parent.connections == []
+    with pytest.raises(ValueError, match="Child with name A not found"):
+        parent.get_child("A")
+    assert parent.get_child("B") is b
+
+
+def test_node_connection_index_after_remove_then_add():
+    """A removal followed by an add must not leave a stale edge table."""
+    parent = Node("P")
+    a, b, c = Node("a"), Node("b"), Node("c")
+    parent.add_connection({"from": a, "to": b})
+    parent.remove_connection("a", "b")
+    parent.add_connection({"from": a, "to": c})
+
+    assert parent.get_connection("a", "c")["to"] is c
+    with pytest.raises(ValueError, match="Connection from a to b not found"):
+        parent.get_connection("a", "b")
+
+    # A removal the index did not see in step still forces a rebuild
+    parent.connections.append({"from": c, "to": a})
+    parent.remove_connection("a", "c")
+    parent.add_connection({"from": b, "to": c})
+    assert parent.get_connection("b", "c")["from"] is b
+    assert parent.get_connection("c", "a")["to"] is a
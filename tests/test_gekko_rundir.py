@@ -0,0 +1,126 @@
+# flake8: noqa
+import gc
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("gekko")
+
+import adijif
+from adijif import gekko_rundir
+
+
+@pytest.fixture
+def run_base(tmp_path):
+    gekko_rundir.set_run_dir_base(str(tmp_path))
+    yield tmp_path
+    gekko_rundir.set_run_dir_base(None)
+
+
+def _write_on_solve(model, name="gk_model.apm"):
+    model.solve = lambda **kwargs: open(
+        os.path.join(model._path, name), "w"
+    ).close()
+
+
+def test_live_models_get_own_run_dirs(run_base):
+    a = gekko_rundir.new_model("topology")
+    b = gekko_rundir.new_model("topology")
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(
+            path=gekko_rundir.new_model("topology")._path
+        )
+    )
+    thread.start()
+    thread.join()
+
+    assert len({a._path, b._path, result["path"]}) == 3
+    assert os.path.basename(a._path).startswith("topology-")
+    assert os.path.commonpath([a._path, str(run_base)]) == str(run_base)
+
+
+def test_solving_one_model_leaves_same_key_model_files(run_base):
+    a = gekko_rundir.new_model("shared")
+    b = gekko_rundir.new_model("shared")
+    _write_on_solve(a)
+    _write_on_solve(b)
+
+    gekko_rundir.solve(a, keep_files=True)
+    gekko_rundir.solve(b)
+
+    assert os.listdir(a._path) == ["gk_model.apm"]
+    assert os.listdir(b._path) == []
+
+
+def test_run_dir_recycled_after_model_collected(run_base):
+    model = gekko_rundir.new_model("recycle")
+    path = model._path
+    open(os.path.join(path, "stale.apm"), "w").close()
+    del model
+    gc.collect()
+
+    reused = gekko_rundir.new_model("recycle")
+    assert reused._path == path
+    assert os.listdir(path) == []
+
+
+def test_kept_run_dir_not_recycled(run_base):
+    model = gekko_rundir.new_model("kept")
+    _write_on_solve(model)
+    gekko_rundir.solve(model, keep_files=True)
+    path = model._path
+    del model
+    gc.collect()
+
+    assert gekko_rundir.new_model("kept")._path != path
+    assert os.listdir(path) == ["gk_model.apm"]
+
+
+def test_run_dir_cleared_when_solve_fails(run_base):
+    model = gekko_rundir.new_model("failing")
+
+    def _fail(**kwargs):
+        with open(os.path.join(model._path, "gk_model.apm"), "w") as fh:
+            fh.write("partial")
+        raise RuntimeError("solver error")
+
+    model.solve = _fail
+    with pytest.raises(RuntimeError):
+        gekko_rundir.solve(model)
+    assert os.path.isdir(model._path)
+    assert os.listdir(model._path) == []
+
+
+def test_keep_files_for_debugging(run_base, capsys):
+    model = gekko_rundir.new_model("debug")
+    _write_on_solve(model)
+
+    gekko_rundir.solve(model, keep_files=True)
+
+    assert os.listdir(model._path) == ["gk_model.apm"]
+    assert model._path in capsys.readouterr().out
+
+
+def test_standalone_clock_solves_in_clean_run_dir(run_base):
+    clk = adijif.hmc7044(solver="gekko")
+    clk.n2 = 24
+    clk.set_requested_clocks(125e6, [1e9, 500e6], ["a", "b"])
+    clk.solve()
+
+    assert clk.model._path.startswith(str(run_base))
+    assert os.listdir(clk.model._path) == []
+
+
+def test_cleanup_removes_process_dirs(run_base):
+    path = gekko_rundir.new_model("cleanup")._path
+    gekko_rundir.cleanup_run_dirs()
+
+    assert not os.path.exists(path)
+    assert gekko_rundir.run_dir_stats()["active"] == 0
+
+
+def test_env_var_selects_base(monkeypatch, tmp_path):
+    monkeypatch.setenv(gekko_rundir.RUN_DIR_ENV, str(tmp_path))
+    assert gekko_rundir.get_run_dir_base() == str(tmp_path)
@@ -103,3 +103,52 @@ def test_system_rejects_unknown_export_format_before_solving():
     fake = object.__new__(System)
     with pytest.raises(ValueError, match="unsupported export format"):
         fake.export_config(format="raw-dict")
+
+
+def test_contract_rejects_non_json_extension_values():
+    system, solution = _fake_system_and_solution()
+    solution["fpga_AD9680"]["handle"] = object()
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        JifDtContract.from_system_solution(system, solution)
+
+
+def test_contract_round_trips_through_dict():
+    system, solution = _fake_system_and_solution()
+    contract = JifDtContract.from_system_solution(system, solution)
+    assert JifDtContract.from_dict(contract.to_dict()) == contract
+    assert json.loads(contract.to_json_line()) == json.loads(contract.to_json())
+    assert contract.to_json_line().count("\n") == 1
+
+
+@pytest.mark.parametrize("filename", ["sweep.jsonl", "sweep.jsonl.gz"])
+def test_streaming_writer_round_trip(tmp_path, filename):
+    from adijif.jif_dt import JifDtWriter, iter_contracts
+
+    system, solution = _fake_system_and_solution()
+    contracts = []
+    path = tmp_path / filename
+    with JifDtWriter(path) as writer:
+        for divider in range(1, 4):
+            solution["clock"]["output_clocks"]["AD9680_ref_clk"]["divider"] = (
+                divider
+            )
+            contract = JifDtContract.from_system_solution(system, solution)
+            contracts.append(contract)
+            writer.write(contract)
+    assert writer.count == 3
+
+    with JifDtWriter(path, append=True) as writer:
+        writer.write(contracts[0])
+
+    reader = iter_contracts(path)
+    assert next(reader) == contracts[0]
+    assert list(reader) == contracts[1:] + contracts[:1]
+
+
+def test_streaming_reader_reports_bad_lines(tmp_path):
+    from adijif.jif_dt import iter_contracts
+
+    path = tmp_path / "bad.jsonl"
+    path.write_text("\n{not json\n")
+    with pytest.raises(ValueError, match="bad.jsonl:2"):
+        list(iter_contracts(path))
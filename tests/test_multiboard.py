@@ -0,0 +1,100 @@
+"""Tests for coordinated multi-board clock solving."""
+
+from fractions import Fraction
+
+import pytest
+
+import adijif
+from adijif.sys.multiboard import MultiBoardSystem, _rational_gcd
+
+
+def ad9680_board(vcxo, sample_clock=1e9, mode="136", bsync=False):
+    """Unit Board with an AD9680 whose SYSREF comes from an ADF4030."""
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", vcxo, solver="CPLEX")
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.converter.sample_clock = sample_clock
+    sys.converter.set_quick_configuration_mode(mode, "jesd204b")
+    sys.add_pll_sysref(
+        "adf4030",
+        vcxo,
+        sys.converter,
+        sys.fpga,
+        bsync_reference=sys.clock if bsync else None,
+    )
+    return sys
+
+
+def _sysref(cfg):
+    pll = cfg["clock_ext_pll_sysref_adf4030"]
+    return pll["output_clocks"]["AD9680_sysref"]["rate"]
+
+
+def test_rational_gcd():
+    rates = [Fraction(31250000), Fraction(7812500), Fraction(15625, 2)]
+    assert _rational_gcd(rates) == Fraction(15625, 2)
+
+
+def test_identical_boards_solve_once():
+    mb = MultiBoardSystem(100_000_000)
+    names = mb.add_boards(24, ad9680_board)
+    assert names[0] == "UnitBoard_0" and mb.boards == names
+    cfg = mb.solve()
+    assert cfg["rounds"] == 1
+    assert cfg["unique_boards"] == 1
+    assert cfg["vcxo"] == 100_000_000
+    assert len(cfg["boards"]) == 24
+    assert {_sysref(c) for c in cfg["boards"].values()} == {cfg["sysref"]}
+    assert cfg["boards"]["UnitBoard_0"] is not cfg["boards"]["UnitBoard_1"]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_boards_are_reconciled_to_common_sysref(processes):
+    # Mode 129 has S=4, so its LMFC is a quarter of mode 136's.
+    mb = MultiBoardSystem(100_000_000, processes=processes)
+    mb.add_boards(4, ad9680_board)
+    mb.add_boards(4, ad9680_board, prefix="Wide", mode="129")
+    cfg = mb.solve()
+    assert cfg["unique_boards"] == 2
+    assert cfg["rounds"] == 2
+    assert cfg["sysref"] == 7812500
+    assert {_sysref(c) for c in cfg["boards"].values()} == {7812500}
+
+
+def test_bsync_rates_are_reconciled():
+    mb = MultiBoardSystem(100_000_000, processes=1)
+    mb.add_board("a", ad9680_board, bsync=True)
+    mb.add_board("b", ad9680_board, mode="129", bsync=True)
+    cfg = mb.solve()
+    assert cfg["sysref"] == cfg["bsync_reference"] == 7812500
+    for board in cfg["boards"].values():
+        rates = board["clock"]["output_clocks"]
+        assert rates["adf4030_bsync_reference"]["rate"] == 7812500
+
+
+def test_next_reference_is_tried():
+    mb = MultiBoardSystem([123_456_789, 100_000_000], processes=1)
+    mb.add_boards(2, ad9680_board)
+    cfg = mb.solve()
+    assert cfg["vcxo"] == 100_000_000
+    assert cfg["rounds"] == 2
+
+
+def test_incompatible_boards_raise():
+    # SYSREF must be LMFC / d**2 on the AD9680, so LMFCs differing by a
+    # factor of two never share a SYSREF rate.
+    mb = MultiBoardSystem(100_000_000, processes=1, max_rounds=4)
+    mb.add_board("fast", ad9680_board)
+    mb.add_board("slow", ad9680_board, sample_clock=500e6)
+    with pytest.raises(Exception, match="within 4 rounds"):
+        mb.solve()
+
+
+def test_invalid_arrays_raise():
+    mb = MultiBoardSystem(100_000_000)
+    with pytest.raises(Exception, match="No boards"):
+        mb.solve()
+    mb.add_board("a", ad9680_board)
+    with pytest.raises(Exception, match="already added"):
+        mb.add_board("a", ad9680_board)
+    with pytest.raises(Exception, match="reference"):
+        MultiBoardSystem([])
@@ -3,7 +3,12 @@
 import pytest
 
 import adijif
-from adijif.optimization import Objective, apply_objectives, collect_objectives
+from adijif.optimization import (
+    Objective,
+    apply_objectives,
+    collect_objectives,
+    solve_staged,
+)
 
 
 @pytest.fixture
@@ -195,3 +200,93 @@ def test_list_expr_creates_one_objective_per_item():
         "fake.batch[1]",
         "fake.batch[2]",
     ]
+
+
+def _two_tier_model():
+    from adijif.solvers import CpoModel, integer_var
+
+    model = CpoModel()
+    x = integer_var(0, 10, name="x")
+    y = integer_var(0, 10, name="y")
+    model.add(x + y >= 10)
+    objectives = [
+        Objective(expr=x + y, sense="min", tier=0),
+        Objective(expr=x, sense="max", tier=3),
+    ]
+    return model, objectives
+
+
+def test_apply_objectives_rejects_unknown_lex_strategy():
+    with pytest.raises(ValueError, match="lex_strategy"):
+        apply_objectives(None, "CPLEX", [], lex_strategy="dynamic")
+
+
+def test_staged_objectives_solve_tier_by_tier():
+    model, objectives = _two_tier_model()
+    stages = apply_objectives(model, "CPLEX", objectives, lex_strategy="staged")
+    assert [(t, s) for t, _, s in stages] == [(0, "min"), (3, "max")]
+    assert model.get_objective() is None
+
+    result, report = solve_staged(model, stages, time_limit=10, Workers=1)
+    assert result["x"] == 10 and result["y"] == 0
+    assert [(r.tier, r.sense, r.value) for r in report] == [
+        (0, "min", 10),
+        (3, "max", 10),
+    ]
+    assert all(r.status == "Optimal" for r in report)
+    # Stages run on a clone, so the model can be solved again
+    assert model.get_objective() is None
+    assert len(model.get_all_expressions()) == 1
+
+    with pytest.raises(ValueError, match="time limits"):
+        solve_staged(model, stages, time_limit=[1])
+
+
+def test_single_tier_ignores_staged_strategy():
+    model, objectives = _two_tier_model()
+    assert (
+        apply_objectives(model, "CPLEX", objectives[:1], lex_strategy="staged")
+        is None
+    )
+    assert model.get_objective() is not None
+
+
+def test_system_staged_matches_static():
+    """Staged and static lex solves agree on a two-tier ADF4382 system."""
+
+    def _solve(strategy):
+        sys = adijif.system(
+            "ad9084_rx", "hmc7044", "xilinx", 125000000, solver="CPLEX"
+        )
+        sys.fpga.setup_by_dev_kit_name("adsy1100")
+        sys.converter.sample_clock = 14e9 / 8
+        sys.converter.datapath.cddc_decimations = [4] * 4
+        sys.converter.datapath.fddc_decimations = [2] * 8
+        sys.converter.datapath.fddc_enabled = [True] * 8
+        sys.converter.clocking_option = "direct"
+        sys.add_pll_inline("adf4382", 125000000, sys.converter)
+        sys.clock.disable_objective("hmc7044.r2_min")
+        mode = adijif.utils.get_jesd_mode_from_params(
+            sys.converter, M=4, L=8, S=1, Np=16, jesd_class="jesd204c"
+        )[0]["mode"]
+        sys.converter.set_quick_configuration_mode(mode, "jesd204c")
+        sys.lex_strategy = strategy
+        sys.lex_stage_time_limit = 30
+        return sys, sys.solve()
+
+    _, static = _solve("static")
+    sys, staged = _solve("staged")
+    key = "clock_ext_pll_adf4382"
+    assert staged[key] == static[key]
+    assert [r.tier for r in sys.lex_stage_report] == [0, 1]
+
+
+def test_lex_stage_report_is_per_system():
+    """Each system owns its stage report and a reset clears it."""
+    first = adijif.system("ad9680", "hmc7044", "xilinx", 125e6)
+    second = adijif.system("ad9680", "hmc7044", "xilinx", 125e6)
+    first.lex_stage_report.append("stage")
+
+    assert second.lex_stage_report == []
+    first._model_reset()
+    assert first.lex_stage_report == []
@@ -0,0 +1,12 @@
+"""Tests for the shared Pareto dominance helper."""
+
+import numpy as np
+
+from adijif.pareto import pareto_mask
+
+
+def test_pareto_mask_keeps_non_dominated_rows():
+    values = np.array([[3, 1], [1, 3], [2, 2], [1, 1], [3, 1]])
+
+    # Equal rows do not dominate each other
+    assert pareto_mask(values).tolist() == [True, True, True, False, True]
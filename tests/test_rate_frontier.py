@@ -0,0 +1,111 @@
+# flake8: noqa
+import pytest
+
+import adijif as jif
+from adijif.utils import find_extreme_rate, find_rate_frontier
+
+CONVERTERS = ["ad9680", "ad9081_rx", "ad9084_rx", "ad9144"]
+
+
+def _zc706():
+    fpga = jif.xilinx()
+    fpga.setup_by_dev_kit_name("zc706")
+    fpga.sys_clk_select = "XCVR_QPLL0"
+    return fpga
+
+
+def _dominates(a, b, objectives):
+    better = False
+    for column, sense in objectives.items():
+        x, y = a[column], b[column]
+        if sense == "min":
+            x, y = -x, -y
+        if x < y:
+            return False
+        better = better or x > y
+    return better
+
+
+@pytest.mark.parametrize("name", CONVERTERS)
+def test_frontier_matches_find_extreme_rate(name):
+    """Each frontier point's sample rate matches the per-mode solver."""
+    conv = getattr(jif, name)()
+    frontier = find_rate_frontier(conv)
+    assert frontier
+    for point in frontier:
+        result = find_extreme_rate(
+            conv,
+            target="sample",
+            mode=point["mode"],
+            jesd_class=point["jesd_class"],
+        )
+        assert point["sample_clock"] == result["sample_clock"]
+        assert point["bit_clock"] == pytest.approx(result["bit_clock"])
+
+
+@pytest.mark.parametrize("name", CONVERTERS)
+def test_frontier_is_not_dominated(name):
+    """No enumerated mode dominates a frontier point, and vice versa."""
+    conv = getattr(jif, name)()
+    objectives = {"sample_clock": "max", "L": "min", "M": "max"}
+    frontier = find_rate_frontier(conv, objectives=objectives)
+    table = conv.quick_configuration_modes
+    for point in frontier:
+        for other in frontier:
+            assert not _dominates(other, point, objectives)
+        for jc, mode in point["modes"]:
+            assert table[jc][mode]["L"] == point["L"]
+            assert table[jc][mode]["M"] == point["M"]
+    # The best sample rate overall is always on the frontier
+    best = find_extreme_rate(conv, target="sample")
+    assert frontier[0]["sample_clock"] == best["sample_clock"]
+
+
+def test_frontier_respects_fpga_limits():
+    """FPGA lane count and QPLL lane-rate cap bound every point."""
+    conv = jif.ad9081_rx()
+    fpga = _zc706()
+    frontier = find_rate_frontier(conv, fpga=fpga)
+    for point in frontier:
+        assert point["L"] <= fpga.max_serdes_lanes
+        assert point["bit_clock"] <= 10.3125e9
+    best = find_extreme_rate(conv, target="sample", fpga=fpga)
+    assert frontier[0]["sample_clock"] == best["sample_clock"]
+
+
+def test_frontier_jesd_class_filter():
+    conv = jif.ad9081_rx()
+    frontier = find_rate_frontier(conv, jesd_class="jesd204b")
+    assert all(jc == "jesd204b" for p in frontier for jc, _ in p["modes"])
+
+
+def test_frontier_invalid_arguments():
+    conv = jif.ad9680()
+    with pytest.raises(ValueError, match="Unknown objective"):
+        find_rate_frontier(conv, objectives={"F": "max"})
+    with pytest.raises(ValueError, match="sense"):
+        find_rate_frontier(conv, objectives={"L": "lowest"})
+    with pytest.raises(ValueError, match="required"):
+        find_rate_frontier(conv, clock=jif.hmc7044(), vcxo=125e6)
+    with pytest.raises(ValueError, match="vcxo is only meaningful"):
+        find_rate_frontier(conv, vcxo=125e6)
+    with pytest.raises(Exception, match="nested"):
+        find_rate_frontier(jif.ad9081())
+
+
+def test_frontier_clock_verification():
+    """Only frontier points are solved through the clock chain."""
+    conv = jif.ad9680()
+    frontier = find_rate_frontier(
+        conv, fpga=_zc706(), clock=jif.hmc7044(), vcxo=125e6
+    )
+    assert frontier
+    verified = [p for p in frontier if p["verified"]]
+    assert verified
+    for point in verified:
+        chain = point["clock_chain"]
+        assert chain["mode"] == point["mode"]
+        assert chain["sample_clock"] <= point["sample_clock"]
+        assert "output_clocks" in chain["clock_config"]
+    # Input converter is not mutated
+    assert conv._sample_clock == 1e9
@@ -0,0 +1,124 @@
+# flake8: noqa
+import pytest
+
+import adijif
+from adijif.utils import plan_datapath_rates
+
+
+def _brute_force(conv, sample_clock, converter_clocks, jesd_class):
+    encoding = "8b10b" if jesd_class == "jesd204b" else "64b66b"
+    ctype = conv.converter_type.lower()
+    if ctype == "adc":
+        coarse_list = conv.datapath.cddc_decimations_available
+        fine_list = conv.datapath.fddc_decimations_available
+    elif hasattr(conv.datapath, "cduc_interpolations_available"):
+        coarse_list = conv.datapath.cduc_interpolations_available
+        fine_list = conv.datapath.fduc_interpolations_available
+    else:
+        coarse_list = conv.datapath.cduc_interpolation_available
+        fine_list = conv.datapath.fduc_interpolation_available
+
+    found = set()
+    for mode, cfg in conv.quick_configuration_modes[jesd_class].items():
+        options = cfg.get("decimations") or [
+            {
+                "coarse": c,
+                "fine": f,
+                "conv_min": -1,
+                "conv_max": -1,
+                "lane_min": -1,
+                "lane_max": -1,
+            }
+            for c in coarse_list
+            for f in fine_list
+        ]
+        for d in options:
+            factor = d["coarse"] * d["fine"]
+            for clk in converter_clocks:
+                if clk != sample_clock * factor:
+                    continue
+                if not (
+                    conv.converter_clock_min <= clk <= conv.converter_clock_max
+                ):
+                    continue
+                if d["conv_min"] > 0 and clk < d["conv_min"] * 1e9:
+                    continue
+                if d["conv_max"] > 0 and clk > d["conv_max"] * 1e9:
+                    continue
+                lane = (
+                    sample_clock
+                    * cfg["M"]
+                    * cfg["Np"]
+                    * conv.encodings_d[encoding]
+                    / (cfg["L"] * conv.encodings_n[encoding])
+                )
+                if not (
+                    conv.bit_clock_min_available[jesd_class]
+                    <= lane
+                    <= conv.bit_clock_max_available[jesd_class]
+                ):
+                    continue
+                if d["lane_min"] > 0 and lane < d["lane_min"] * 1e9:
+                    continue
+                if d["lane_max"] > 0 and lane > d["lane_max"] * 1e9:
+                    continue
+                found.add((clk, mode, d["coarse"], d["fine"], lane))
+    return found
+
+
+@pytest.mark.parametrize(
+    "part, jesd_class",
+    [
+        ("ad9081_rx", "jesd204b"),
+        ("ad9081_rx", "jesd204c"),
+        ("ad9081_tx", "jesd204c"),
+        ("ad9084_rx", "jesd204c"),
+    ],
+)
+def test_plan_matches_brute_force(part, jesd_class):
+    conv = getattr(adijif, part)()
+    clocks = [3e9, 4e9, 6e9, 12e9]
+    plans = plan_datapath_rates(conv, 250e6, clocks, jesd_class=jesd_class)
+
+    got = {
+        (
+            p["converter_clock"],
+            p["mode"],
+            p["coarse"],
+            p["fine"],
+            p["bit_clock"],
+        )
+        for p in plans
+    }
+    assert got == _brute_force(conv, 250e6, clocks, jesd_class)
+    assert len(got) == len(plans)
+    assert got
+
+
+def test_plan_implied_converter_clock_and_ordering():
+    conv = adijif.ad9081_rx()
+    plans = plan_datapath_rates(conv, [250e6, 500e6])
+
+    assert {p["sample_clock"] for p in plans} == {250e6, 500e6}
+    for p in plans:
+        assert p["converter_clock"] == p["sample_clock"] * p["datapath_factor"]
+        assert p["datapath_factor"] == p["coarse"] * p["fine"]
+    keys = [
+        (p["sample_clock"], p["converter_clock"], p["bit_clock"]) for p in plans
+    ]
+    assert keys == sorted(keys)
+
+
+def test_plan_max_lanes_and_state_untouched():
+    conv = adijif.ad9081_rx()
+    before = conv.get_current_jesd_mode_settings()
+    plans = plan_datapath_rates(conv, 250e6, max_lanes=2)
+
+    assert plans
+    assert all(p["L"] <= 2 for p in plans)
+    assert conv.get_current_jesd_mode_settings() == before
+
+
+def test_plan_rejects_nested_converter():
+    with pytest.raises(Exception, match="rx or tx side"):
+        plan_datapath_rates(adijif.ad9081(), 250e6)
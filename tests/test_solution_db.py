@@ -0,0 +1,181 @@
+"""Tests for the local solution database."""
+
+import sqlite3
+
+import pytest
+
+import adijif
+from adijif.solution_db import SolutionDB, describe_system
+
+
+def _daq2(sample_clock=1e9, K=32):
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", 125e6)
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.converter.sample_clock = sample_clock
+    sys.converter.decimation = 1
+    sys.converter.set_quick_configuration_mode(str(0x88))
+    sys.converter.K = K
+    sys.fpga.force_qpll = 1
+    return sys
+
+
+@pytest.fixture
+def solve_calls(monkeypatch):
+    calls = []
+    solve = adijif.system.solve
+
+    def counted(self, *args, **kwargs):
+        calls.append(self)
+        return solve(self, *args, **kwargs)
+
+    monkeypatch.setattr(adijif.system, "solve", counted)
+    return calls
+
+
+def test_description_tracks_private_settings():
+    assert describe_system(_daq2()) == describe_system(_daq2())
+    assert describe_system(_daq2(K=32)) != describe_system(_daq2(K=16))
+
+
+def test_solve_is_stored_and_reused_across_sessions(tmp_path, solve_calls):
+    path = str(tmp_path / "solutions.db")
+    with SolutionDB(path) as db:
+        first = db.solve(_daq2())
+
+    with SolutionDB(path) as db:
+        second = db.solve(_daq2())
+        assert len(db) == 1
+        db.solve(_daq2(), refresh=True)
+
+    assert second == first
+    assert second["clock"]["vcxo"] == 125e6
+    assert len(solve_calls) == 2
+
+
+def test_query_filters_stored_systems():
+    db = SolutionDB()
+    db.solve(_daq2(1e9))
+    db.solve(_daq2(500e6))
+
+    records = db.query(converter="ad9680", dev_kit="ZC706", clock="hmc7044")
+    slow = db.query(converter="AD9680", lane_rate_max=5e9)
+
+    assert len(records) == 2
+    assert [r["converters"][0]["sample_rate"] for r in slow] == [500e6]
+    record = slow[0]
+    assert record["status"] == "solved"
+    assert record["fpga"] == "xilinx"
+    assert record["solver"] == "CPLEX"
+    assert record["solve_time"] > 0
+    assert record["converters"][0]["jesd_mode"] == str(0x88)
+    assert "converter_AD9680" in record["result"]
+    assert db.query(converter="AD9081") == []
+
+
+def test_failures_are_stored_and_raised_again(solve_calls):
+    db = SolutionDB()
+    for _ in range(2):
+        with pytest.raises(Exception, match="."):
+            db.solve(_daq2(5e9))
+
+    (record,) = db.query(status="failed")
+    assert record["error"]
+    assert len(solve_calls) == 1
+
+
+class _StoppedSearch:
+    """CPLEX result of a search stopped before proving infeasibility."""
+
+    def get_solve_status(self):
+        return "Unknown"
+
+
+@pytest.mark.parametrize("interrupted", [True, False])
+def test_transient_failures_are_not_stored(monkeypatch, interrupted):
+    def solve(self, *args, **kwargs):
+        if interrupted:
+            self._solution = _StoppedSearch()
+            raise Exception("No solution found")
+        raise OSError("solver process failed")
+
+    monkeypatch.setattr(adijif.system, "solve", solve)
+    db = SolutionDB()
+    with pytest.raises(Exception, match="No solution found|solver process"):
+        db.solve(_daq2())
+
+    assert len(db) == 0
+
+
+def test_stored_results_are_keyed_by_version(monkeypatch, solve_calls):
+    db = SolutionDB()
+    db.solve(_daq2())
+    monkeypatch.setattr(adijif.solution_db, "__version__", "0.0.0")
+    db.solve(_daq2())
+
+    assert len(db) == 2
+    assert len(solve_calls) == 2
+
+
+def test_converter_filters_match_one_converter():
+    db = SolutionDB()
+    rows = [
+        {
+            "device": "AD9081",
+            "converter": name,
+            "sample_rate": rate,
+            "lane_rate": lane_rate,
+            "jesd_class": "jesd204c",
+            "jesd_mode": mode,
+            "M": 8,
+            "L": 4,
+        }
+        for name, rate, lane_rate, mode in [
+            ("AD9081_RX", 4e9, 24.75e9, "10.0"),
+            ("AD9081_TX", 12e9, 16.5e9, "9"),
+        ]
+    ]
+    db.record(
+        "system",
+        {"example": 1},
+        status="solved",
+        result={},
+        dev_kit="vcu118",
+        converters=rows,
+    )
+
+    assert len(db.query(converter="ad9081", lane_rate_max=16.5e9)) == 1
+    assert len(db.query(converter="AD9081_TX", dev_kit="vcu118")) == 1
+    assert db.query(converter="AD9081_RX", lane_rate_max=16.5e9) == []
+    assert db.query(sample_rate_min=4e9, lane_rate_max=16.5e9, jesd_mode="9")
+    assert db.query(sample_rate_max=4e9, jesd_mode="9") == []
+    assert db.query(converter="AD9081", dev_kit="zcu102") == []
+
+
+def test_rate_utilities_are_cached(monkeypatch):
+    db = SolutionDB()
+    fpga = adijif.xilinx()
+    fpga.setup_by_dev_kit_name("zc706")
+    best = db.find_extreme_rate(adijif.ad9680(), fpga=fpga)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("not cached")
+
+    monkeypatch.setattr(adijif.utils, "find_extreme_rate", fail)
+    assert db.find_extreme_rate(adijif.ad9680(), fpga=fpga) == best
+    rates = db.get_max_sample_rates(adijif.ad9680())
+
+    (record,) = db.query(kind="find_extreme_rate", dev_kit="zc706")
+    assert record["converters"][0]["lane_rate"] == best["bit_clock"]
+    assert len(db.query(kind="get_max_sample_rates")[0]["converters"]) == len(
+        rates
+    )
+
+
+def test_rejects_other_schema_versions(tmp_path):
+    path = str(tmp_path / "solutions.db")
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA user_version = 99")
+    conn.close()
+
+    with pytest.raises(Exception, match="version 99"):
+        SolutionDB(path)
@@ -0,0 +1,62 @@
+# flake8: noqa
+import pytest
+
+import adijif
+from adijif.gekko_trans import SolutionSnapshot
+
+
+def _ad9680_system():
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", 125000000)
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.converter.sample_clock = 1e9 / 2
+    sys.converter.datapath_decimation = 1
+    sys.converter.L = 4
+    sys.converter.M = 2
+    sys.converter.N = 14
+    sys.converter.Np = 16
+    sys.converter.K = 32
+    sys.converter.F = 1
+    sys.converter.HD = 1
+    return sys
+
+
+def test_snapshot_matches_solve_result():
+    sys = _ad9680_system()
+    sys.solve()
+    result = sys._solution
+    snap = SolutionSnapshot(result)
+
+    assert snap.is_solution()
+    assert snap.solve_status == result.get_solve_status()
+    assert snap.get_kpis() == result.get_kpis()
+    for var in result.get_solution().get_all_var_solutions():
+        name = var.get_name()
+        assert snap.get_value(name) == result.get_value(name)
+        assert snap[var.get_expr()] == result[name]
+    for name, value in result.get_kpis().items():
+        assert snap.get_value(name) == value
+
+
+def test_solve_extracts_selected_components_only():
+    full = _ad9680_system().solve()
+    sys = _ad9680_system()
+    cfg = sys.solve(components=["converter", "jesd"])
+
+    assert set(cfg) == {"converter", "converter_AD9680", "jesd_AD9680"}
+    assert cfg["jesd_AD9680"] == full["jesd_AD9680"]
+    assert cfg["converter_AD9680"] == full["converter_AD9680"]
+
+
+def test_fpga_extraction_without_clock_output():
+    full = _ad9680_system().solve()
+    cfg = _ad9680_system().solve(components=["fpga"])
+
+    assert set(cfg) == {"fpga_AD9680"}
+    assert cfg["fpga_AD9680"] == full["fpga_AD9680"]
+
+
+def test_unknown_component_rejected():
+    sys = _ad9680_system()
+    sys.solve()
+    with pytest.raises(Exception, match="Unknown components"):
+        sys._get_configs(["fpgas"])
@@ -0,0 +1,192 @@
+"""Tests for sharded system sweeps."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+import adijif.sweep as sweep
+from adijif.cli import main
+
+BASE = {
+    "conv": "AD9680",
+    "clk": "AD9523_1",
+    "fpga": "XILINX",
+    "vcxo": {"type": "fixed", "value": 125000000},
+    "solver": "CPLEX",
+    "converter_properties": {
+        "sample_clock": 1000000000,
+        "decimation": 1,
+        "L": 4,
+        "M": 2,
+        "N": 14,
+        "Np": 16,
+        "K": 32,
+        "F": 1,
+    },
+    "fpga_properties": {
+        "ref_clock_min": 60000000,
+        "ref_clock_max": 670000000,
+        "out_clk_select": "XCVR_REFCLK",
+    },
+}
+
+
+def _grid():
+    return {
+        "base": BASE,
+        "axes": {
+            "converter_properties.sample_clock": [1000000000, 250000000],
+            "vcxo.value": {
+                "start": 100000000,
+                "stop": 150000000,
+                "step": 25000000,
+            },
+        },
+    }
+
+
+def _fake_solve(config_json):
+    config = json.loads(config_json)
+    rate = config["converter_properties"]["sample_clock"]
+    if rate < 500000000:
+        return {"error": "ADC rate too slow"}
+    return {"status": "solved", "solution": {"vcxo": config["vcxo"]["value"]}}
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("shards", [1, 3, 4, 7])
+def test_shards_partition_grid(shards):
+    grid = _grid()
+    indexes = [
+        index
+        for i in range(1, shards + 1)
+        for index, _ in sweep.iter_points(grid, (i, shards))
+    ]
+
+    assert sweep.grid_size(grid) == 4
+    assert sorted(indexes) == list(range(4))
+
+
+def test_point_config_sets_dotted_paths():
+    point = dict(sweep.iter_points(_grid()))[3]
+    config = sweep.point_config(BASE, point)
+
+    assert point == {
+        "converter_properties.sample_clock": 250000000,
+        "vcxo.value": 125000000,
+    }
+    assert config["converter_properties"]["sample_clock"] == 250000000
+    assert config["converter_properties"]["L"] == 4
+    assert config["vcxo"] == {"type": "fixed", "value": 125000000}
+    assert BASE["vcxo"]["value"] == 125000000
+
+
+@pytest.mark.parametrize("text", ["0/2", "3/2", "1", "a/b"])
+def test_parse_shard_rejects_invalid(text):
+    with pytest.raises(ValueError, match="Shard"):
+        sweep.parse_shard(text)
+
+
+def test_validate_grid_rejects_empty_axis():
+    with pytest.raises(ValueError, match="Axis 'vcxo.value'"):
+        sweep.validate_grid({"base": BASE, "axes": {"vcxo.value": []}})
+
+
+def test_sweep_and_merge_via_cli(tmp_path, monkeypatch):
+    monkeypatch.setattr(sweep, "solve_system", _fake_solve)
+    grid_file = tmp_path / "grid.json"
+    grid_file.write_text(json.dumps(_grid()), encoding="utf-8")
+    runner = CliRunner()
+
+    paths = []
+    for i in (1, 2):
+        path = str(tmp_path / f"shard{i}.jsonl")
+        result = runner.invoke(
+            main,
+            [
+                "--compact",
+                "sweep",
+                str(grid_file),
+                "--shard",
+                f"{i}/2",
+                "--output",
+                path,
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        summary = json.loads(result.output)
+        assert summary["points"] == 2
+        assert summary["solved"] == summary["failed"] == 1
+        paths.append(path)
+
+    merged = str(tmp_path / "merged.jsonl")
+    result = runner.invoke(
+        main, ["--compact", "sweep-merge", *paths, "--output", merged]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["solved"] == 2
+    header, *records = _read(merged)
+    assert header["points"] == 4
+    assert [r["index"] for r in records] == [0, 1, 2, 3]
+    assert records[1]["solution"] == {"vcxo": 125000000}
+    assert records[2]["status"] == "error"
+
+
+def test_merge_detects_tampering_and_missing_shards(tmp_path, monkeypatch):
+    monkeypatch.setattr(sweep, "solve_system", _fake_solve)
+    paths = [str(tmp_path / f"shard{i}.jsonl") for i in (1, 2)]
+    for i, path in enumerate(paths, start=1):
+        sweep.run_shard(_grid(), path, (i, 2))
+
+    with pytest.raises(ValueError, match="shards 1..2"):
+        sweep.merge_shards(paths[:1])
+    with pytest.raises(ValueError, match="shards 1..2"):
+        sweep.merge_shards([paths[0], paths[0]])
+
+    lines = open(paths[1], encoding="utf-8").read().splitlines()
+    lines[1] = lines[1].replace("125000000", "125000001")
+    with open(paths[1], "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    result = CliRunner().invoke(main, ["--compact", "sweep-merge", *paths])
+
+    assert result.exit_code == 1
+    assert "Checksum mismatch" in json.loads(result.output)["error"]
+
+
+def test_merge_rejects_shards_of_different_grids(tmp_path, monkeypatch):
+    monkeypatch.setattr(sweep, "solve_system", _fake_solve)
+    other = _grid()
+    other["base"] = dict(BASE, solver="gekko")
+    first, second = str(tmp_path / "a.jsonl"), str(tmp_path / "b.jsonl")
+    sweep.run_shard(_grid(), first, (1, 2))
+    sweep.run_shard(other, second, (2, 2))
+
+    with pytest.raises(ValueError, match="different sweeps"):
+        sweep.merge_shards([first, second])
+
+
+def test_sweep_solves_real_systems_in_parallel(tmp_path):
+    grid = _grid()
+    grid["axes"]["vcxo.value"] = [125000000]
+    output = str(tmp_path / "sweep.jsonl")
+
+    summary = sweep.run_shard(grid, output, jobs=2)
+
+    assert summary == {
+        "output": output,
+        "grid": sweep.grid_hash(grid),
+        "shard": "1/1",
+        "points": 2,
+        "solved": 1,
+        "failed": 1,
+    }
+    _, solved, failed = _read(output)
+    assert solved["status"] == "solved"
+    assert solved["solution"]["clock"]["vcxo"] == 125000000
+    assert "too slow" in failed["error"]
@@ -519,3 +519,43 @@ def test_solve_after_manual_initialize_does_not_double_init():
 
     rate = cfg["clock"]["output_clocks"]["zc706_AD9680_ref_clk"]["rate"]
     assert 250e6 <= rate <= 350e6
+
+
+def test_abort_solve_stops_running_search(monkeypatch):
+    """abort_solve from another thread interrupts do_solve."""
+    import importlib
+    import threading
+
+    system_module = importlib.import_module("adijif.system")
+
+    sys = _build_daq2_system()
+    assert sys.abort_solve() is False
+    sys.initialize()
+    created = threading.Event()
+    requested = threading.Event()
+    aborted = []
+    solver_created = system_module._TrackSolver.solver_created
+
+    def track(listener, solver):
+        solver_created(listener, solver)
+        created.set()
+        # Hold the solve until the other thread has asked it to stop
+        assert requested.wait(timeout=30)
+
+    def abort():
+        assert created.wait(timeout=30)
+        aborted.append(sys.abort_solve())
+        requested.set()
+
+    monkeypatch.setattr(system_module._TrackSolver, "solver_created", track)
+    aborter = threading.Thread(target=abort)
+    aborter.start()
+    try:
+        sys.do_solve()
+    except Exception as e:
+        assert "No solution found" in str(e)
+    finally:
+        requested.set()
+        aborter.join()
+    assert aborted == [True]
+    assert sys.abort_solve() is False
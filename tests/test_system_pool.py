@@ -0,0 +1,132 @@
+"""Tests for the bounded system pool used by agent servers."""
+
+import json
+
+import pytest
+
+import adijif
+import adijif.agent_api as agent_api
+from adijif.sys.pool import SystemPool
+
+AD9680_REQUEST = {
+    "conv": "AD9680",
+    "clk": "AD9523_1",
+    "fpga": "XILINX",
+    "vcxo": {"type": "fixed", "value": 125000000},
+    "converter_properties": {
+        "sample_clock": 1000000000,
+        "decimation": 1,
+        "L": 4,
+        "M": 2,
+        "N": 14,
+        "Np": 16,
+        "K": 32,
+        "F": 1,
+    },
+    "fpga_properties": {
+        "ref_clock_min": 60000000,
+        "ref_clock_max": 670000000,
+        "out_clk_select": "XCVR_REFCLK",
+    },
+}
+
+
+def _configure(sys):
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.converter.sample_clock = 1e9 / 2
+    sys.converter.datapath_decimation = 1
+    sys.converter.L = 4
+    sys.converter.M = 2
+    sys.converter.N = 14
+    sys.converter.Np = 16
+    sys.converter.K = 32
+    sys.converter.F = 1
+    sys.converter.HD = 1
+
+
+def test_released_system_is_reset_and_reused():
+    pool = SystemPool(max_size=2)
+    with pool.checkout("ad9680", "hmc7044", "xilinx", 125e6) as sys:
+        first = sys
+        _configure(sys)
+        sys.clock.n2 = 24
+        sys.use_common_sysref = True
+        sys.add_objective(1, name="user.constant")
+        cfg = sys.solve()
+        assert cfg["clock"]["n2"] == 24
+
+    with pool.checkout("AD9680", "HMC7044", "xilinx", 100e6) as sys:
+        assert sys is first
+        assert sys.vcxo == 100e6
+        assert not sys._initialized
+        assert sys._user_objectives == []
+        assert sys.use_common_sysref is False
+        fresh = adijif.ad9680()
+        assert (
+            sys.converter.get_current_jesd_mode_settings()
+            == fresh.get_current_jesd_mode_settings()
+        )
+        assert sys.clock.model is sys.model
+        assert len(sys.clock.n2_available) > 1
+        _configure(sys)
+        sys.vcxo = 125e6
+        assert sys.solve()["clock"]["output_clocks"]
+
+    stats = pool.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["idle"] == 1
+    assert stats["in_use"] == 0
+    assert stats["high_water"] == 1
+
+
+def test_pool_bounds_idle_systems():
+    pool = SystemPool(max_size=1)
+    a = pool.acquire("ad9680", "hmc7044", "xilinx", 125e6)
+    b = pool.acquire("ad9680", "hmc7044", "xilinx", 125e6)
+    assert a is not b
+    pool.release(a)
+    pool.release(b)
+
+    stats = pool.stats()
+    assert stats["idle"] == 1
+    assert stats["evictions"] == 1
+    assert stats["high_water"] == 2
+
+
+def test_pool_evicts_idle_systems(monkeypatch):
+    pool = SystemPool(max_size=4, max_idle=10.0)
+    now = [1000.0]
+    monkeypatch.setattr("adijif.sys.pool.time.monotonic", lambda: now[0])
+    with pool.checkout("ad9680", "hmc7044", "xilinx", 125e6):
+        pass
+    now[0] += 11.0
+    with pool.checkout("ad9680", "hmc7044", "xilinx", 125e6):
+        pass
+
+    stats = pool.stats()
+    assert stats["evictions"] == 1
+    assert stats["misses"] == 2
+
+
+def test_release_rejects_foreign_system():
+    pool = SystemPool()
+    with pytest.raises(Exception, match="not checked out"):
+        pool.release(object())
+
+
+def test_agent_solve_system_reuses_pooled_system():
+    pool = agent_api.configure_system_pool(max_size=2)
+    assert isinstance(pool, SystemPool)
+    try:
+        first = agent_api.solve_system(json.dumps(AD9680_REQUEST))
+        second = agent_api.solve_system(json.dumps(AD9680_REQUEST))
+        stats = agent_api.system_pool_stats()
+    finally:
+        agent_api.configure_system_pool(0)
+
+    assert first["status"] == "solved"
+    assert second["solution"] == first["solution"]
+    assert stats["enabled"] and stats["hits"] == 1
+    assert stats["peak_rss_bytes"] is None or stats["peak_rss_bytes"] > 0
+    assert agent_api.system_pool_stats() == {"enabled": False}
@@ -101,3 +101,110 @@ def test_determine_qpll_gty4_full_rate():
     # Assert
     assert res["type"] == "QPLL"
     assert res["qty4_full_rate"] == 1
+
+
+def _scalar_or_none(method, bit_clock, ref):
+    try:
+        return method(bit_clock, ref)
+    except Exception:
+        return None
+
+
+@pytest.mark.parametrize("transceiver", ["GTX2", "GTY4"])
+def test_batch_methods_match_scalar_first_result(transceiver):
+    """Batched PLL search must agree with the scalar search for every pair."""
+    bf = MockXilinxBF()
+    bf.transciever_type = transceiver
+    rates = [2500000000, 3125000000, 6250000000, 8000000000, 16000000000]
+    refs = [50000000, 100000000, 125000000, 156250000, 250000000, 312500000]
+
+    for batch, scalar in [
+        (bf.determine_cpll_batch, bf.determine_cpll),
+        (bf.determine_qpll_batch, bf.determine_qpll),
+    ]:
+        configs = batch(rates, refs)
+        for rate in rates:
+            for ref in refs:
+                found = [
+                    c
+                    for c in configs
+                    if c["bit_clock"] == rate and c["fpga_ref_clock"] == ref
+                ]
+                expected = _scalar_or_none(scalar, rate, ref)
+                if expected is None:
+                    assert not found
+                    continue
+                first = dict(found[0])
+                del first["bit_clock"], first["fpga_ref_clock"]
+                assert first == expected
+
+
+def test_batch_returns_every_valid_configuration():
+    """All configurations are returned, not just the first match."""
+    bf = MockXilinxBF()
+    configs = bf.determine_cpll_batch(2500000000, [125000000])
+    # 125 MHz * 5 * 4 and 125 MHz * 4 * 5 both reach 2.5 GHz with D=2
+    assert len(configs) >= 2
+    for c in configs:
+        assert c["vco"] == 125000000 * c["n1"] * c["n2"] / c["m"]
+        assert c["vco"] * 2 / c["d"] == 2500000000
+
+
+def test_batch_qpll_skips_out_of_range_references():
+    """References outside the valid range yield no QPLL configurations."""
+    bf = MockXilinxBF()
+    assert bf.determine_qpll_batch([8000000000], [10000000]) == []
+
+
+def test_batch_rejects_fractional_lane_rates():
+    """Lane rates are not truncated to integers before the search."""
+    bf = MockXilinxBF()
+    with pytest.raises(ValueError, match="bit_clocks must be integer valued"):
+        bf.determine_cpll_batch(2500000000.5, [125000000])
+    with pytest.raises(ValueError, match="fpga_ref_clocks must be integer"):
+        bf.determine_qpll_batch(2500000000, [125000000.5])
+
+
+def test_determine_clocks_skips_fractional_lane_rate():
+    """A lane rate the exact search cannot express has no PLL setting."""
+    import adijif
+
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", 125e6)
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.converter.sample_clock = 1e9 / 3
+    sys.converter.decimation = 1
+    sys.converter.set_quick_configuration_mode(str(0x88))
+    assert not float(sys.converter.bit_clock).is_integer()
+
+    with pytest.raises(Exception, match="No valid configurations possible"):
+        sys.determine_clocks()
+
+
+def test_determine_pll_batch_prefers_cpll():
+    """Batched determine_pll picks CPLL first and falls back to QPLL."""
+    import adijif
+
+    fpga = adijif.xilinx()
+    for attr in (
+        "vco_min",
+        "vco_max",
+        "ref_clock_min",
+        "ref_clock_max",
+        "vco0_min",
+        "vco0_max",
+        "vco1_min",
+        "vco1_max",
+        "N",
+    ):
+        setattr(fpga, attr, getattr(MockXilinxBF, attr))
+
+    selected = fpga.determine_pll_batch(
+        [2500000000, 10000000000], [125000000, 250000000]
+    )
+    assert selected[(2500000000, 125000000)]["type"] == "CPLL"
+    assert selected[(10000000000, 250000000)]["type"] == "QPLL"
+    for (rate, ref), info in selected.items():
+        expected = fpga.determine_pll(rate, ref)
+        info = dict(info)
+        del info["bit_clock"], info["fpga_ref_clock"]
+        assert info == expected
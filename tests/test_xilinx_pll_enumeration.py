@@ -0,0 +1,164 @@
+"""Tests for exact enumeration of Xilinx transceiver PLL settings."""
+
+import contextlib
+import io
+
+import pytest
+
+import adijif
+from adijif.fpgas.xilinx.sevenseries import SevenSeries
+from adijif.fpgas.xilinx.ultrascaleplus import UltraScalePlus
+from adijif.fpgas.xilinx.versal import Versal
+
+REF = 100000000
+SETTING_KEYS = ("type", "m", "d", "n", "n1", "n2", "clkout_rate")
+
+
+def _plls(family, force=None):
+    if family == "7s":
+        plls = SevenSeries(transceiver_type="GTXE2", solver="CPLEX")
+    elif family == "us":
+        plls = UltraScalePlus(transceiver_type="GTYE4", solver="CPLEX")
+        plls.plls["QPLL"].force_integer_mode = True
+        plls.plls["QPLL1"].force_integer_mode = True
+    else:
+        plls = Versal(transceiver_type="GTYE5", solver="CPLEX")
+        plls.plls["RPLL"].force_integer_mode = True
+        plls.plls["LCPLL"].force_integer_mode = True
+    if force:
+        setattr(plls, "force_" + force, True)
+    return plls
+
+
+def _cp_setting(plls, lane_rate):
+    cnv = adijif.ad9680()
+    cnv.sample_clock = lane_rate * cnv.L / (cnv.Np * cnv.M * 10 / 8)
+    assert cnv.bit_clock == lane_rate
+    config = plls.add_constraints({}, REF, cnv)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            plls.solve()
+    except Exception:
+        return None
+    cfg = plls.get_config(config, cnv, REF)
+    return {k: cfg[k] for k in SETTING_KEYS if k in cfg}
+
+
+@pytest.mark.parametrize(
+    "family, force, lane_rates",
+    [
+        ("7s", None, [0.5e9, 6e9, 9e9, 10e9, 12.5e9]),
+        ("7s", "qpll", [6e9, 10e9]),
+        ("us", None, [0.5e9, 9e9, 14e9, 32e9]),
+        ("us", "qpll1", [10e9, 14e9]),
+        ("versal", None, [0.5e9, 5e9, 10e9, 24e9]),
+        ("versal", "rpll", [5e9, 24e9]),
+    ],
+)
+def test_enumeration_matches_solver(family, force, lane_rates):
+    for lane_rate in lane_rates:
+        found = _plls(family, force).enumerate_plls(lane_rate, REF)
+        settings = [
+            {k: c[k] for k in SETTING_KEYS if k in c}
+            for c in found
+            if c["bit_clock"] == lane_rate
+        ]
+        expected = _cp_setting(_plls(family, force), lane_rate)
+
+        if expected is None:
+            assert settings == [], lane_rate
+        else:
+            assert expected in settings, lane_rate
+        if force:
+            assert {s["type"] for s in settings} <= {force}
+
+
+def test_enumerated_settings_are_valid():
+    plls = _plls("us")
+    found = plls.enumerate_plls([10e9, 25.78125e9], [100e6, 156.25e6])
+
+    assert found
+    for c in found:
+        pll = plls.plls[c["type"].upper()]
+        m_clk = c["m"] * c.get("clkout_rate", 1)
+        vco = c["fpga_ref_clock"] * c.get("n", 1) * c.get("n1", 1)
+        vco = vco * c.get("n2", 1) / m_clk
+        assert vco * 2 / c["d"] == c["bit_clock"]
+        assert c["vco"] == vco
+        assert pll.vco_min <= vco <= pll.vco_max
+
+
+def test_gtx_qpll_lower_band_excludes_d16():
+    plls = _plls("7s", "qpll")
+    plls.plls["QPLL"].D = 16
+
+    # VCO 6.4 GHz is only in the lower band, which does not allow D=16
+    assert plls.enumerate_plls(400e6, 80e6) == []
+    assert plls.enumerate_plls(625e6, 125e6)[0]["vco"] == 10e9
+
+
+def test_selections_and_speed_grade_are_honoured():
+    plls = _plls("7s", "qpll")
+    assert plls.enumerate_plls(12.5e9, 125e6) == []
+
+    plls = SevenSeries(transceiver_type="GTXE2", speed_grade="-3")
+    plls.force_qpll = True
+    assert plls.enumerate_plls(12.5e9, 125e6)
+
+    plls.plls["QPLL"].N = [66]
+    assert {c["n"] for c in plls.enumerate_plls(6.6e9, [100e6, 125e6])} == {66}
+
+
+def test_fractional_plls_are_not_enumerated():
+    plls = Versal(transceiver_type="GTYE5")
+
+    with pytest.raises(Exception, match="fractional-N"):
+        plls.plls["RPLL"].enumerate_settings(10e9, REF)
+    assert plls.ref_clock_candidates(10e9) is None
+    plls.plls["RPLL"].force_integer_mode = True
+    plls.force_rpll = True
+    assert 125e6 in plls.ref_clock_candidates(10e9, 60e6, 820e6)
+    assert REF not in plls.ref_clock_candidates(10e9, 60e6, 820e6)
+
+
+def _unconstrained_daq2(prefilter=True):
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", 125e6)
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.fpga.ref_clock_constraint = "Unconstrained"
+    sys.fpga.prefilter_ref_clocks = prefilter
+    sys.converter.sample_clock = 1e9
+    sys.converter.decimation = 1
+    sys.converter.set_quick_configuration_mode(str(0x88))
+    sys.converter.K = 32
+    return sys
+
+
+def test_system_reference_is_prefiltered():
+    sys = _unconstrained_daq2()
+    cfg = sys.solve()
+    refs = SevenSeries(transceiver_type="GTXE2").ref_clock_candidates(
+        10e9, sys.fpga.ref_clock_min, sys.fpga.ref_clock_max
+    )
+
+    assert cfg == _unconstrained_daq2(prefilter=False).solve()
+    ref = cfg["clock"]["output_clocks"]["zc706_AD9680_ref_clk"]["rate"]
+    assert ref in refs
+    names = [v.get_name() for v in sys.model.get_all_variables()]
+    assert "AD9680_fpga_ref_candidate" in names
+
+
+def test_system_rejects_lane_rate_without_pll_setting():
+    sys = _unconstrained_daq2()
+    sys.fpga.force_qpll = 1
+    sys.converter.sample_clock = 900e6
+
+    with pytest.raises(Exception, match="No solution found: no GTXE2 PLL"):
+        sys.solve()
+
+
+def test_pll_without_enumeration_support_raises():
+    from adijif.fpgas.xilinx.pll import PLLCommon
+
+    pll = PLLCommon(SevenSeries(transceiver_type="GTXE2"))
+    with pytest.raises(NotImplementedError, match="PLLCommon"):
+        pll.enumerate_settings(10e9, REF)
@@ -17,6 +17,9 @@ app_file_path = app_path / "main.py"
 sys.path.append(str(app_path))
 
 _APP_TIMEOUT = 30
+# Rendering the system scope of a 512-device array takes several seconds on
+# its own and can exceed _APP_TIMEOUT when tests run in parallel.
+_SYSTEM_SCOPE_TIMEOUT = 120
 
 
 def _new_app():
@@ -43,3 +46,23 @@ def test_adf4030_system_designer_renders(arch: str) -> None:
     else:
         raise AssertionError("architecture selectbox not found")
     assert not at.exception
+
+
+def test_adf4030_system_designer_summarizes_system_scope() -> None:
+    at = _navigate(_new_app())
+    # Batch widget changes: every run redraws the 512-device diagram
+    at.number_input(key="adf4030_N").set_value(512)
+    at.radio(key="adf4030_scope").set_value("system")
+    at.run(timeout=_SYSTEM_SCOPE_TIMEOUT)
+    at.radio(key="adf4030_detail").set_value("summary")
+    at.multiselect(key="adf4030_expand").set_value([0, 3])
+    at.run(timeout=_SYSTEM_SCOPE_TIMEOUT)
+    assert not at.exception
+    assert at.multiselect(key="adf4030_expand").value == [0, 3]
+
+
+def test_adf4030_system_designer_lists_pareto_architectures() -> None:
+    at = _navigate(_new_app())
+    assert not at.exception
+    assert any(s.value == "Pareto-optimal architectures" for s in at.subheader)
+    assert len(at.table) == 1
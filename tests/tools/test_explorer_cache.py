@@ -0,0 +1,93 @@
+"""Tests for the Explorer converter and JESD mode caches."""
+
+import adijif
+from adijif.tools.explorer.src.pages.helpers import cache
+from adijif.tools.explorer.src.pages.helpers.jesd import (
+    get_jesd_controls,
+    get_valid_jesd_modes,
+)
+
+
+def test_converter_template_is_shared_and_clones_are_independent():
+    """Pages get private converters built from one cached template."""
+    template = cache.converter_template("ad9084_rx")
+    assert cache.converter_template("ad9084_rx") is template
+
+    first = cache.get_converter("ad9084_rx")
+    second = cache.get_converter("ad9084_rx")
+    assert first is not template and second is not first
+    first.sample_clock = 1.5e9
+    first.datapath.cddc_decimations = [2] * len(first.datapath.cddc_decimations)
+    assert second.sample_clock == template.sample_clock
+    assert second.datapath.cddc_decimations == (
+        template.datapath.cddc_decimations
+    )
+
+
+def test_supported_converter_parts():
+    parts = cache.supported_converter_parts()
+    assert "ad9084_rx" in parts
+    assert "ad9680" in parts
+    assert cache.supported_converter_parts() == parts
+
+
+def test_jesd_controls_match_uncached_helper():
+    options, modes = cache.jesd_controls("ad9081_rx")
+    expected_options, expected_modes = get_jesd_controls(adijif.ad9081_rx())
+    assert modes == expected_modes
+    assert {k: sorted(v) for k, v in options.items()} == {
+        k: sorted(v) for k, v in expected_options.items()
+    }
+    assert cache.jesd_controls("ad9081_rx")[1] is modes
+
+
+def test_valid_jesd_modes_match_uncached_helper():
+    """Cached mode tables equal a fresh evaluation and track datapath."""
+    converter = cache.get_converter("ad9680")
+    converter.sample_clock = 500e6
+    selections = {"L": [2, 4]}
+
+    rows, found = cache.valid_jesd_modes(converter, "ad9680", selections)
+    fresh = adijif.ad9680()
+    fresh.sample_clock = 500e6
+    _, modes = get_jesd_controls(fresh)
+    expected_rows, expected_found = get_valid_jesd_modes(
+        fresh, modes, selections
+    )
+    assert rows == expected_rows
+    assert found == expected_found
+    assert converter.sample_clock == 500e6
+
+    converter.sample_clock = 1e9
+    faster, _ = cache.valid_jesd_modes(converter, "ad9680", selections)
+    assert [r["Sample Rate (MSPS)"] for r in faster] == [1000.0] * len(faster)
+
+
+def test_datapath_key_changes_with_settings():
+    converter = cache.get_converter("ad9081_rx")
+    before = cache._datapath_key(converter)
+    converter.datapath.cddc_decimations = [4] * len(
+        converter.datapath.cddc_decimations
+    )
+    assert cache._datapath_key(converter) != before
+
+
+def test_valid_jesd_modes_track_decimation_without_datapath():
+    """Parts without a datapath key on their decimation setting."""
+    converter = cache.get_converter("ad9680")
+    converter.sample_clock = 1e9
+    selections = {"L": [4]}
+    cache.valid_jesd_modes(converter, "ad9680", selections)
+
+    converter.decimation = 2
+    rows, found = cache.valid_jesd_modes(converter, "ad9680", selections)
+
+    fresh = adijif.ad9680()
+    fresh.sample_clock = 1e9
+    fresh.decimation = 2
+    _, modes = get_jesd_controls(fresh)
+    expected_rows, expected_found = get_valid_jesd_modes(
+        fresh, modes, selections
+    )
+    assert rows == expected_rows
+    assert found == expected_found
@@ -0,0 +1,106 @@
+"""Tests for System Configurator background solve jobs."""
+
+import threading
+
+import adijif
+from adijif.tools.explorer.src.pages.helpers.solve_jobs import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    SolveJobManager,
+    system_fingerprint,
+)
+
+
+class _FakeSystem:
+    """Stand-in system whose solve blocks until released or aborted."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.release = threading.Event()
+        self.solves = 0
+
+    def do_solve(self) -> dict:
+        self.solves += 1
+        self.release.wait(10)
+        if self.fail:
+            raise Exception("No solution found")
+        return {"clock": {}}
+
+    def draw(self, cfg: dict, theme: str) -> str:
+        return f"diagram-{theme}"
+
+    def abort_solve(self) -> bool:
+        self.release.set()
+        return True
+
+
+def _daq2(sample_clock: float = 1e9) -> adijif.system:
+    sys = adijif.system("ad9680", "hmc7044", "xilinx", 125e6)
+    sys.fpga.setup_by_dev_kit_name("zc706")
+    sys.converter.sample_clock = sample_clock
+    sys.initialize()
+    return sys
+
+
+def test_fingerprint_tracks_configuration():
+    base = system_fingerprint(_daq2(), "light")
+    assert system_fingerprint(_daq2(), "light") == base
+    assert system_fingerprint(_daq2(), "dark") != base
+    assert system_fingerprint(_daq2(500e6), "light") != base
+
+
+def test_job_solves_draws_and_is_reused():
+    manager = SolveJobManager(max_workers=1)
+    sys = _FakeSystem()
+    job = manager.submit("a", sys, "light")
+    assert job.running
+    assert manager.submit("a", _FakeSystem(), "light") is job
+    sys.release.set()
+    assert job.wait(10)
+    assert job.stage == DONE
+    assert job.config == {"clock": {}}
+    assert job.diagram == "diagram-light"
+    assert manager.submit("a", _FakeSystem(), "light") is job
+    assert sys.solves == 1
+
+
+def test_failed_job_is_kept():
+    manager = SolveJobManager(max_workers=1)
+    sys = _FakeSystem(fail=True)
+    sys.release.set()
+    job = manager.submit("a", sys, "light")
+    assert job.wait(10)
+    assert job.stage == FAILED
+    assert "No solution found" in job.error
+    assert manager.submit("a", _FakeSystem(), "light") is job
+
+
+def test_cancel_aborts_and_retry_replaces_job():
+    manager = SolveJobManager(max_workers=1)
+    job = manager.submit("a", _FakeSystem(), "light")
+    job.cancel()
+    assert job.stage == CANCELLED
+    assert job.wait(0)
+    assert job.config is None
+    assert manager.submit("a", _FakeSystem(), "light") is job
+
+    sys = _FakeSystem()
+    sys.release.set()
+    retried = manager.submit("a", sys, "light", retry=True)
+    assert retried is not job
+    assert retried.wait(10)
+    assert retried.stage == DONE
+
+
+def test_oldest_jobs_are_evicted_and_cancelled():
+    manager = SolveJobManager(max_workers=1, max_jobs=2)
+    first = manager.submit("a", _FakeSystem(), "light")
+    manager.submit("b", _FakeSystem(), "light")
+    manager.submit("c", _FakeSystem(), "light")
+    assert manager.get("a") is None
+    assert first.stage == CANCELLED
+    for key in ("b", "c"):
+        job = manager.get(key)
+        job.sys.release.set()
+        assert job.wait(10)